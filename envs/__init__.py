@@ -1,9 +1,13 @@
+import gym
+
 from gym.envs.registration import register
 
 from envs.cliff import *
 from envs.lava  import *
 from envs.maze  import *
 
+from envs.collections.vector_grid import VectorGridEnv
+
 
 # Constants for the environment names.
 SMALL_MAZE          = "SmallMaze-v0"
@@ -16,6 +20,13 @@ BIGGER_LAVA_FLOOR   = "BiggerLavaFloor-v0"
 HUGE_LAVA_FLOOR     = "HugeLavaFloor-v0"
 CLIFF               = "Cliff-v0"
 
+# Constants for the parameterised environment names, e.g. `gym.make(RANDOM_MAZE, rows = 1001, cols = 1001, seed = 0)`.
+RANDOM_MAZE       = "RandomMaze-v0"
+MAZE_MAP          = "MazeMap-v0"
+RANDOM_LAVA_FLOOR = "RandomLavaFloor-v0"
+LAVA_FLOOR_MAP    = "LavaFloorMap-v0"
+SCALED_CLIFF      = "ScaledCliff-v0"
+
 
 # Maze environments.
 register(
@@ -30,6 +41,14 @@ register(
     id          = BLOCKED_MAZE,
     entry_point = "envs:BlockedMazeEnv"
 )
+register(
+    id          = RANDOM_MAZE,
+    entry_point = "envs:RandomMazeEnv"
+)
+register(
+    id          = MAZE_MAP,
+    entry_point = "envs:MazeMapEnv"
+)
 
 
 # Lava environments.
@@ -53,6 +72,14 @@ register(
     id          = HUGE_LAVA_FLOOR,
     entry_point = "envs:HugeLavaFloorEnv"
 )
+register(
+    id          = RANDOM_LAVA_FLOOR,
+    entry_point = "envs:RandomLavaFloorEnv"
+)
+register(
+    id          = LAVA_FLOOR_MAP,
+    entry_point = "envs:LavaFloorMapEnv"
+)
 
 
 # Cliff environments.
@@ -60,3 +87,26 @@ register(
     id          = CLIFF,
     entry_point = "envs:CliffEnv"
 )
+register(
+    id          = SCALED_CLIFF,
+    entry_point = "envs:ScaledCliffEnv"
+)
+
+
+def make_fast(name, **kwargs):
+    """
+    Create a registered environment without any of the wrappers added by `gym.make`.
+
+    Newer gym releases wrap every environment in checker, order-enforcing and time-limit wrappers, which add a few
+    attribute lookups and checks to every `reset` and `step`. The raw environment exposes the same interface and
+    the model arrays (e.g. `T_indices`, `R_data`) directly.
+
+    Args:
+        name (str): The id of the registered environment.
+        **kwargs: The arguments of the environment constructor (e.g. `rows`, `cols`, `seed`).
+
+    Returns:
+        GridEnv: The unwrapped environment.
+
+    """
+    return gym.make(name, **kwargs).unwrapped
@@ -1,15 +1,11 @@
-from envs.collections.grid import GridEnv
+from envs.collections.generator import cliff_grid
+from envs.collections.grid      import GridEnv
 
 
 class CliffEnv(GridEnv):
 
     def __init__(self):
-        grid = [
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],
-            ["S", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "G"]
-        ]
+        grid = self.build_grid()
 
         rewards = {
             "S": -1.0,
@@ -39,36 +35,61 @@ class CliffEnv(GridEnv):
         super().__init__(grid, rewards, actions, dynamics, terminals)
 
 
-    def step(self, action):
+    def build_grid(self):
         """
-        Perform a single step in the environment based on the given action.
+        Build the grid of the cliff walk.
+
+        Returns:
+            list of list: The grid of cell types.
+
+        """
+        return [
+            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],
+            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],
+            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],
+            ["S", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "G"]
+        ]
 
-        Args:
-            action (signedinteger): The intex of the action to be taken.
+
+    def build_landing(self):
+        """
+        Build the state where the agent lands after moving to each state.
+
+        Falling from the cliff brings the agent back to the start.
 
         Returns:
-            tuple: A tuple containing:
-                - int: The next state after taking the action;
-                - float: The reward received after taking the action;
-                - bool: Whether the episode has terminated;
-                - bool: Whether the episode has been truncated (always `False` in this implementation);
-                - dict: Additional information (empty dictionary in this implementation).
+            numpy.ndarray: The landing state of each state.
 
         """
-        if self.terminated:
-            return None
+        landing = super().build_landing()
+
+        landing[self.cells_mask("C")] = self.strt_state
 
-        next_state = self.sample(self.curr_state, action)
-        reward     = self.R[self.curr_state, action, next_state]
+        return landing
 
-        if self.grid[next_state] == "C":
-            next_state = self.strt_state
 
-        self.curr_state = next_state
+class ScaledCliffEnv(CliffEnv):
 
-        terminated = self.is_terminal(self.curr_state)
-        truncated  = False
+    def __init__(self, rows = 4, cols = 12):
+        """
+        Initialize a cliff walk of the given size.
+
+        Args:
+            rows (int, optional): The number of rows of the grid. Defaults to 4.
+            cols (int, optional): The number of columns of the grid. Defaults to 12.
 
-        self.terminated = terminated
+        """
+        self.grid_size = (rows, cols)
 
-        return next_state, reward, terminated, truncated, {}
+        super().__init__()
+
+
+    def build_grid(self):
+        """
+        Build the grid of the cliff walk, the cliff spanning the bottom row between the start and the goal.
+
+        Returns:
+            numpy.ndarray: The grid of cell types.
+
+        """
+        return cliff_grid(*self.grid_size)
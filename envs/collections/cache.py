@@ -0,0 +1,127 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+
+
+# Version of the compiled model layout, part of every key so that stale caches are never reopened.
+CACHE_VERSION = 5
+
+# Environment variable holding the directory of the compiled environments cache.
+CACHE_VARIABLE = "GRID_ENV_CACHE"
+
+
+def cache_directory():
+    """
+    Retrieve the directory of the compiled environments cache.
+
+    Returns:
+        str: The directory set in the `GRID_ENV_CACHE` environment variable, or `None` if the cache is disabled.
+
+    """
+    return os.environ.get(CACHE_VARIABLE) or None
+
+
+def model_key(grid, symbols, rewards, actions, dynamics, terminals):
+    """
+    Compute the key of a compiled model from the definition of its environment.
+
+    Args:
+        grid (numpy.ndarray): The grid layout represented as a flattened array of indices in `symbols`.
+        symbols (numpy.ndarray): The lookup table of the cell types.
+        rewards (dict): A dictionary mapping grid cell types to their corresponding rewards.
+        actions (dict): A dictionary mapping action indices to their corresponding action names.
+        dynamics (dict of int and float): A dictionary mapping action indices to a dictionary of transition probabilities.
+        terminals (list of str): A list of terminal states represented as grid cell types.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest identifying the compiled model.
+
+    """
+    definition = {
+        "version":   CACHE_VERSION,
+        "shape":     list(np.shape(grid)),
+        "symbols":   list(map(str, symbols)),
+        "rewards":   rewards,
+        "actions":   actions,
+        "dynamics":  dynamics,
+        "terminals": list(terminals)
+    }
+
+    digest = hashlib.sha256(np.ascontiguousarray(grid, dtype = np.uint8).tobytes())
+    digest.update(json.dumps(definition, sort_keys = True, default = str).encode())
+
+    return digest.hexdigest()
+
+
+def load_model(key):
+    """
+    Open a compiled model from the cache, memory-mapping its arrays in read-only mode.
+
+    The arrays are shared through the page cache, so many processes can open the same model with
+    near-zero startup cost and a single copy in memory.
+
+    Args:
+        key (str): The key of the compiled model.
+
+    Returns:
+        dict of numpy.memmap: The arrays of the compiled model by name, or `None` if the model is not cached.
+
+    """
+    directory = cache_directory()
+
+    if directory is None:
+        return None
+
+    path = os.path.join(directory, key)
+
+    if not os.path.isdir(path):
+        return None
+
+    model = {}
+
+    for file in os.listdir(path):
+        name, extension = os.path.splitext(file)
+
+        if extension == ".npy":
+            model[name] = np.load(os.path.join(path, file), mmap_mode = "r")
+
+    return model
+
+
+def save_model(key, model):
+    """
+    Store a compiled model in the cache, if the cache is enabled.
+
+    The arrays are written to a temporary directory which is then renamed, so concurrent processes never
+    open a partially written model.
+
+    Args:
+        key (str): The key of the compiled model.
+        model (dict of numpy.ndarray): The arrays of the compiled model by name.
+
+    """
+    directory = cache_directory()
+
+    if directory is None:
+        return
+
+    os.makedirs(directory, exist_ok = True)
+
+    path = os.path.join(directory, key)
+
+    if os.path.isdir(path):
+        return
+
+    temp = tempfile.mkdtemp(prefix = key + ".", dir = directory)
+
+    for name, array in model.items():
+        np.save(os.path.join(temp, name + ".npy"), np.asarray(array))
+
+    try:
+        os.rename(temp, path)
+    except OSError:
+        # Another process stored the same model in the meantime.
+        shutil.rmtree(temp, ignore_errors = True)
@@ -0,0 +1,226 @@
+import os
+import numpy as np
+
+
+def monotone_path(rows, cols, rng):
+    """
+    Draw a random path from the top-left to the bottom-right cell, moving only right and down.
+
+    Args:
+        rows (int): The number of rows of the grid.
+        cols (int): The number of columns of the grid.
+        rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+        tuple: A tuple containing:
+            - numpy.ndarray: The row of each cell of the path;
+            - numpy.ndarray: The column of each cell of the path.
+
+    """
+    downs = rng.permutation(np.repeat([1, 0], [rows - 1, cols - 1]))
+
+    path_rows = np.concatenate([[0], np.cumsum(downs)])
+    path_cols = np.concatenate([[0], np.cumsum(1 - downs)])
+
+    return path_rows, path_cols
+
+
+def maze_grid(rows, cols, seed = None):
+    """
+    Generate a perfect maze with the recursive backtracker algorithm.
+
+    Corridors lie on the even rows and columns and are joined by carving the walls between them, so every
+    corridor is reachable from the start through exactly one path. The start is in the top-left corner and the
+    goal in the farthest corridor from it along the diagonal.
+
+    Args:
+        rows (int): The number of rows of the grid.
+        cols (int): The number of columns of the grid.
+        seed (int, optional): The seed of the random number generator. Defaults to `None`.
+
+    Returns:
+        numpy.ndarray: The `(rows, cols)` grid of cell types.
+
+    """
+    rng = np.random.default_rng(seed)
+
+    cell_rows = (rows + 1) // 2
+    cell_cols = (cols + 1) // 2
+    visited   = bytearray(cell_rows * cell_cols)
+    carved    = [0]
+    stack     = [0]
+
+    visited[0] = 1
+
+    # The walk is iterative (an explicit stack) so that mazes of millions of cells do not overflow the recursion.
+    draws = iter(rng.random(2 * cell_rows * cell_cols))
+
+    while stack:
+        cell   = stack[-1]
+        row    = cell // cell_cols
+        col    = cell % cell_cols
+        blocks = []
+
+        if col > 0 and not visited[cell - 1]:
+            blocks.append(cell - 1)
+        if col < cell_cols - 1 and not visited[cell + 1]:
+            blocks.append(cell + 1)
+        if row > 0 and not visited[cell - cell_cols]:
+            blocks.append(cell - cell_cols)
+        if row < cell_rows - 1 and not visited[cell + cell_cols]:
+            blocks.append(cell + cell_cols)
+
+        if not blocks:
+            stack.pop()
+            continue
+
+        block = blocks[int(next(draws) * len(blocks))]
+
+        visited[block] = 1
+        stack.append(block)
+
+        # Carve both the next corridor and the wall between the two corridors.
+        block_row = block // cell_cols
+        block_col = block % cell_cols
+
+        carved.append((row + block_row) * cols + col + block_col)
+        carved.append(2 * block_row * cols + 2 * block_col)
+
+    grid = np.full(rows * cols, "W")
+    grid[carved] = "C"
+    grid = grid.reshape(rows, cols)
+
+    grid[0, 0]                                     = "S"
+    grid[2 * (cell_rows - 1), 2 * (cell_cols - 1)] = "G"
+
+    return grid
+
+
+def walls_grid(rows, cols, density, seed = None):
+    """
+    Generate a maze of walls scattered at random with the given density.
+
+    A random monotone path from the start (top-left) to the goal (bottom-right) is kept free of walls,
+    so the goal is always reachable.
+
+    Args:
+        rows (int): The number of rows of the grid.
+        cols (int): The number of columns of the grid.
+        density (float): The probability of each cell being a wall.
+        seed (int, optional): The seed of the random number generator. Defaults to `None`.
+
+    Returns:
+        numpy.ndarray: The `(rows, cols)` grid of cell types.
+
+    """
+    rng  = np.random.default_rng(seed)
+    grid = np.where(rng.random((rows, cols)) < density, "W", "C")
+
+    grid[monotone_path(rows, cols, rng)] = "C"
+
+    grid[0, 0]   = "S"
+    grid[-1, -1] = "G"
+
+    return grid
+
+
+def lava_grid(rows, cols, pit_density, wall_density = 0.0, seed = None):
+    """
+    Generate a lava floor with pits and walls scattered at random with the given densities.
+
+    A random monotone path from the start (top-left) to the goal (bottom-right) is kept free of pits and walls,
+    so the goal is always reachable.
+
+    Args:
+        rows (int): The number of rows of the grid.
+        cols (int): The number of columns of the grid.
+        pit_density (float): The probability of each cell being a pit.
+        wall_density (float, optional): The probability of each cell being a wall. Defaults to 0.
+        seed (int, optional): The seed of the random number generator. Defaults to `None`.
+
+    Returns:
+        numpy.ndarray: The `(rows, cols)` grid of cell types.
+
+    """
+    rng   = np.random.default_rng(seed)
+    draws = rng.random((rows, cols))
+
+    grid = np.full((rows, cols), "L")
+    grid[draws < pit_density + wall_density] = "P"
+    grid[draws < wall_density]               = "W"
+
+    grid[monotone_path(rows, cols, rng)] = "L"
+
+    grid[0, 0]   = "S"
+    grid[-1, -1] = "G"
+
+    return grid
+
+
+def cliff_grid(rows, cols):
+    """
+    Generate a cliff walk: the start and the goal lie at the ends of the bottom row, separated by the cliff.
+
+    Args:
+        rows (int): The number of rows of the grid, at least 2.
+        cols (int): The number of columns of the grid, at least 2.
+
+    Returns:
+        numpy.ndarray: The `(rows, cols)` grid of cell types.
+
+    """
+    grid = np.full((rows, cols), "E")
+
+    grid[-1, :]  = "C"
+    grid[-1, 0]  = "S"
+    grid[-1, -1] = "G"
+
+    return grid
+
+
+def load_grid(path):
+    """
+    Load a grid from a map file.
+
+    Binary `.npy` files store the array of cell types as is. Text files store one row per line, either as
+    contiguous one-character cells (e.g. `SLLP`) or as cells separated by whitespace.
+
+    Args:
+        path (str): The path of the map file.
+
+    Returns:
+        numpy.ndarray: The `(rows, cols)` grid of cell types.
+
+    """
+    if os.path.splitext(path)[1] == ".npy":
+        return np.load(path).astype(str)
+
+    with open(path) as file:
+        lines = [line.split() for line in file if line.strip()]
+
+    if all(len(line) == 1 for line in lines):
+        # Contiguous cells are decoded at once from the raw characters.
+        chars = "".join(line[0] for line in lines)
+
+        return np.frombuffer(chars.encode(), dtype = "S1").astype(str).reshape(len(lines), -1)
+
+    return np.array(lines)
+
+
+def save_grid(path, grid):
+    """
+    Store a grid in a map file, in binary if the path ends with `.npy` and in text otherwise.
+
+    Args:
+        path (str): The path of the map file.
+        grid (numpy.ndarray): The `(rows, cols)` grid of cell types.
+
+    """
+    grid = np.asarray(grid)
+
+    if os.path.splitext(path)[1] == ".npy":
+        np.save(path, grid)
+        return
+
+    with open(path, "w") as file:
+        file.write("\n".join("".join(row) for row in grid.tolist()) + "\n")
@@ -4,10 +4,12 @@ import numpy as np
 
 from typing import Optional
 
-from gym       import Env, spaces
-from gym.utils import seeding
+from gym          import Env, spaces
+from gym.utils    import seeding
+from scipy.sparse import csr_matrix
 
-from inc.utils.utils import matrix_to_string
+from envs.collections.cache import load_model, model_key, save_model
+from inc.utils.utils        import matrix_to_string, row_positions, splice_rows
 
 
 class GridEnv(Env):
@@ -23,22 +25,40 @@ class GridEnv(Env):
 
     Attributes:
         metadata (dict): Metadata for rendering modes.
-        grid (numpy.ndarray): The grid layout represented as a flattened array.
+        grid (numpy.ndarray): The grid layout represented as a flattened array of indices in `symbols`.
+        symbols (numpy.ndarray): The lookup table of the cell types, sorted.
         rewards (dict): A dictionary mapping grid cell types to their corresponding rewards.
         actions (dict): A dictionary mapping action indices to their corresponding action names.
+        dynamics (dict of int and float): A dictionary mapping action indices to a dictionary of transition probabilities.
         terminals (list of str): A list of terminal states represented as grid cell types.
         shape (tuple): The dimensions of the grid (rows, columns).
         rows (signedinteger): The number of rows in the grid.
         cols (signedinteger): The number of columns in the grid.
+        wall_mask (numpy.ndarray): Whether each state is a wall.
+        terminal_mask (numpy.ndarray): Whether each state is a terminal state.
+        goal_mask (numpy.ndarray): Whether each state is a goal.
+        pit_mask (numpy.ndarray): Whether each state is a pit.
         strt_state (signedinteger): The index of the starting state.
         goal_state (signedinteger): The index of the goal state.
         action_space (spaces.Discrete): The action space of the environment.
         observation_space (spaces.Discrete): The observation space of the environment.
-        T (numpy.ndarray): The transition probability function `T(s, a, s')`.
-        R (numpy.ndarray): The rewards function `R(s, a, s')`.
+        T_indptr (numpy.ndarray): The offsets of the successors of each pair `(s, a)`, stored at row `s * A + a`.
+        T_indices (numpy.ndarray): The successor states of each pair `(s, a)`, sorted by state.
+        T_data (numpy.ndarray): The transition probabilities aligned with `T_indices`.
+        T_cdf (numpy.ndarray): The cumulative transition probabilities within each pair `(s, a)`, used for sampling.
+        T (numpy.ndarray): The dense transition probability function `T(s, a, s')`, built on first access.
+        T_sparse (scipy.sparse.csr_matrix): The transition probability function as a `(S * A, S)` sparse matrix.
+        R (numpy.ndarray): The dense rewards function `R(s, a, s')`, built on first access.
+        R_data (numpy.ndarray): The rewards `R(s, a, s')` aligned with `T_indices`.
+        RSA (numpy.ndarray): The expected reward function `RSA(s, a)`.
         RS (numpy.ndarray): The reward state function `RS(s)`.
         states_range (list of int): The range of possible states.
         rewards_range (tuple): The range of possible rewards (min, max).
+        model_key (str): The key of the model in the compiled environments cache.
+        successors_table (numpy.ndarray): The successor of every state-action pair, `None` for stochastic dynamics.
+        P_indptr (numpy.ndarray): The offsets of the predecessors of each state, built on first access.
+        P_indices (numpy.ndarray): The states reaching each state with a non-zero probability, built on first access.
+        landing (numpy.ndarray): The state where the agent lands after moving to each state.
         np_random (numpy.random.Generator): The random number generator.
         curr_state (signedinteger): The index of the current state.
         terminated (bool): Whether the episode has terminated.
@@ -62,9 +82,26 @@ class GridEnv(Env):
             terminals (list): A list of terminal states.
 
         """
-        self.grid      = np.asarray(grid).flatten()
+        # Store one byte per cell: the index of its cell type in the lookup table of symbols. One-character cell
+        # types are counted by code point instead of sorted as strings, which gives the same sorted table.
+        cells = np.asarray(grid).flatten()
+
+        if cells.dtype == np.dtype("<U1"):
+            codes   = cells.view(np.uint32)
+            present = np.flatnonzero(np.bincount(codes))
+            indices = np.zeros(present[-1] + 1, dtype = np.uint8)
+
+            indices[present] = np.arange(len(present))
+
+            self.symbols = present.astype(np.uint32).view("<U1")
+            self.grid    = indices[codes]
+        else:
+            self.symbols, self.grid = np.unique(cells, return_inverse = True)
+
+        self.grid      = self.grid.astype(np.uint8)
         self.rewards   = rewards
         self.actions   = actions
+        self.dynamics  = dynamics
         self.terminals = terminals
 
         # Define grid dimensions.
@@ -72,66 +109,22 @@ class GridEnv(Env):
         self.rows  = self.shape[0]
         self.cols  = self.shape[1]
 
-        # Define start and goal states.
-        self.strt_state = np.argwhere(self.grid == "S")[0, 0]
-        self.goal_state = np.argwhere(self.grid == "G")[0, 0]
-
         # Define action and observation space.
         self.action_space      = spaces.Discrete(len(self.actions))
         self.observation_space = spaces.Discrete(len(self.grid))
 
-        functions_spaces = (self.observation_space.n, self.action_space.n, self.observation_space.n)
-
-        # Precompute transition probability function `T`, rewards function `R` and reward state function `RS`.
-        self.T  = np.zeros(functions_spaces)
-        self.R  = np.zeros(functions_spaces)
-        self.RS = np.zeros(self.observation_space.n)
-
-        for state in range(self.observation_space.n):
-            if self.grid[state] == "W":
-                continue
-
-            if self.is_terminal(state):
-                self.T[state, :, state] = 1.0
-                continue
-
-            curr_x, curr_y = self.state_to_position(state)
-
-            for action in range(self.action_space.n):
-                for prob in dynamics[action]:
-                    cases = {
-                        0:
-                            lambda x, y: (x, max(0, y - 1)),
-                        1:
-                            lambda x, y: (x, min(self.cols - 1, y + 1)),
-                        2:
-                            lambda x, y: (max(0, x - 1), y),
-                        3:
-                            lambda x, y: (min(self.rows - 1, x + 1), y)
-                    }
-
-                    next_x, next_y = cases[prob](curr_x, curr_y)
-                    next_state     = self.position_to_state(next_x, next_y)
-
-                    if self.grid[next_state] == "W":
-                        next_state = state
-
-                    self.T[state, action, next_state] += dynamics[action][prob]
-                    self.R[state, action, next_state]  = rewards[self.grid[next_state]]
-                    self.RS[state]                     = rewards[self.grid[state]]
-
-                # Normalize probability values over the whole state space.
-                self.T[state, action, :] /= np.sum(self.T[state, action, :])
-
-        for state in range(self.observation_space.n):
-            if self.grid[state] == "P": self.RS[state] = rewards["P"]
-            if self.grid[state] == "G": self.RS[state] = rewards["G"]
-
-        self.states_range  = range(self.observation_space.n)
-        self.rewards_range = self.R.min(), self.R.max()
-        self.np_random     = None
-        self.curr_state    = None
-        self.terminated    = False
+        self.compile_model()
+
+        # Define start and goal states.
+        self.strt_state = np.flatnonzero(self.cells_mask("S"))[0]
+        self.goal_state = np.flatnonzero(self.goal_mask)[0]
+
+        self.landing = self.build_landing()
+
+        self.states_range = range(self.observation_space.n)
+        self.np_random    = None
+        self.curr_state   = None
+        self.terminated   = False
         self.seed()
         self.reset()
 
@@ -147,7 +140,588 @@ class GridEnv(Env):
             bool: `True` if the state is a terminal state, `False` otherwise.
 
         """
-        return self.grid[state] in self.terminals
+        return bool(self.terminal_mask[state])
+
+
+    def cells_mask(self, *symbols):
+        """
+        Compute the mask of the cells of the given types.
+
+        Args:
+            *symbols (str): The cell types to select.
+
+        Returns:
+            numpy.ndarray: Whether each state is a cell of one of the given types.
+
+        """
+        return np.isin(self.symbols, symbols)[self.grid]
+
+
+    def compile_model(self):
+        """
+        Compute the masks of the cell types and the model of the environment from the grid layout.
+
+        The model is reopened from the compiled environments cache when available, and stored there otherwise.
+
+        """
+        # Precompute the masks of the cell types checked on the hot paths.
+        self.wall_mask     = self.cells_mask("W")
+        self.terminal_mask = self.cells_mask(*self.terminals)
+        self.goal_mask     = self.cells_mask("G")
+        self.pit_mask      = self.cells_mask("P")
+
+        # Precompute the transition probability function `T` in a sparse (CSR) layout: the successors of the pair
+        # `(s, a)` are stored in `T_indices[T_indptr[s * A + a]:T_indptr[s * A + a + 1]]`, with their probabilities
+        # in `T_data` and their rewards in `R_data` at the same positions. The dense tensors `T` and `R` are only
+        # built on demand.
+        self.model_key = model_key(self.grid, self.symbols, self.rewards, self.actions, self.dynamics, self.terminals)
+
+        model = load_model(self.model_key)
+
+        if model is None:
+            model = self.build_model()
+
+            save_model(self.model_key, model)
+
+        self.T_indptr  = model["T_indptr"]
+        self.T_indices = model["T_indices"]
+        self.T_data    = model["T_data"]
+        self.T_cdf     = model["T_cdf"]
+        self.R_data    = model["R_data"]
+        self.RSA       = model["RSA"]
+        self.RS        = model["RS"]
+
+        self.rewards_range = tuple(model["rewards_range"].tolist())
+
+        self._T         = None
+        self._R         = None
+        self._T_sparse  = None
+        self._P_indptr  = None
+        self._P_indices = None
+
+        # With deterministic dynamics every pair `(s, a)` has a single successor, which is looked up directly. The
+        # flag is stored with the model, so that a cached model is not read in full just to check it.
+        self.successors_table = self.build_successors() if model["deterministic"] else None
+
+
+    def update_cells(self, changes):
+        """
+        Change the type of some cells of the grid and update the model of the new layout.
+
+        Only the moves of the changed cells and of their neighbours depend on the changes, so only their rows of the
+        model, of the successor table and of the predecessors (when built) are rebuilt and spliced into the existing
+        arrays. The edited model is not stored in the compiled environments cache. The start and goal states are
+        kept, even if their cells change type.
+
+        Args:
+            changes (dict): A dictionary mapping the positions (row, col) of the cells to their new cell types.
+
+        Returns:
+            numpy.ndarray: The sorted states whose moves were rebuilt: the changed cells and their neighbours.
+
+        """
+        cells   = np.array([self.position_to_state(row, col) for row, col in changes], dtype = np.int64)
+        symbols = np.array(list(changes.values()))
+
+        # New cell types are merged into the sorted lookup table, renumbering the cells when needed.
+        if not np.isin(symbols, self.symbols).all():
+            merged       = np.union1d(self.symbols, symbols)
+            self.grid    = np.searchsorted(merged, self.symbols).astype(np.uint8)[self.grid]
+            self.symbols = merged
+
+        self.grid[cells] = np.searchsorted(self.symbols, symbols)
+
+        self.wall_mask[cells]     = np.isin(symbols, ["W"])
+        self.terminal_mask[cells] = np.isin(symbols, self.terminals)
+        self.goal_mask[cells]     = np.isin(symbols, ["G"])
+        self.pit_mask[cells]      = np.isin(symbols, ["P"])
+
+        rows, cols = np.divmod(cells, self.cols)
+
+        states = np.unique(np.concatenate([
+            cells,
+            rows * self.cols + np.maximum(0, cols - 1),
+            rows * self.cols + np.minimum(self.cols - 1, cols + 1),
+            np.maximum(0, rows - 1) * self.cols + cols,
+            np.minimum(self.rows - 1, rows + 1) * self.cols + cols
+        ]))
+
+        self.update_model(states)
+
+        self.model_key = model_key(self.grid, self.symbols, self.rewards, self.actions, self.dynamics, self.terminals)
+        self.landing   = self.build_landing()
+
+        return states
+
+
+    def update_model(self, states):
+        """
+        Rebuild the rows of the model of some states and splice them into the arrays of the model.
+
+        Args:
+            states (numpy.ndarray): The sorted states whose moves are rebuilt.
+
+        """
+        actions_n = self.action_space.n
+        pairs     = (states[:, None] * actions_n + np.arange(actions_n)).reshape(-1)
+
+        indptr, indices, data = self.build_transitions(self.dynamics, states)
+
+        rows    = np.repeat(np.arange(len(pairs)), np.diff(indptr))
+        sources = states[rows // actions_n]
+        R_data  = np.where(self.terminal_mask[sources], 0.0, self.cells_rewards(indices))
+
+        RS = np.where(self.wall_mask[states] | self.terminal_mask[states], 0.0, self.cells_rewards(states))
+        RS = np.where(self.pit_mask[states] | self.goal_mask[states], self.cells_rewards(states), RS)
+
+        if self._P_indptr is not None:
+            self._P_indptr, self._P_indices = self.update_predecessors(states, pairs, sources, indices, data)
+
+        old_R_data = self.R_data[row_positions(self.T_indptr, pairs)]
+
+        self.T_indptr, (self.T_indices, self.T_data, self.T_cdf, self.R_data) = splice_rows(
+            self.T_indptr, pairs, indptr,
+            (self.T_indices, self.T_data, self.T_cdf, self.R_data),
+            (indices, data, self.build_cumulative(indptr, data), R_data)
+        )
+
+        # Arrays reopened from the compiled environments cache are read-only, they are copied on the first change.
+        self.RSA = self.RSA if self.RSA.flags.writeable else np.array(self.RSA)
+        self.RS  = self.RS if self.RS.flags.writeable else np.array(self.RS)
+
+        self.RSA[states] = np.bincount(rows, weights = data * R_data, minlength = len(pairs)).reshape(-1, actions_n)
+        self.RS[states]  = RS
+
+        # The range only needs a full scan when the replaced rows held one of its bounds.
+        low, high = self.rewards_range
+
+        if (old_R_data.min(initial = np.inf) > low) and (old_R_data.max(initial = -np.inf) < high):
+            self.rewards_range = (min(low, float(R_data.min(initial = low))), max(high, float(R_data.max(initial = high))))
+        else:
+            self.rewards_range = (float(self.R_data.min(initial = 0.0)), float(self.R_data.max(initial = 0.0)))
+
+        self._T        = None
+        self._R        = None
+        self._T_sparse = None
+
+        # The changes may make the dynamics deterministic (e.g. walls around a stochastic cell), or the opposite.
+        if np.any((data > 0) & (data < 1.0)):
+            self.successors_table = None
+        elif self.successors_table is None:
+            self.successors_table = self.build_successors() if self.is_deterministic() else None
+        else:
+            successors = np.full(len(pairs), -1, dtype = self.successors_table.dtype)
+
+            successors[rows[data == 1.0]] = indices[data == 1.0]
+
+            self.successors_table[states] = successors.reshape(-1, actions_n)
+
+
+    def update_predecessors(self, states, pairs, sources, indices, data):
+        """
+        Update the reverse successor table after the moves of some states were rebuilt.
+
+        Only the states reached from the rebuilt states, before or after the change, have their predecessors
+        rebuilt: their predecessors outside the rebuilt states are kept, and the new moves are added.
+
+        Args:
+            states (numpy.ndarray): The sorted states whose moves were rebuilt.
+            pairs (numpy.ndarray): The rows `s * A + a` of the rebuilt states in the sparse transition function.
+            sources (numpy.ndarray): The state of each new successor.
+            indices (numpy.ndarray): The new successors of the rebuilt states.
+            data (numpy.ndarray): The transition probabilities aligned with the new successors.
+
+        Returns:
+            tuple: A tuple containing:
+                - numpy.ndarray: The offsets of the predecessors of each state;
+                - numpy.ndarray: The predecessor states, sorted by state within each state.
+
+        """
+        states_n = self.observation_space.n
+
+        old_targets = self.T_indices[row_positions(self.T_indptr, pairs)]
+        targets     = np.unique(np.concatenate([old_targets, indices]).astype(np.int64))
+
+        old_sources = np.asarray(self.P_indices[row_positions(self.P_indptr, targets)], dtype = np.int64)
+        old_targets = np.repeat(targets, self.P_indptr[targets + 1] - self.P_indptr[targets])
+        kept        = ~np.isin(old_sources, states)
+        added       = (data > 0) & (sources != indices)
+
+        pairs = np.unique(np.concatenate([
+            old_targets[kept] * states_n + old_sources[kept],
+            indices[added].astype(np.int64) * states_n + sources[added]
+        ]))
+
+        new_targets, new_sources = np.divmod(pairs, states_n)
+
+        indptr = np.zeros(len(targets) + 1, dtype = np.int64)
+        np.cumsum(np.bincount(np.searchsorted(targets, new_targets), minlength = len(targets)), out = indptr[1:])
+
+        P_indptr, (P_indices,) = splice_rows(
+            self.P_indptr, targets, indptr, (self.P_indices,), (new_sources.astype(self.P_indices.dtype),)
+        )
+
+        return P_indptr, P_indices
+
+
+    def build_model(self):
+        """
+        Build the arrays of the environment model: the sparse transition probability function `T`, the rewards
+        aligned with its successors, the expected reward function `RSA`, the reward state function `RS` and
+        the range of possible rewards, and whether the dynamics are deterministic.
+
+        Returns:
+            dict of numpy.ndarray: The arrays of the model by name.
+
+        """
+        self.T_indptr, self.T_indices, self.T_data = self.build_transitions(self.dynamics)
+
+        # Walls and terminal states give no reward, except pits and goals.
+        cells_rewards = self.cells_rewards()
+        absorbing     = self.pit_mask | self.goal_mask
+
+        RS = np.where(self.wall_mask | self.terminal_mask, 0.0, cells_rewards)
+        RS = np.where(absorbing, cells_rewards, RS)
+
+        R_data = self.successor_rewards()
+
+        return {
+            "T_indptr":      self.T_indptr,
+            "T_indices":     self.T_indices,
+            "T_data":        self.T_data,
+            "T_cdf":         self.build_cumulative(),
+            "R_data":        R_data,
+            "RSA":           self.expected_rewards(R_data),
+            "RS":            RS,
+            "rewards_range": np.array([R_data.min(initial = 0.0), R_data.max(initial = 0.0)]),
+            "deterministic": np.array(self.is_deterministic())
+        }
+
+
+    def build_transitions(self, dynamics, states = None):
+        """
+        Build the sparse transition probability function from the environment dynamics.
+
+        Walls have no successors, terminal states loop on themselves, and every other state moves to the
+        neighbouring cells selected by the dynamics, bouncing back when the neighbour is a wall or outside the grid.
+
+        Args:
+            dynamics (dict of int and float): A dictionary mapping action indices to a dictionary of transition probabilities.
+            states (numpy.ndarray, optional): The sorted states whose pairs are built, `None` for all the states.
+                Defaults to `None`.
+
+        Returns:
+            tuple: A tuple containing:
+                - numpy.ndarray: The offsets of the successors of each pair `(s, a)` of the states;
+                - numpy.ndarray: The successor states, sorted by state within each pair `(s, a)`;
+                - numpy.ndarray: The transition probabilities aligned with the successor states.
+
+        """
+        states    = np.arange(self.observation_space.n) if states is None else np.asarray(states)
+        states_n  = len(states)
+        actions_n = self.action_space.n
+        walls     = self.wall_mask[states]
+        terminals = self.terminal_mask[states]
+
+        rows, cols = np.divmod(states, self.cols)
+
+        # Neighbour reached by each move (left, right, up, down), bouncing back on walls and grid borders.
+        moves = np.stack([
+            rows * self.cols + np.maximum(0, cols - 1),
+            rows * self.cols + np.minimum(self.cols - 1, cols + 1),
+            np.maximum(0, rows - 1) * self.cols + cols,
+            np.minimum(self.rows - 1, rows + 1) * self.cols + cols
+        ])
+        moves = np.where(self.wall_mask[moves], states, moves)
+
+        # Candidate successors of each state sorted by state: duplicates (bounces) form runs closed by a tail.
+        order      = np.argsort(moves.T, axis = -1, kind = "stable")
+        candidates = np.take_along_axis(moves.T, order, axis = -1)
+        tails      = np.ones(candidates.shape, dtype = bool)
+
+        tails[:, :-1] = candidates[:, :-1] != candidates[:, 1:]
+
+        # Probability of each run for every action, summed in the order of the moves and stored on its tail.
+        next_probs = np.zeros((states_n, actions_n, len(moves)))
+        listed     = np.zeros((states_n, actions_n, len(moves)), dtype = bool)
+
+        for action in range(actions_n):
+            move_probs  = np.zeros(len(moves))
+            move_listed = np.zeros(len(moves), dtype = bool)
+
+            for move in dynamics[action]:
+                move_probs[move]  = dynamics[action][move]
+                move_listed[move] = True
+
+            next_probs[:, action] = move_probs[order]
+            listed[:, action]     = move_listed[order]
+
+            for index in range(1, len(moves)):
+                duplicate = ~tails[:, index - 1]
+
+                next_probs[:, action, index] += np.where(duplicate, next_probs[:, action, index - 1], 0.0)
+                listed[:, action, index]     |= duplicate & listed[:, action, index - 1]
+
+        listed &= tails[:, None, :]
+
+        # Terminal states loop on themselves and walls have no successors.
+        candidates[terminals, 0]    = states[terminals]
+        tails[terminals, 0]         = True
+        next_probs[terminals]       = 0.0
+        next_probs[terminals, :, 0] = 1.0
+        listed[terminals]           = False
+        listed[terminals, :, 0]     = True
+        listed[walls]               = False
+
+        positions = np.flatnonzero(listed)
+        counts    = listed.sum(axis = -1).reshape(-1)
+
+        indptr = np.zeros(states_n * actions_n + 1, dtype = np.int64)
+        np.cumsum(counts, out = indptr[1:])
+
+        # Normalize probability values over the successors.
+        totals = (next_probs * tails[:, None, :]).sum(axis = -1).reshape(-1)
+        data   = next_probs.reshape(-1)[positions] / np.repeat(totals, counts)
+
+        indices = np.broadcast_to(candidates[:, None, :], listed.shape).reshape(-1)[positions]
+        dtype   = np.int32 if len(positions) < np.iinfo(np.int32).max else np.int64
+
+        return indptr.astype(dtype), indices.astype(dtype), data
+
+
+    def build_cumulative(self, T_indptr = None, T_data = None):
+        """
+        Build the cumulative transition probabilities within each pair `(s, a)`.
+
+        The last value of each pair is set to exactly 1.0, so that a uniform sample in `[0, 1)` always
+        falls on one of its successors.
+
+        Args:
+            T_indptr (numpy.ndarray, optional): The offsets of the successors of each pair, `None` for `T_indptr`.
+                Defaults to `None`.
+            T_data (numpy.ndarray, optional): The transition probabilities aligned with the successors, `None` for
+                `T_data`. Defaults to `None`.
+
+        Returns:
+            numpy.ndarray: The cumulative probabilities aligned with the successors.
+
+        """
+        T_indptr = self.T_indptr if T_indptr is None else T_indptr
+        T_data   = self.T_data if T_data is None else T_data
+
+        starts = T_indptr[:-1]
+        counts = np.diff(T_indptr)
+        cdf    = np.array(T_data, dtype = float)
+
+        # Pairs have at most one successor per move, so the prefix sums only take a few steps.
+        for index in range(1, counts.max(initial = 0)):
+            positions       = starts[counts > index] + index
+            cdf[positions] += cdf[positions - 1]
+
+        cdf[T_indptr[1:][counts > 0] - 1] = 1.0
+
+        return cdf
+
+
+    def is_deterministic(self):
+        """
+        Check whether the dynamics of the environment are deterministic.
+
+        Returns:
+            bool: `True` if every state-action pair reaches a single successor with probability 1, `False` otherwise.
+
+        """
+        probs = np.asarray(self.T_data)
+
+        return bool(np.all(probs[probs > 0] == 1.0))
+
+
+    def build_successors(self):
+        """
+        Build the successor table of an environment with deterministic dynamics.
+
+        Returns:
+            numpy.ndarray: A `(S, A)` array with the successor of every state-action pair, -1 for the walls.
+
+        """
+        positions = np.flatnonzero(np.asarray(self.T_data) == 1.0)
+        rows      = np.repeat(np.arange(len(self.T_indptr) - 1), np.diff(self.T_indptr))[positions]
+
+        successors       = np.full(self.observation_space.n * self.action_space.n, -1, dtype = self.T_indices.dtype)
+        successors[rows] = self.T_indices[positions]
+
+        return successors.reshape(self.observation_space.n, self.action_space.n)
+
+
+    def build_predecessors(self):
+        """
+        Build the reverse successor table from the sparse transition probability function.
+
+        A state `p` is a predecessor of `s` when some action moves from `p` to `s` with a non-zero probability.
+        Self-loops are left out, as they never shorten a path.
+
+        Returns:
+            tuple: A tuple containing:
+                - numpy.ndarray: The offsets of the predecessors of each state;
+                - numpy.ndarray: The predecessor states, sorted by state within each state.
+
+        """
+        states_n = self.observation_space.n
+        sources  = np.repeat(np.arange(len(self.T_indptr) - 1), np.diff(self.T_indptr)) // self.action_space.n
+        targets  = np.asarray(self.T_indices, dtype = np.int64)
+        kept     = (np.asarray(self.T_data) > 0) & (sources != targets)
+
+        # Sort the pairs by target, then by source, and drop the duplicates given by different actions.
+        pairs = np.unique(targets[kept] * states_n + sources[kept])
+
+        targets, sources = np.divmod(pairs, states_n)
+
+        indptr = np.zeros(states_n + 1, dtype = np.int64)
+        np.cumsum(np.bincount(targets, minlength = states_n), out = indptr[1:])
+
+        return indptr.astype(self.T_indptr.dtype), sources.astype(self.T_indices.dtype)
+
+
+    def build_landing(self):
+        """
+        Build the state where the agent lands after moving to each state.
+
+        By default the agent lands on the sampled successor, subclasses may move it elsewhere (e.g. cliffs).
+
+        Returns:
+            numpy.ndarray: The landing state of each state.
+
+        """
+        return np.arange(self.observation_space.n)
+
+
+    def cells_rewards(self, states = None):
+        """
+        Compute the reward of entering each cell of the grid.
+
+        Args:
+            states (numpy.ndarray, optional): The states of the cells, `None` for all the cells. Defaults to `None`.
+
+        Returns:
+            numpy.ndarray: The reward of each state, zero for cell types without a reward (e.g. walls).
+
+        """
+        symbols_rewards = np.array([self.rewards.get(symbol, 0.0) for symbol in self.symbols], dtype = float)
+
+        return symbols_rewards[self.grid if states is None else self.grid[states]]
+
+
+    def successor_rewards(self):
+        """
+        Compute the rewards `R(s, a, s')` aligned with the sparse successors in `T_indices`.
+
+        Returns:
+            numpy.ndarray: The reward received for each stored transition, zero when leaving a terminal state.
+
+        """
+        sources = np.repeat(np.arange(len(self.T_indptr) - 1), np.diff(self.T_indptr)) // self.action_space.n
+
+        return np.where(self.terminal_mask[sources], 0.0, self.cells_rewards()[self.T_indices])
+
+
+    def expected_rewards(self, R_data):
+        """
+        Compute the expected reward of every state-action pair from the rewards aligned with the sparse successors.
+
+        Args:
+            R_data (numpy.ndarray): The reward received for each stored transition.
+
+        Returns:
+            numpy.ndarray: The `(S, A)` matrix of the expected rewards `sum(T(s, a, s') * R(s, a, s'))`.
+
+        """
+        rows = np.repeat(np.arange(len(self.T_indptr) - 1), np.diff(self.T_indptr))
+
+        expected = np.bincount(rows, weights = self.T_data * R_data, minlength = len(self.T_indptr) - 1)
+
+        return expected.reshape(self.observation_space.n, self.action_space.n)
+
+
+    def transitions(self, state, action):
+        """
+        Retrieve the successors of a state-action pair with their probabilities.
+
+        Args:
+            state (signedinteger): The index of the current state.
+            action (signedinteger): The intex of the action to be taken from the current state.
+
+        Returns:
+            tuple: A tuple containing:
+                - numpy.ndarray: The successor states;
+                - numpy.ndarray: The probabilities of reaching each successor state.
+
+        """
+        row   = state * self.action_space.n + action
+        start = self.T_indptr[row]
+        end   = self.T_indptr[row + 1]
+
+        return self.T_indices[start:end], self.T_data[start:end]
+
+
+    def expected_values(self, values):
+        """
+        Compute the expected value of the successors of every state-action pair at once.
+
+        Args:
+            values (numpy.ndarray): The values of each state.
+
+        Returns:
+            numpy.ndarray: The `(S, A)` matrix of the expected values `sum(T(s, a, s') * values(s'))`.
+
+        """
+        expected = self.T_sparse @ np.asarray(values, dtype = float)
+
+        return expected.reshape(self.observation_space.n, self.action_space.n)
+
+
+    @property
+    def T_sparse(self):
+        """
+        scipy.sparse.csr_matrix: The transition probability function as a `(S * A, S)` sparse matrix.
+
+        """
+        if self._T_sparse is None:
+            functions_spaces = (self.observation_space.n * self.action_space.n, self.observation_space.n)
+
+            self._T_sparse = csr_matrix((self.T_data, self.T_indices, self.T_indptr), shape = functions_spaces)
+
+        return self._T_sparse
+
+
+    @property
+    def T(self):
+        """
+        numpy.ndarray: The dense transition probability function `T(s, a, s')`, built on first access.
+
+        """
+        if self._T is None:
+            functions_spaces = (self.observation_space.n, self.action_space.n, self.observation_space.n)
+
+            self._T = self.T_sparse.toarray().reshape(functions_spaces)
+
+        return self._T
+
+
+    @property
+    def R(self):
+        """
+        numpy.ndarray: The dense rewards function `R(s, a, s')`, built on first access.
+
+        """
+        if self._R is None:
+            functions_spaces = (self.observation_space.n * self.action_space.n, self.observation_space.n)
+            rows             = np.repeat(np.arange(functions_spaces[0]), np.diff(self.T_indptr))
+
+            self._R = np.zeros(functions_spaces)
+            self._R[rows, self.T_indices] = self.R_data
+            self._R = self._R.reshape(self.observation_space.n, self.action_space.n, self.observation_space.n)
+
+        return self._R
 
 
     def seed(self, seed = None):
@@ -208,8 +782,9 @@ class GridEnv(Env):
         if self.terminated:
             return None
 
-        next_state = self.sample(self.curr_state, action)
-        reward     = self.R[self.curr_state, action, next_state]
+        index      = self.sample_transition(self.curr_state, action)
+        reward     = float(self.R_data[index])
+        next_state = self.landing[self.T_indices[index]]
 
         self.curr_state = next_state
 
@@ -266,7 +841,91 @@ class GridEnv(Env):
             int: The next state sampled according to the transition probabilities.
 
         """
-        return self.np_random.choice(self.states_range, p = self.T[state, action])
+        return self.T_indices[self.sample_transition(state, action)]
+
+
+    def sample_transition(self, state, action):
+        """
+        Sample a transition of the current state and action, as its position in the sparse model.
+
+        Args:
+            state (signedinteger): The index of the current state.
+            action (signedinteger): The intex of the action to be taken from the current state.
+
+        Returns:
+            int: The position of the sampled transition in `T_indices`, `T_data` and `R_data`.
+
+        """
+        row   = state * self.action_space.n + action
+        start = self.T_indptr[row]
+        end   = self.T_indptr[row + 1]
+
+        if end - start == 1:
+            return start
+
+        # Inverse transform sampling over the few successors of the pair.
+        return start + np.searchsorted(self.T_cdf[start:end], self.np_random.random(), side = "right")
+
+
+    def successors(self, state):
+        """
+        Retrieve a successor of the state for every action, in the order of the actions.
+
+        Deterministic environments read the successors from `successors_table` without any random draw,
+        the others sample one successor per action.
+
+        Args:
+            state (signedinteger): The index of the current state.
+
+        Returns:
+            list of int: The successor state reached by each action.
+
+        """
+        if self.successors_table is not None:
+            return self.successors_table[state].tolist()
+
+        return [self.sample(state, action) for action in range(self.action_space.n)]
+
+
+    def predecessors(self, state):
+        """
+        Retrieve the states from which some action reaches the state, in increasing order.
+
+        Args:
+            state (signedinteger): The index of the current state.
+
+        Returns:
+            list of int: The predecessor states of the state.
+
+        """
+        start = self.P_indptr[state]
+        end   = self.P_indptr[state + 1]
+
+        return self.P_indices[start:end].tolist()
+
+
+    @property
+    def P_indptr(self):
+        """
+        numpy.ndarray: The offsets of the predecessors of each state, built on first access.
+
+        """
+        if self._P_indptr is None:
+            self._P_indptr, self._P_indices = self.build_predecessors()
+
+        return self._P_indptr
+
+
+    @property
+    def P_indices(self):
+        """
+        numpy.ndarray: The states reaching each state with a non-zero probability, built on first access.
+
+        """
+        if self._P_indices is None:
+            self._P_indptr, self._P_indices = self.build_predecessors()
+
+        return self._P_indices
 
 
     def render(self, mode = "human"):
@@ -282,7 +941,7 @@ class GridEnv(Env):
         """
         outfile = io.StringIO() if mode == "ansi" else sys.stdout
 
-        outfile.write(np.array_str(self.grid.reshape(self.rows, self.cols)) + "\n")
+        outfile.write(np.array_str(self.symbols[self.grid].reshape(self.rows, self.cols)) + "\n")
 
 
     def stats_to_string(self, indent = 0):
@@ -305,13 +964,15 @@ class GridEnv(Env):
         curr_pos   = self.state_to_position(curr_state)
         next_pos   = self.state_to_position(next_state)
 
-        grid = np.array(self.grid).reshape(self.rows, self.cols)
+        grid = self.symbols[self.grid].reshape(self.rows, self.cols)
 
         result += tab + "Grid: \n{}\n".format(matrix_to_string(grid.tolist(), indent + 1))
 
         for action in range(self.action_space.n):
+            next_states, probs = self.transitions(curr_state, action)
+
             result += tab + "Probabilities from {} to {} with action {}: {}\n".format(
-                curr_pos, next_pos, self.actions[action], self.T[curr_state, action, next_state]
+                curr_pos, next_pos, self.actions[action], probs[next_states == next_state].sum()
             )
 
         result += "\n"
@@ -0,0 +1,135 @@
+import numpy as np
+
+from typing import Optional
+
+from gym.utils import seeding
+
+
+class VectorGridEnv:
+    """
+    VectorGridEnv runs a batch of independent agents on the same grid environment.
+
+    The agents share the compiled model of the wrapped `GridEnv` and only their current states are stored, so
+    resetting and stepping the whole batch takes a few NumPy operations instead of one Python call per agent.
+    Finished episodes (terminated or truncated) are reset automatically to the start state.
+
+    Attributes:
+        env (GridEnv): The grid environment providing the shared model.
+        num_envs (int): The amount agents stepped together.
+        limit (int): The maximum amount steps of an episode before truncation, `None` for no limit.
+        keys (numpy.ndarray): The cumulative probabilities shifted by the index of their pair `(s, a)`, used to
+            sample the successors of the whole batch with a single search.
+        terminals (numpy.ndarray): Whether each state is a terminal state.
+        np_random (numpy.random.Generator): The random number generator.
+        curr_states (numpy.ndarray): The index of the current state of each agent.
+        lengths (numpy.ndarray): The amount steps taken by each agent in its current episode.
+
+    """
+
+    def __init__(self, env, num_envs, limit = None):
+        """
+        Initialize the batch of agents.
+
+        Args:
+            env (gym.core.Env): The grid environment to run, possibly wrapped.
+            num_envs (int): The amount agents stepped together.
+            limit (int, optional): The maximum amount steps of an episode before truncation. Defaults to `None`.
+
+        """
+        self.env      = env.unwrapped
+        self.num_envs = num_envs
+        self.limit    = limit
+
+        pairs = np.repeat(np.arange(len(self.env.T_indptr) - 1), np.diff(self.env.T_indptr))
+
+        self.keys        = pairs + np.asarray(self.env.T_cdf)
+        self.terminals   = self.env.terminal_mask
+        self.np_random   = None
+        self.curr_states = None
+        self.lengths     = None
+        self.seed()
+        self.reset()
+
+
+    def seed(self, seed = None):
+        """
+        Set the seed for the random number generator.
+
+        Args:
+            seed (int, optional): The seed value to initialize the random number generator.
+                If `None`, a random seed is generated. Defaults to `None`.
+
+        Returns:
+            list of int: A list containing the seed value used to initialize the random number generator.
+
+        """
+        self.np_random, seed = seeding.np_random(seed)
+
+        return [seed]
+
+
+    def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None):
+        """
+        Resets every agent to the starting state.
+
+        Args:
+            seed (int, optional): An optional random seed for reproducibility. Defaults to `None`.
+            options (dict, dict): Additional options for resetting the environment. Default to `None`.
+
+        Returns:
+            tuple: A tuple containing:
+                - numpy.ndarray: The initial state of each agent;
+                - dict: Additional information (empty dictionary in this implementation).
+
+        """
+        self.curr_states = np.full(self.num_envs, self.env.strt_state)
+        self.lengths     = np.zeros(self.num_envs, dtype = int)
+
+        if seed is not None:
+            self.seed(seed)
+
+        return self.curr_states.copy(), {}
+
+
+    def step(self, actions):
+        """
+        Perform a single step of every agent based on the given actions.
+
+        Args:
+            actions (numpy.ndarray): The index of the action taken by each agent.
+
+        Returns:
+            tuple: A tuple containing:
+                - numpy.ndarray: The next state of each agent, the start state for the finished episodes;
+                - numpy.ndarray: The reward received by each agent;
+                - numpy.ndarray: Whether the episode of each agent has terminated;
+                - numpy.ndarray: Whether the episode of each agent has been truncated by the steps limit;
+                - dict: Additional information, with the states reached before the automatic reset in `final_states`.
+
+        """
+        pairs = self.curr_states * self.env.action_space.n + np.asarray(actions)
+
+        # Inverse transform sampling: the first key above `pair + u` is a successor of the pair, clamped to
+        # the row of the pair in case the sum is rounded up to the next one.
+        positions = np.searchsorted(self.keys, pairs + self.np_random.random(self.num_envs), side = "right")
+        positions = np.minimum(positions, self.env.T_indptr[pairs + 1] - 1)
+        sampled   = self.env.T_indices[positions]
+
+        rewards      = self.env.R_data[positions]
+        final_states = self.env.landing[sampled]
+
+        self.lengths += 1
+
+        terminated = self.terminals[final_states]
+        truncated  = np.zeros(self.num_envs, dtype = bool)
+
+        if self.limit is not None:
+            truncated = (~terminated) & (self.lengths >= self.limit)
+
+        finished = terminated | truncated
+
+        self.curr_states           = final_states.copy()
+        self.curr_states[finished] = self.env.strt_state
+        self.lengths[finished]     = 0
+
+        return self.curr_states.copy(), rewards, terminated, truncated, {"final_states": final_states}
@@ -1,4 +1,5 @@
-from envs.collections.grid import GridEnv
+from envs.collections.generator import lava_grid, load_grid
+from envs.collections.grid      import GridEnv
 
 
 class LavaFloorEnv(GridEnv):
@@ -298,3 +299,129 @@ class HugeLavaFloorEnv(GridEnv):
         ]
 
         super().__init__(grid, rewards, actions, dynamics, terminals)
+
+
+class RandomLavaFloorEnv(GridEnv):
+
+    def __init__(self, rows = 20, cols = 20, pit_density = 0.05, wall_density = 0.05, seed = None):
+        """
+        Initialize a lava floor generated at random.
+
+        Args:
+            rows (int, optional): The number of rows of the grid. Defaults to 20.
+            cols (int, optional): The number of columns of the grid. Defaults to 20.
+            pit_density (float, optional): The density of the pits. Defaults to 0.05.
+            wall_density (float, optional): The density of the walls. Defaults to 0.05.
+            seed (int, optional): The seed of the generator. Defaults to `None`.
+
+        """
+        grid = lava_grid(rows, cols, pit_density, wall_density, seed)
+
+        rewards = {
+            "L": -0.04,
+            "S": -0.04,
+            "P": -10.0,
+            "G":  10.0
+        }
+
+        actions = {
+            0: "L",
+            1: "R",
+            2: "U",
+            3: "D"
+        }
+
+        dynamics = {
+            0: {
+                0: 0.8,
+                1: 0.0,
+                2: 0.1,
+                3: 0.1
+            },
+            1: {
+                0: 0.0,
+                1: 0.8,
+                2: 0.1,
+                3: 0.1
+            },
+            2: {
+                0: 0.1,
+                1: 0.1,
+                2: 0.8,
+                3: 0.0
+            },
+            3: {
+                0: 0.1,
+                1: 0.1,
+                2: 0.0,
+                3: 0.8
+            }
+        }
+
+        terminals = [
+            "P",
+            "G"
+        ]
+
+        super().__init__(grid, rewards, actions, dynamics, terminals)
+
+
+class LavaFloorMapEnv(GridEnv):
+
+    def __init__(self, map_file):
+        """
+        Initialize a lava floor loaded from a map file.
+
+        Args:
+            map_file (str): The path of the map file, in text or `.npy` format.
+
+        """
+        grid = load_grid(map_file)
+
+        rewards = {
+            "L": -0.04,
+            "S": -0.04,
+            "P": -10.0,
+            "G":  10.0
+        }
+
+        actions = {
+            0: "L",
+            1: "R",
+            2: "U",
+            3: "D"
+        }
+
+        dynamics = {
+            0: {
+                0: 0.8,
+                1: 0.0,
+                2: 0.1,
+                3: 0.1
+            },
+            1: {
+                0: 0.0,
+                1: 0.8,
+                2: 0.1,
+                3: 0.1
+            },
+            2: {
+                0: 0.1,
+                1: 0.1,
+                2: 0.8,
+                3: 0.0
+            },
+            3: {
+                0: 0.1,
+                1: 0.1,
+                2: 0.0,
+                3: 0.8
+            }
+        }
+
+        terminals = [
+            "P",
+            "G"
+        ]
+
+        super().__init__(grid, rewards, actions, dynamics, terminals)
@@ -1,4 +1,5 @@
-from envs.collections.grid import GridEnv
+from envs.collections.generator import load_grid, maze_grid, walls_grid
+from envs.collections.grid      import GridEnv
 
 
 class SmallMazeEnv(GridEnv):
@@ -113,3 +114,88 @@ class BlockedMazeEnv(GridEnv):
         ]
 
         super().__init__(grid, rewards, actions, dynamics, terminals)
+
+
+class RandomMazeEnv(GridEnv):
+
+    def __init__(self, rows = 21, cols = 21, density = None, seed = None):
+        """
+        Initialize a maze generated at random.
+
+        Args:
+            rows (int, optional): The number of rows of the grid. Defaults to 21.
+            cols (int, optional): The number of columns of the grid. Defaults to 21.
+            density (float, optional): The density of the walls scattered at random, `None` to carve a perfect maze
+                with the recursive backtracker instead. Defaults to `None`.
+            seed (int, optional): The seed of the generator. Defaults to `None`.
+
+        """
+        if density is None:
+            grid = maze_grid(rows, cols, seed)
+        else:
+            grid = walls_grid(rows, cols, density, seed)
+
+        rewards = {
+            "C": 0,
+            "S": 0,
+            "G": 1
+        }
+
+        actions = {
+            0: "L",
+            1: "R",
+            2: "U",
+            3: "D"
+        }
+
+        dynamics = {
+            0: {0: 1.0},
+            1: {1: 1.0},
+            2: {2: 1.0},
+            3: {3: 1.0}
+        }
+
+        terminals = [
+            "G"
+        ]
+
+        super().__init__(grid, rewards, actions, dynamics, terminals)
+
+
+class MazeMapEnv(GridEnv):
+
+    def __init__(self, map_file):
+        """
+        Initialize a maze loaded from a map file.
+
+        Args:
+            map_file (str): The path of the map file, in text or `.npy` format.
+
+        """
+        grid = load_grid(map_file)
+
+        rewards = {
+            "C": 0,
+            "S": 0,
+            "G": 1
+        }
+
+        actions = {
+            0: "L",
+            1: "R",
+            2: "U",
+            3: "D"
+        }
+
+        dynamics = {
+            0: {0: 1.0},
+            1: {1: 1.0},
+            2: {2: 1.0},
+            3: {3: 1.0}
+        }
+
+        terminals = [
+            "G"
+        ]
+
+        super().__init__(grid, rewards, actions, dynamics, terminals)
@@ -6,8 +6,8 @@ def q_value(env, utility, state, action, gamma = 0.9):
     Calculate the expected utility of taking a given action in a given state.
 
     Args:
-        env (gym.core.Env): The environment contains the transition probability function (`T`),
-            reward state function (`RS`), and `grid` information.
+        env (gym.core.Env): The environment contains the transition probability function (`transitions`),
+            reward state function (`RS`), and the cell masks (`pit_mask`, `goal_mask`).
         utility (list of float): A list of utility values for each state.
         state (signedinteger): The index of the current state.
         action (signedinteger): The intex of the action to be taken from the current state.
@@ -17,10 +17,37 @@ def q_value(env, utility, state, action, gamma = 0.9):
         float: The expected utility value for the given state and action.
 
     """
-    if env.grid[state] in ("P", "G"):
+    if env.pit_mask[state] or env.goal_mask[state]:
         return env.RS[state]
 
-    return env.RS[state] + gamma * np.dot(env.T[state, action], utility)
+    next_states, probs = env.transitions(state, action)
+
+    return env.RS[state] + gamma * np.dot(probs, np.asarray(utility)[next_states])
+
+
+def q_values(env, utility, gamma = 0.9):
+    """
+    Calculate the expected utility of taking every action in every state at once.
+
+    The Bellman backup is computed as a single sparse matrix-vector product over the transition probability function,
+    so its cost grows with the amount stored transitions instead of the square of the amount states.
+
+    Args:
+        env (gym.core.Env): The environment contains the sparse transition probability function (`T_sparse`),
+            reward state function (`RS`), and the cell masks (`pit_mask`, `goal_mask`).
+        utility (numpy.ndarray): The utility values for each state.
+        gamma (float, optional): The discount factor for future rewards. Defaults to 0.9.
+
+    Returns:
+        numpy.ndarray: The `(S, A)` matrix of expected utility values for each state and action.
+
+    """
+    q_table = env.RS[:, None] + gamma * env.expected_values(utility)
+
+    absorbing          = env.pit_mask | env.goal_mask
+    q_table[absorbing] = env.RS[absorbing, None]
+
+    return q_table
 
 
 def epsilon_greedy(q_table, state, epsilon = 0.1):
@@ -79,21 +106,10 @@ def values_to_policy(env, values):
             the best action to take in the corresponding state.
 
     """
-    values = np.asarray(values)
-    policy = [0 for _ in range(env.observation_space.n)]
+    expected = np.round(env.expected_values(values), 6)
 
-    for state in range(env.observation_space.n):
-        expected = np.zeros(env.action_space.n)
-
-        for action in range(env.action_space.n):
-            for next_state in range(env.observation_space.n):
-                expected[action] += env.T[state, action, next_state] * values[next_state]
-
-        expected      = np.round(expected, 6)
-        winners       = np.argwhere(expected == np.amax(expected)).flatten()
-        policy[state] = int(winners[0])
-
-    return np.asarray(policy)
+    # The first action with the highest expected value wins the ties.
+    return expected.argmax(axis = 1)
 
 
 def convert_policy(env, solution):
@@ -152,3 +168,50 @@ def run_episode(env, policy, limit = 1000):
         count  += 1
 
     return terminated, reward
+
+
+def run_episodes(env, policy, episodes, limit = 1000):
+    """
+    Run a batch of episodes of a vectorized environment using the given policy.
+
+    Every agent of the vectorized environment runs the same amount of consecutive episodes, the step limit is
+    enforced by the environment through truncation. Episodes finished by an agent after its share are discarded,
+    so that short episodes are not over-represented in the results.
+
+    Args:
+        env (VectorGridEnv): The vectorized environment to run the episodes.
+        policy (numpy.ndarray): The policy to follow during the episodes.
+        episodes (signedinteger): The amount episodes to run.
+        limit (signedinteger): The maximum amount steps to take in each episode. Defaults to 1000.
+
+    Returns:
+        tuple: A tuple containing:
+            - numpy.ndarray: Whether each episode terminated before the step limit was reached;
+            - numpy.ndarray: The total reward accumulated during each episode.
+
+    """
+    env.limit = limit
+    policy    = np.asarray(policy)
+    states, _ = env.reset()
+    agents    = np.arange(env.num_envs)
+    rounds    = -(-episodes // env.num_envs)
+
+    terminated = np.zeros((rounds, env.num_envs), dtype = bool)
+    rewards    = np.zeros((rounds, env.num_envs))
+    counts     = np.zeros(env.num_envs, dtype = int)
+    returns    = np.zeros(env.num_envs)
+
+    while counts.min() < rounds:
+        states, next_rewards, done, truncated, _ = env.step(policy[states])
+
+        returns += next_rewards
+        finished = (done | truncated) & (counts < rounds)
+
+        terminated[counts[finished], agents[finished]] = done[finished]
+        rewards[counts[finished], agents[finished]]    = returns[finished]
+
+        counts[finished] += 1
+
+        returns[done | truncated] = 0
+
+    return terminated.flatten()[:episodes], rewards.flatten()[:episodes]
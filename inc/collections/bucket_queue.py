@@ -0,0 +1,195 @@
+from collections import deque
+
+
+class NodeBucketQueue:
+    """
+    A bucketed (Dial) priority queue for nodes with small non-negative integer values.
+
+    Nodes are stored in FIFO buckets indexed by their value, and a cursor moves forward over the buckets to find
+    the next node, so adding and removing a node take O(1) amortized time when the values grow monotonically
+    (e.g. the path costs of uniform cost search, or the f-values of A* with a consistent heuristic).
+    Replaced nodes are marked as removed and skipped when their bucket is reached.
+
+    Attributes:
+        queue (list of deque): The buckets of nodes, indexed by value.
+        node_dict (dict): A dictionary to store nodes with their state as the key for quick access.
+        cursor (signedinteger): The index of the lowest bucket which may contain a node.
+        length (signedinteger): The current length of the bucket queue.
+        stale (signedinteger): The amount replaced nodes still stored in the buckets.
+
+    """
+
+    def __init__(self):
+        """
+        Initializes a new instance of the bucket queue.
+
+        """
+        self.queue     = []
+        self.node_dict = {}
+        self.cursor    = 0
+        self.length    = 0
+        self.stale     = 0
+
+
+    def is_empty(self):
+        """
+        Check if the bucket queue is empty.
+
+        Returns:
+            bool: `True` if the bucket queue is empty, `False` otherwise.
+
+        """
+        return self.length == 0
+
+
+    def add(self, node):
+        """
+        Add a node to the bucket queue.
+
+        A node whose state is already in the bucket queue replaces the existing one.
+
+        Args:
+            node (Node): The node to be added to the bucket queue. It is assumed that node has a `state` attribute
+                and a non-negative integer `value`.
+
+        Raises:
+            ValueError: If the value of the node is not a non-negative integer.
+
+        """
+        if node.state in self.node_dict:
+            self.replace(node)
+
+            return
+
+        self.push(node)
+
+        self.node_dict[node.state]  = node
+        self.length                += 1
+
+
+    def push(self, node):
+        """
+        Append a node to the bucket of its value, moving the cursor back if needed.
+
+        Args:
+            node (Node): The node to be appended.
+
+        Raises:
+            ValueError: If the value of the node is not a non-negative integer.
+
+        """
+        index = int(node.value)
+
+        if (index != node.value) or (index < 0):
+            raise ValueError("The bucket queue only supports non-negative integer values, got {}.".format(node.value))
+
+        while len(self.queue) <= index:
+            self.queue.append(deque())
+
+        self.queue[index].append(node)
+
+        self.cursor = min(self.cursor, index)
+
+
+    def remove(self):
+        """
+        Removes and returns the highest priority node from the bucket queue.
+
+        Nodes with the same value are returned in the order they were added.
+
+        Returns:
+            Node: The highest priority node that has not been marked as removed.
+
+        Raises:
+            IndexError: If the bucket queue is empty.
+
+        """
+        if self.length == 0:
+            raise IndexError("remove from an empty bucket queue")
+
+        while True:
+            bucket = self.queue[self.cursor]
+
+            while bucket:
+                node = bucket.popleft()
+
+                if not node.removed:
+                    del self.node_dict[node.state]
+
+                    self.length -= 1
+
+                    return node
+
+                self.stale -= 1
+
+            self.cursor += 1
+
+
+    def replace(self, node):
+        """
+        Replace an existing node in the bucket queue with a new node.
+
+        Args:
+            node (Node): The new node to replace the existing node with. The node should have a `state` attribute.
+
+        Raises:
+            ValueError: If the value of the node is not a non-negative integer.
+
+        """
+        self.push(node)
+
+        self.node_dict[node.state].removed = True
+        self.node_dict[node.state]         = node
+
+        self.stale += 1
+
+
+    @property
+    def heap_size(self):
+        """
+        int: The amount entries stored in the buckets, including the replaced nodes.
+
+        """
+        return self.length + self.stale
+
+
+    def __len__(self):
+        """
+        Return the amount nodes in the bucket queue.
+
+        Returns:
+            int: The amount nodes in the bucket queue.
+
+        """
+        return self.length
+
+
+    def __contains__(self, node):
+        """
+        Check if a node is in the bucket queue.
+
+        Args:
+            node (Node): The node to check for membership in the bucket queue.
+
+        Returns:
+            bool: `True` if the node is in the bucket queue, `False` otherwise.
+
+        """
+        return node in self.node_dict
+
+
+    def __getitem__(self, node):
+        """
+        Retrieve the value associated with the given node from the bucket queue.
+
+        Args:
+            node (Node): The key for which the value needs to be retrieved.
+
+        Returns:
+            Node: The value associated with the given key.
+
+        Raises:
+            KeyError: If the node is not present in the bucket queue.
+
+        """
+        return self.node_dict[node]
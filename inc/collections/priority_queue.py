@@ -1,14 +1,17 @@
-import heapq
-
-
 class NodePriorityQueue:
     """
-    A priority queue implementation for nodes, using a heap and a dictionary for fast access.
+    A priority queue implementation for nodes, using an indexed binary heap keyed by the state of the nodes.
+
+    Every entry of the heap records its own position, so the node of a state can be replaced in place and
+    moved up or down the heap in O(log n), without leaving stale entries behind.
+
+    The entries are `[value, -path_cost, counter, node, position]` lists, compared without calling `Node.__lt__`:
+    nodes of equal value pop deepest first, then in insertion order.
 
     Attributes:
-        queue (list of Node): The heap-based priority queue.
-        node_dict (dict): A dictionary to store nodes with their state as the key for quick access.
-        length (signedinteger): The current length of the priority queue.
+        queue (list of list): The heap-based priority queue, as `[value, -path_cost, counter, node, position]` entries.
+        entries (dict): A dictionary mapping the state of each node to its entry in the heap.
+        counter (int): The amount entries created, breaking the ties between nodes of equal value and depth.
 
     """
 
@@ -17,9 +20,9 @@ class NodePriorityQueue:
         Initializes a new instance of the priority queue.
 
         """
-        self.queue     = []
-        self.node_dict = {}
-        self.length    = 0
+        self.queue   = []
+        self.entries = {}
+        self.counter = 0
 
 
     def is_empty(self):
@@ -30,21 +33,32 @@ class NodePriorityQueue:
             bool: `True` if the priority queue is empty, `False` otherwise.
 
         """
-        return self.length == 0
+        return not self.queue
 
 
     def add(self, node):
         """
         Add a node to the priority queue.
 
+        A node whose state is already in the priority queue replaces the existing one.
+
         Args:
             node (Node): The node to be added to the priority queue. It is assumed that node has a `state` attribute.
 
         """
-        heapq.heappush(self.queue, node)
+        if node.state in self.entries:
+            self.replace(node)
+
+            return
+
+        self.counter += 1
+
+        entry = [node.value, -node.path_cost, self.counter, node, len(self.queue)]
+
+        self.queue.append(entry)
+        self.entries[node.state] = entry
 
-        self.node_dict[node.state]  = node
-        self.length                += 1
+        self.sift_down(0, entry[4])
 
 
     def remove(self):
@@ -52,38 +66,169 @@ class NodePriorityQueue:
         Removes and returns the highest priority node from the priority queue.
 
         Returns:
-            Node: The highest priority node that has not been marked as removed.
+            Node: The highest priority node.
 
         Raises:
             IndexError: If the priority queue is empty.
 
         """
-        while True:
-            node = heapq.heappop(self.queue)
+        last = self.queue.pop()
 
-            if not node.removed:
-                if node.state in self.node_dict:
-                    del self.node_dict[node.state]
+        if self.queue:
+            entry         = self.queue[0]
+            self.queue[0] = last
 
-                self.length -= 1
+            self.sift_up(0)
+        else:
+            entry = last
+
+        del self.entries[entry[3].state]
+
+        return entry[3]
+
+
+    def discard(self, state):
+        """
+        Remove the node of a state from the priority queue, if present.
+
+        The last entry of the heap takes its position, then it is moved up or down the heap according to its value.
+
+        Args:
+            state (signedinteger): The state of the node to be removed.
 
-                return node
+        """
+        entry = self.entries.pop(state, None)
+
+        if entry is None:
+            return
+
+        last = self.queue.pop()
+
+        entry[3].removed = True
+
+        if last is not entry:
+            position             = entry[4]
+            self.queue[position] = last
+            last[4]              = position
+
+            # The last entry comes from another subtree, so it can be smaller than its new parent as well as greater
+            # than its new children.
+            if last < entry:
+                self.sift_down(0, position)
+            else:
+                self.sift_up(position)
+
+
+    def peek(self):
+        """
+        Return the highest priority node without removing it from the priority queue.
+
+        Returns:
+            Node: The highest priority node.
+
+        Raises:
+            IndexError: If the priority queue is empty.
+
+        """
+        return self.queue[0][3]
 
 
     def replace(self, node):
         """
         Replace an existing node in the priority queue with a new node.
 
+        The new node takes the entry of the existing one. A lower value (e.g. a decrease-key) only moves it towards
+        the root, any other value moves it towards the leaves first.
+
         Args:
             node (Node): The new node to replace the existing node with. The node should have a `state` attribute.
 
         """
-        self.node_dict[node.state].removed = True
-        self.node_dict[node.state]         = node
+        entry = self.entries[node.state]
+        key   = [node.value, -node.path_cost]
 
-        self.length -= 1
+        self.counter    += 1
+        entry[3].removed = True
 
-        self.add(node)
+        lower    = key < entry[:2]
+        entry[:] = key + [self.counter, node, entry[4]]
+
+        if lower:
+            self.sift_down(0, entry[4])
+        else:
+            self.sift_up(entry[4])
+
+
+    def sift_down(self, start, position):
+        """
+        Move the entry at the given position towards the root of the heap, until its parent is not greater.
+
+        Args:
+            start (signedinteger): The position of the root of the heap.
+            position (signedinteger): The position of the entry to be moved.
+
+        """
+        queue = self.queue
+        entry = queue[position]
+
+        while position > start:
+            parent_position = (position - 1) >> 1
+            parent          = queue[parent_position]
+
+            if not entry < parent:
+                break
+
+            queue[position] = parent
+            parent[4]       = position
+            position        = parent_position
+
+        queue[position] = entry
+        entry[4]        = position
+
+
+    def sift_up(self, position):
+        """
+        Move the entry at the given position towards the leaves of the heap, until its children are not smaller.
+
+        The entry is first moved down to a leaf along the path of the smaller children, then back up to its place,
+        as `heapq` does.
+
+        Args:
+            position (signedinteger): The position of the entry to be moved.
+
+        """
+        queue       = self.queue
+        end         = len(queue)
+        start       = position
+        entry       = queue[position]
+        child_index = 2 * position + 1
+
+        while child_index < end:
+            right_index = child_index + 1
+
+            if (right_index < end) and not (queue[child_index] < queue[right_index]):
+                child_index = right_index
+
+            child = queue[child_index]
+
+            queue[position] = child
+            child[4]        = position
+            position        = child_index
+            child_index     = 2 * position + 1
+
+        queue[position] = entry
+        entry[4]        = position
+
+        self.sift_down(start, position)
+
+
+    @property
+    def heap_size(self):
+        """
+        int: The amount entries stored in the heap, equal to the amount live nodes.
+
+        """
+        return len(self.queue)
 
 
     def __len__(self):
@@ -94,7 +239,7 @@ class NodePriorityQueue:
             int: The amount nodes in the priority queue.
 
         """
-        return self.length
+        return len(self.queue)
 
 
     def __contains__(self, node):
@@ -108,7 +253,7 @@ class NodePriorityQueue:
             bool: `True` if the node is in the priority queue, `False` otherwise.
 
         """
-        return node in self.node_dict
+        return node in self.entries
 
 
     def __getitem__(self, node):
@@ -125,4 +270,122 @@ class NodePriorityQueue:
             KeyError: If the node is not present in the priority queue.
 
         """
-        return self.node_dict[node]
+        return self.entries[node][3]
+
+
+class TreePriorityQueue(NodePriorityQueue):
+    """
+    A priority queue of nodes keyed by the nodes themselves instead of their states, so several nodes of the same
+    state can be queued at once (e.g. the tree of SMA*), sharing the heap of `NodePriorityQueue`.
+
+    A node already in the priority queue is moved to the place of its current value when added again. With
+    `worst_first`, the keys are negated: the nodes of highest value pop first, the shallowest first among them.
+
+    Attributes:
+        queue (list of list): The heap-based priority queue, as `[value, -path_cost, counter, node, position]` entries,
+            negated but for the counter and the position with `worst_first`.
+        entries (dict): A dictionary mapping each node to its entry in the heap.
+        counter (int): The amount entries created or moved, breaking the ties between nodes of equal value and depth.
+        sign (int): 1 to pop the lowest values first, -1 to pop the highest values first.
+
+    """
+
+    def __init__(self, worst_first = False):
+        """
+        Initializes a new instance of the priority queue.
+
+        Args:
+            worst_first (bool, optional): Whether the nodes of highest value pop first. Defaults to `False`.
+
+        """
+        super().__init__()
+
+        self.sign = -1 if worst_first else 1
+
+
+    def add(self, node):
+        """
+        Add a node to the priority queue, or move it to the place of its current value if it is already queued.
+
+        Args:
+            node (Node): The node to be added to the priority queue.
+
+        """
+        entry = self.entries.get(node)
+        key   = [self.sign * node.value, -self.sign * node.path_cost]
+
+        self.counter += 1
+
+        if entry is None:
+            entry = key + [self.counter, node, len(self.queue)]
+
+            self.queue.append(entry)
+            self.entries[node] = entry
+
+            self.sift_down(0, entry[4])
+        elif key < entry[:2]:
+            entry[:3] = key + [self.counter]
+
+            self.sift_down(0, entry[4])
+        else:
+            entry[:3] = key + [self.counter]
+
+            self.sift_up(entry[4])
+
+
+    def remove(self):
+        """
+        Removes and returns the highest priority node from the priority queue.
+
+        Returns:
+            Node: The highest priority node.
+
+        Raises:
+            IndexError: If the priority queue is empty.
+
+        """
+        node = self.peek()
+
+        self.discard(node)
+
+        return node
+
+
+    def discard(self, node):
+        """
+        Remove a node from the priority queue, if present.
+
+        The last entry of the heap takes its position, then it is moved up or down the heap according to its value.
+        Unlike `NodePriorityQueue`, the node is not marked as removed, since it is still in the tree.
+
+        Args:
+            node (Node): The node to be removed.
+
+        """
+        entry = self.entries.pop(node, None)
+
+        if entry is None:
+            return
+
+        last = self.queue.pop()
+
+        if last is not entry:
+            position             = entry[4]
+            self.queue[position] = last
+            last[4]              = position
+
+            if last < entry:
+                self.sift_down(0, position)
+            else:
+                self.sift_up(position)
+
+
+    def replace(self, node):
+        """
+        Move a node already in the priority queue to the place of its current value.
+
+        Args:
+            node (Node): The node whose value changed.
+
+        """
+        self.add(node)
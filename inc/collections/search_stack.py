@@ -0,0 +1,64 @@
+class SearchStack:
+    """
+    An explicit stack for depth-first searches, made of buffers indexed by depth and reused across searches.
+
+    The buffers only grow, so iterative deepening allocates them once and then pays pure re-expansion
+    on every iteration.
+
+    Attributes:
+        states (list of int): The state on the current path at each depth.
+        children (list of list): The successors of the state at each depth.
+        actions (list of int): The index of the next successor to visit at each depth.
+        finished (list of bool): Whether a successor of the state at each depth was cut off by the depth limit.
+        expand (function): The function returning the successors of a state.
+
+    """
+
+    def __init__(self, env):
+        """
+        Initializes a new empty stack for the given environment.
+
+        Deterministic environments read the successors from rows of the successor table converted once to lists,
+        the others sample them through `env.successors`.
+
+        Args:
+            env (GridEnv): The environment to search.
+
+        """
+        self.states   = []
+        self.children = []
+        self.actions  = []
+        self.finished = []
+
+        if env.successors_table is not None:
+            self.expand = env.successors_table.tolist().__getitem__
+        else:
+            self.expand = env.successors
+
+
+    def reserve(self, depth):
+        """
+        Grow the buffers to hold a path of the given depth.
+
+        Args:
+            depth (signedinteger): The deepest index to be stored.
+
+        """
+        missing = depth + 1 - len(self.states)
+
+        if missing > 0:
+            self.states   += [0] * missing
+            self.children += [None] * missing
+            self.actions  += [0] * missing
+            self.finished += [False] * missing
+
+
+    def __len__(self):
+        """
+        Return the amount depths the buffers can hold.
+
+        Returns:
+            int: The amount depths the buffers can hold.
+
+        """
+        return len(self.states)
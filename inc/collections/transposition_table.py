@@ -0,0 +1,100 @@
+class TranspositionTable:
+    """
+    A bounded transposition table for iterative deepening, recording the shallowest depth at which each state
+    was reached.
+
+    A state reached deeper than its recorded depth, or again at the same depth within the same iteration, cannot
+    lead anywhere its shallower occurrence does not, so its re-expansion is pruned. The table is a fixed array of
+    slots indexed by state: a slot holding another state is taken over when its entry is stale (recorded in an
+    earlier iteration) or deeper than the new one.
+
+    Attributes:
+        capacity (signedinteger): The amount slots of the table.
+        keys (list of int): The state stored in each slot, -1 for the empty slots.
+        depths (list of int): The shallowest depth at which the state of each slot was reached.
+        generations (list of int): The iteration in which the state of each slot was last reached.
+        generation (signedinteger): The current iteration.
+        size (signedinteger): The amount filled slots.
+
+    """
+
+    def __init__(self, capacity = 65536):
+        """
+        Initializes a new empty transposition table.
+
+        Args:
+            capacity (int, optional): The amount slots of the table. Defaults to 65536.
+
+        """
+        self.capacity    = capacity
+        self.keys        = [-1] * capacity
+        self.depths      = [0] * capacity
+        self.generations = [0] * capacity
+        self.generation  = 0
+        self.size        = 0
+
+
+    def new_iteration(self):
+        """
+        Start a new iteration, after which every state may be expanded again at its shallowest depth.
+
+        """
+        self.generation += 1
+
+
+    def probe(self, state, depth):
+        """
+        Check whether the expansion of a state at the given depth can be pruned, recording it otherwise.
+
+        Args:
+            state (signedinteger): The state reached.
+            depth (signedinteger): The depth at which the state was reached.
+
+        Returns:
+            bool: `True` if the state was already reached at a shallower depth, or at the same depth in the current
+                iteration, `False` otherwise.
+
+        """
+        slot = state % self.capacity
+        key  = self.keys[slot]
+
+        if key == state:
+            best = self.depths[slot]
+
+            if (depth > best) or ((depth == best) and (self.generations[slot] == self.generation)):
+                return True
+        elif key == -1:
+            self.size += 1
+        elif (self.generations[slot] == self.generation) and (depth > self.depths[slot]):
+            return False
+
+        self.keys[slot]        = state
+        self.depths[slot]      = depth
+        self.generations[slot] = self.generation
+
+        return False
+
+
+    def __len__(self):
+        """
+        Return the amount states in the transposition table.
+
+        Returns:
+            int: The amount states in the transposition table.
+
+        """
+        return self.size
+
+
+    def __contains__(self, state):
+        """
+        Check if a state is in the transposition table.
+
+        Args:
+            state (signedinteger): The state to check for membership in the transposition table.
+
+        Returns:
+            bool: `True` if the state is in the transposition table, `False` otherwise.
+
+        """
+        return self.keys[state % self.capacity] == state
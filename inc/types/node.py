@@ -12,6 +12,9 @@ class Node:
 
     """
 
+    # Nodes are allocated at every expansion: fixed slots instead of a `__dict__` keep each of them small.
+    __slots__ = ("state", "parent", "path_cost", "depth_cost", "value", "removed")
+
     def __init__(self, state, parent = None, path_cost = 0, value = 0):
         """
         Initialize a new node.
@@ -0,0 +1,132 @@
+import numpy as np
+
+from array import array
+
+
+class NodePool:
+    """
+    A struct-of-arrays store of search nodes, addressed by integer handles.
+
+    Every field of the nodes is kept in its own typed array, so a node costs a few machine words instead of a Python
+    object, and adding one is a handful of appends. The fields can be viewed as NumPy arrays without copies.
+
+    Attributes:
+        states (array.array): The state represented by each node.
+        parents (array.array): The handle of the parent of each node, -1 for the roots.
+        path_costs (array.array): The cost to reach each node from the start node.
+        values (array.array): The value associated with each node.
+
+    """
+
+    def __init__(self):
+        """
+        Initializes a new empty pool.
+
+        """
+        self.states     = array("q")
+        self.parents    = array("q")
+        self.path_costs = array("d")
+        self.values     = array("d")
+
+
+    def add(self, state, parent = -1, path_cost = 0, value = 0):
+        """
+        Add a node to the pool.
+
+        Args:
+            state (signedinteger): The state represented by the node.
+            parent (int, optional): The handle of the parent node, -1 for a root. Defaults to -1.
+            path_cost (int or float, optional): The cost to reach the node from the start node. Defaults to 0.
+            value (int or float, optional): The value associated with the node. Defaults to 0.
+
+        Returns:
+            int: The handle of the new node.
+
+        """
+        self.states.append(state)
+        self.parents.append(parent)
+        self.path_costs.append(path_cost)
+        self.values.append(value)
+
+        return len(self.states) - 1
+
+
+    def path(self, handle):
+        """
+        Constructs the path from the root node to the given node.
+
+        Args:
+            handle (int): The handle of the last node of the path.
+
+        Returns:
+            tuple: A tuple containing the states from the root node (excluded) to the given node in order.
+
+        """
+        path    = []
+        states  = self.states
+        parents = self.parents
+
+        while parents[handle] != -1:
+            path.append(states[handle])
+
+            handle = parents[handle]
+
+        return tuple(reversed(path))
+
+
+    def depth(self, handle):
+        """
+        Compute the depth of a node in the tree.
+
+        Args:
+            handle (int): The handle of the node.
+
+        Returns:
+            int: The amount edges between the root node and the given node.
+
+        """
+        return len(self.path(handle))
+
+
+    def fields(self):
+        """
+        Retrieve the arrays holding the fields of the nodes.
+
+        Returns:
+            tuple of array.array: The states, parents, path costs and values of the nodes.
+
+        """
+        return self.states, self.parents, self.path_costs, self.values
+
+
+    def arrays(self):
+        """
+        View the fields of the nodes as NumPy arrays, without copying them.
+
+        The views are invalidated by the next `add`, which may move the underlying buffers.
+
+        Returns:
+            tuple: A tuple containing the states, parents, path costs and values of the nodes.
+
+        """
+        return tuple(np.frombuffer(field, dtype = field.typecode) for field in self.fields())
+
+
+    @property
+    def nbytes(self):
+        """
+        int: The amount bytes used by the fields of the nodes.
+
+        """
+        return sum(field.itemsize * len(field) for field in self.fields())
+
+
+    def __len__(self):
+        """
+        Return the amount nodes in the pool.
+
+        Returns:
+            int: The amount nodes in the pool.
+
+        """
+        return len(self.states)
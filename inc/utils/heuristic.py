@@ -1,4 +1,11 @@
 import math
+import numpy as np
+
+from collections import OrderedDict
+
+
+# Total size in bytes of the cached heuristic tables: sixteen `int32` tables of a 1001x1001 grid.
+TABLES_BYTES = 2 ** 26
 
 
 def null(p1, p2):
@@ -79,12 +86,215 @@ def chebyshev(p1, p2):
     return max(dx, dy)
 
 
+def null_array(positions, p2):
+    """
+    Calculate the null heuristic for many points at once.
+
+    Args:
+        positions (tuple of numpy.ndarray): The coordinates (x, y) of the points, as two arrays.
+        p2 (tuple): The coordinates (x, y) of the second point.
+
+    Returns:
+        numpy.ndarray: The null heuristic of each point.
+
+    """
+    return np.zeros(len(positions[0]), dtype = np.int64)
+
+
+def manhattan_array(positions, p2):
+    """
+    Calculate the Manhattan distance between many points and a second point at once.
+
+    Args:
+        positions (tuple of numpy.ndarray): The coordinates (x, y) of the points, as two arrays.
+        p2 (tuple): The coordinates (x, y) of the second point.
+
+    Returns:
+        numpy.ndarray: The Manhattan distance of each point from the second point.
+
+    """
+    x1, y1 = positions
+    x2, y2 = p2
+
+    return np.abs(x2 - x1) + np.abs(y2 - y1)
+
+
+def euclidean_array(positions, p2):
+    """
+    Calculate the Euclidean distance between many points and a second point at once.
+
+    Args:
+        positions (tuple of numpy.ndarray): The coordinates (x, y) of the points, as two arrays.
+        p2 (tuple): The coordinates (x, y) of the second point.
+
+    Returns:
+        numpy.ndarray: The Euclidean distance of each point from the second point.
+
+    """
+    x1, y1 = positions
+    x2, y2 = p2
+
+    return np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+
+
+def chebyshev_array(positions, p2):
+    """
+    Calculate the Chebyshev distance between many points and a second point at once.
+
+    Args:
+        positions (tuple of numpy.ndarray): The coordinates (x, y) of the points, as two arrays.
+        p2 (tuple): The coordinates (x, y) of the second point.
+
+    Returns:
+        numpy.ndarray: The Chebyshev distance of each point from the second point.
+
+    """
+    x1, y1 = positions
+    x2, y2 = p2
+
+    return np.maximum(np.abs(x1 - x2), np.abs(y1 - y2))
+
+
+class TableCache:
+    """
+    A least recently used cache of heuristic tables, bounded by the total size of the tables instead of their amount.
+
+    Attributes:
+        capacity (int): The maximum total size in bytes of the cached tables.
+        tables (OrderedDict): The cached tables by key, from the least to the most recently used.
+        nbytes (int): The total size in bytes of the cached tables.
+
+    """
+
+    def __init__(self, capacity = TABLES_BYTES):
+        """
+        Initializes an empty cache.
+
+        Args:
+            capacity (int, optional): The maximum total size in bytes of the cached tables. Defaults to `TABLES_BYTES`.
+
+        """
+        self.capacity = capacity
+        self.tables   = OrderedDict()
+        self.nbytes   = 0
+
+
+    def get(self, key):
+        """
+        Retrieve a cached table, marking it as the most recently used.
+
+        Args:
+            key (tuple): The key of the table.
+
+        Returns:
+            numpy.ndarray: The cached table, or `None` if the table is not cached.
+
+        """
+        table = self.tables.get(key)
+
+        if table is not None:
+            self.tables.move_to_end(key)
+
+        return table
+
+
+    def add(self, key, table):
+        """
+        Cache a table, evicting the least recently used ones until the total size fits the capacity.
+
+        A table larger than the capacity is not cached.
+
+        Args:
+            key (tuple): The key of the table.
+            table (numpy.ndarray): The table to be cached.
+
+        """
+        if table.nbytes > self.capacity:
+            return
+
+        self.tables[key]  = table
+        self.nbytes      += table.nbytes
+
+        while self.nbytes > self.capacity:
+            _, evicted   = self.tables.popitem(last = False)
+            self.nbytes -= evicted.nbytes
+
+
+    def clear(self):
+        """
+        Remove all the cached tables.
+
+        """
+        self.tables.clear()
+
+        self.nbytes = 0
+
+
+    def __len__(self):
+        """
+        Return the amount cached tables.
+
+        Returns:
+            int: The amount cached tables.
+
+        """
+        return len(self.tables)
+
+
+def heuristic_table(rows, cols, goal, heuristic):
+    """
+    Compute the heuristic of every state of a grid towards a goal, caching the most recent tables in `table_cache`.
+
+    The heuristic only depends on the positions of the states, so grids of the same shape share their tables. Integer
+    tables are stored as `int32`, half the size of the default integers.
+
+    Args:
+        rows (int): The number of rows in the grid.
+        cols (int): The number of columns in the grid.
+        goal (int): The index of the goal state.
+        heuristic (function): The heuristic function, taking the positions of two points. Callables with an `array`
+            method (e.g. `LandmarkHeuristic`) compute the table themselves.
+
+    Returns:
+        numpy.ndarray: The read-only heuristic of each state.
+
+    """
+    key   = (rows, cols, goal, heuristic)
+    table = table_cache.get(key)
+
+    if table is not None:
+        return table
+
+    positions = np.divmod(np.arange(rows * cols), cols)
+    goal_pos  = divmod(goal, cols)
+
+    if heuristic in Heuristic.arrays_map:
+        table = Heuristic.arrays_map[heuristic](positions, goal_pos)
+    elif hasattr(heuristic, "array"):
+        table = heuristic.array(positions, goal_pos)
+    else:
+        table = np.array([heuristic(position, goal_pos) for position in zip(*(axis.tolist() for axis in positions))])
+
+    if np.issubdtype(table.dtype, np.integer):
+        table = table.astype(np.int32)
+
+    table.setflags(write = False)
+    table_cache.add(key, table)
+
+    return table
+
+
+# The heuristic tables shared by all the searches.
+table_cache = TableCache()
+
+
 class Heuristic:
     """
     A class to represent various heuristic functions.
 
     Attributes:
         functions_map (dict of function): A mapping of heuristic function names to their implementations.
+        arrays_map (dict of function): A mapping of heuristic functions to their implementations over many points.
 
     """
 
@@ -94,3 +304,65 @@ class Heuristic:
         "euclidean": euclidean,
         "chebyshev": chebyshev
     }
+
+    arrays_map = {
+        null:      null_array,
+        manhattan: manhattan_array,
+        euclidean: euclidean_array,
+        chebyshev: chebyshev_array
+    }
+
+
+    @classmethod
+    def register(cls, name, heuristic):
+        """
+        Register a heuristic built for a specific environment (e.g. a `LandmarkHeuristic`) by name.
+
+        Args:
+            name (str): The name of the heuristic.
+            heuristic (function): The heuristic function, taking the positions of two points.
+
+        """
+        cls.functions_map[name] = heuristic
+
+
+    @staticmethod
+    def table(env, heuristic, goal = None):
+        """
+        Retrieve the heuristic of every state of the environment towards a goal.
+
+        Args:
+            env (GridEnv): The environment.
+            heuristic (function): The heuristic function, taking the positions of two points.
+            goal (signedinteger, optional): The index of the goal state, `None` for `env.goal_state`.
+                Defaults to `None`.
+
+        Returns:
+            numpy.ndarray: The read-only `(S,)` array of the heuristic of each state.
+
+        """
+        goal = env.goal_state if goal is None else goal
+
+        return heuristic_table(env.rows, env.cols, int(goal), heuristic)
+
+
+    @staticmethod
+    def values(env, heuristic, goal = None):
+        """
+        Retrieve the heuristic of every state of the environment towards a goal, as a list to be indexed by state.
+
+        The list is built from the cached table on every call, and is not cached itself.
+
+        Args:
+            env (GridEnv): The environment.
+            heuristic (function): The heuristic function, taking the positions of two points.
+            goal (signedinteger, optional): The index of the goal state, `None` for `env.goal_state`.
+                Defaults to `None`.
+
+        Returns:
+            list: The heuristic of each state.
+
+        """
+        goal = env.goal_state if goal is None else goal
+
+        return heuristic_table(env.rows, env.cols, int(goal), heuristic).tolist()
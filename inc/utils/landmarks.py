@@ -0,0 +1,190 @@
+import numpy as np
+
+from scipy.sparse         import csr_matrix
+from scipy.sparse.csgraph import shortest_path
+
+from envs.collections.cache import load_model, save_model
+
+
+class LandmarkHeuristic:
+    """
+    A landmark (ALT) heuristic, bounding the distance between two states with the triangle inequality over the
+    exact distances from and to a few landmark states.
+
+    For every landmark `L`, `d(v, g) >= d(L, g) - d(L, v)` and `d(v, g) >= d(v, L) - d(g, L)`, so the largest of
+    these bounds is an admissible and consistent estimate, much better informed than the geometric heuristics on
+    grids with walls. Instances take the positions of two points like the other heuristics, so they can be passed
+    to every search or registered in `Heuristic.functions_map`.
+
+    Attributes:
+        landmarks (numpy.ndarray): The landmark states.
+        from_distances (numpy.ndarray): The `(K, S)` distances from each landmark to each state, -1 if unreachable.
+        to_distances (numpy.ndarray): The `(K, S)` distances from each state to each landmark, -1 if unreachable.
+        cols (signedinteger): The number of columns in the grid.
+
+    """
+
+    def __init__(self, landmarks, from_distances, to_distances, cols):
+        """
+        Initialize the heuristic from precomputed distances.
+
+        Args:
+            landmarks (numpy.ndarray): The landmark states.
+            from_distances (numpy.ndarray): The `(K, S)` distances from each landmark to each state.
+            to_distances (numpy.ndarray): The `(K, S)` distances from each state to each landmark.
+            cols (signedinteger): The number of columns in the grid.
+
+        """
+        self.landmarks      = landmarks
+        self.from_distances = from_distances
+        self.to_distances   = to_distances
+        self.cols           = cols
+
+
+    @classmethod
+    def build(cls, env, count = 8):
+        """
+        Build the landmark heuristic of an environment, reopening it from the compiled environments cache when
+        available and storing it there otherwise.
+
+        The landmarks are picked by farthest-point selection: the first one is the state farthest from the start,
+        each next one the state farthest from all the landmarks picked so far.
+
+        Args:
+            env (GridEnv): The environment.
+            count (int, optional): The amount landmarks. Defaults to 8.
+
+        Returns:
+            LandmarkHeuristic: The landmark heuristic of the environment.
+
+        """
+        key   = "{}.landmarks{}".format(env.model_key, count)
+        model = load_model(key)
+
+        if model is None:
+            model = cls.build_model(env, count)
+
+            save_model(key, model)
+
+        return cls(model["landmarks"], model["from_distances"], model["to_distances"], env.cols)
+
+
+    @staticmethod
+    def build_model(env, count):
+        """
+        Pick the landmarks and compute the exact breadth-first distances from and to each of them.
+
+        Args:
+            env (GridEnv): The environment.
+            count (int): The amount landmarks.
+
+        Returns:
+            dict of numpy.ndarray: The landmarks, the distances from them and the distances to them.
+
+        """
+        states_n = env.observation_space.n
+        sources  = np.repeat(np.arange(len(env.T_indptr) - 1), np.diff(env.T_indptr)) // env.action_space.n
+        targets  = np.asarray(env.T_indices)
+        kept     = (np.asarray(env.T_data) > 0) & (sources != targets)
+
+        # Edge `s -> s'` for every pair reaching `s'` with a non-zero probability.
+        graph = csr_matrix((np.ones(np.count_nonzero(kept)), (sources[kept], targets[kept])), shape = (states_n, states_n))
+
+        # The landmarks are spread over the undirected grid, since terminal states have no outgoing moves.
+        spread    = (graph + graph.T).tocsr()
+        farthest  = shortest_path(spread, unweighted = True, indices = [env.strt_state])[0]
+        landmarks = []
+        spreads   = []
+
+        for _ in range(count):
+            reachable = np.isfinite(farthest)
+
+            if not reachable.any():
+                break
+
+            landmark = int(np.argmax(np.where(reachable, farthest, -1)))
+
+            if landmark in landmarks:
+                break
+
+            landmarks.append(landmark)
+            spreads.append(shortest_path(spread, unweighted = True, indices = [landmark])[0])
+
+            farthest = np.min(spreads, axis = 0)
+
+        from_distances = shortest_path(graph, unweighted = True, indices = landmarks)
+        to_distances   = shortest_path(graph.T.tocsr(), unweighted = True, indices = landmarks)
+
+        return {
+            "landmarks":      np.array(landmarks, dtype = np.int64),
+            "from_distances": LandmarkHeuristic.compact(from_distances.reshape(len(landmarks), states_n)),
+            "to_distances":   LandmarkHeuristic.compact(to_distances.reshape(len(landmarks), states_n))
+        }
+
+
+    @staticmethod
+    def compact(distances):
+        """
+        Store distances in the smallest signed integer type holding them, with -1 for the unreachable states.
+
+        Args:
+            distances (numpy.ndarray): The distances, infinite for the unreachable states.
+
+        Returns:
+            numpy.ndarray: The distances as integers.
+
+        """
+        finite  = np.isfinite(distances)
+        longest = distances[finite].max(initial = 0)
+        dtype   = np.int16 if longest < np.iinfo(np.int16).max else np.int32
+
+        return np.where(finite, distances, -1).astype(dtype)
+
+
+    def array(self, positions, p2):
+        """
+        Calculate the landmark heuristic between many points and a second point at once.
+
+        Args:
+            positions (tuple of numpy.ndarray): The coordinates (x, y) of the points, as two arrays.
+            p2 (tuple): The coordinates (x, y) of the second point.
+
+        Returns:
+            numpy.ndarray: The landmark heuristic of each point towards the second point.
+
+        """
+        x1, y1 = positions
+        x2, y2 = p2
+
+        states = np.asarray(x1) * self.cols + np.asarray(y1)
+        goal   = x2 * self.cols + y2
+
+        from_states = self.from_distances[:, states].astype(np.int64)
+        from_goal   = self.from_distances[:, goal].astype(np.int64)[:, None]
+        to_states   = self.to_distances[:, states].astype(np.int64)
+        to_goal     = self.to_distances[:, goal].astype(np.int64)[:, None]
+
+        # Bounds involving an unreachable state are left out.
+        from_bounds = np.where((from_states >= 0) & (from_goal >= 0), from_goal - from_states, 0)
+        to_bounds   = np.where((to_states >= 0) & (to_goal >= 0), to_states - to_goal, 0)
+
+        bounds = np.maximum(from_bounds, to_bounds).max(axis = 0, initial = 0)
+
+        return np.maximum(bounds, 0)
+
+
+    def __call__(self, p1, p2):
+        """
+        Calculate the landmark heuristic between two points.
+
+        Args:
+            p1 (tuple): The coordinates (x, y) of the first point.
+            p2 (tuple): The coordinates (x, y) of the second point.
+
+        Returns:
+            int: The landmark heuristic between the two points.
+
+        """
+        x1, y1 = p1
+
+        return int(self.array((np.array([x1]), np.array([y1])), p2)[0])
@@ -18,7 +18,87 @@ def rolling(array, window):
     return np.convolve(array, np.ones(window), mode = "valid") / window
 
 
-def build_path(node):
+def row_positions(indptr, rows):
+    """
+    Compute the positions of the entries of some rows in a sparse (CSR) layout.
+
+    Args:
+        indptr (numpy.ndarray): The offsets of the entries of each row.
+        rows (numpy.ndarray): The sorted rows.
+
+    Returns:
+        numpy.ndarray: The positions of the entries of the rows, row after row.
+
+    """
+    starts = np.asarray(indptr[rows], dtype = np.int64)
+    counts = np.asarray(indptr[np.asarray(rows) + 1], dtype = np.int64) - starts
+    firsts = np.cumsum(counts) - counts
+
+    return np.arange(counts.sum()) + np.repeat(starts - firsts, counts)
+
+
+def splice_rows(indptr, rows, rows_indptr, arrays, rows_arrays):
+    """
+    Replace some rows of a sparse (CSR) layout by new ones, which may hold a different amount of entries.
+
+    When every new row holds as many entries as the one it replaces, the arrays are written in place. Otherwise
+    the arrays are copied once around the replaced rows, without rebuilding the other rows.
+
+    Args:
+        indptr (numpy.ndarray): The offsets of the entries of each row.
+        rows (numpy.ndarray): The sorted rows to be replaced.
+        rows_indptr (numpy.ndarray): The offsets of the entries of each new row, one row per replaced row.
+        arrays (tuple of numpy.ndarray): The arrays aligned with the entries.
+        rows_arrays (tuple of numpy.ndarray): The arrays aligned with the entries of the new rows.
+
+    Returns:
+        tuple: A tuple containing:
+            - numpy.ndarray: The offsets of the entries of each row after the change;
+            - tuple of numpy.ndarray: The arrays aligned with the entries after the change.
+
+    """
+    rows   = np.asarray(rows, dtype = np.int64)
+    starts = np.asarray(indptr[rows], dtype = np.int64)
+    ends   = np.asarray(indptr[rows + 1], dtype = np.int64)
+    counts = np.diff(rows_indptr)
+
+    if np.array_equal(ends - starts, counts) and all(array.flags.writeable for array in arrays):
+        positions = row_positions(indptr, rows)
+
+        for array, row_array in zip(arrays, rows_arrays):
+            array[positions] = row_array
+
+        return indptr, tuple(arrays)
+
+    new_indptr = np.array(indptr)
+    shifts     = np.cumsum(counts - (ends - starts))
+
+    # Every offset after a replaced row moves by the entries added and removed up to that row.
+    for index, row in enumerate(rows.tolist()):
+        end = len(indptr) if index + 1 == len(rows) else int(rows[index + 1]) + 1
+
+        new_indptr[row + 1:end] += shifts[index]
+
+    new_arrays = tuple(np.empty(int(new_indptr[-1]), dtype = array.dtype) for array in arrays)
+    old_start  = 0
+
+    for index, (row, start, end) in enumerate(zip(rows.tolist(), starts.tolist(), ends.tolist())):
+        new_start = int(new_indptr[row])
+        new_end   = int(new_indptr[row + 1])
+
+        for new_array, array, row_array in zip(new_arrays, arrays, rows_arrays):
+            new_array[new_start - (start - old_start):new_start] = array[old_start:start]
+            new_array[new_start:new_end]                         = row_array[rows_indptr[index]:rows_indptr[index + 1]]
+
+        old_start = end
+
+    for new_array, array in zip(new_arrays, arrays):
+        new_array[int(new_indptr[-1]) - (len(array) - old_start):] = array[old_start:]
+
+    return new_indptr, new_arrays
+
+
+def build_path(node, pool = None):
     """
     Constructs the path from the given node to the root node.
 
@@ -27,13 +107,18 @@ def build_path(node):
     returned in the order from the root node to the given node.
 
     Args:
-        node (Node): The starting node from which to build the path. It is assumed that each node has a `parent`
+        node (Node or int): The starting node from which to build the path. It is assumed that each node has a `parent`
             attribute pointing to its parent node and a `state` attribute representing the state of the node.
+            With a `pool`, the handle of the starting node in the pool.
+        pool (NodePool, optional): The pool storing the nodes addressed by handles. Defaults to `None`.
 
     Returns:
         tuple: A tuple containing the states from the root node to the given node in order.
 
     """
+    if pool is not None:
+        return pool.path(node)
+
     path = []
 
     while node.parent is not None:
@@ -44,6 +129,88 @@ def build_path(node):
     return tuple(reversed(path))
 
 
+def build_table_path(parents, state):
+    """
+    Constructs the path from the root state to the given state, following a table of parents.
+
+    Args:
+        parents (numpy.ndarray): The parent of each state, -1 for the root state and the states not reached.
+        state (signedinteger): The last state of the path.
+
+    Returns:
+        tuple: A tuple containing the states from the root state (excluded) to the given state in order.
+
+    """
+    path = []
+
+    while parents[state] != -1:
+        path.append(int(state))
+
+        state = parents[state]
+
+    return tuple(reversed(path))
+
+
+def build_jump_path(node, cols):
+    """
+    Constructs the path from the root node to the given node of a jump point search, filling in the straight
+    segments between consecutive jump points.
+
+    Args:
+        node (Node): The last jump point of the path, each jump point having a `parent` and a `state` attribute.
+        cols (int): The number of columns in the grid.
+
+    Returns:
+        tuple: A tuple containing the states from the root node (excluded) to the given node in order.
+
+    """
+    path = []
+
+    while node.parent is not None:
+        delta = node.state - node.parent.state
+        step  = (1 if delta > 0 else -1) * (1 if abs(delta) < cols else cols)
+
+        path.extend(range(node.state, node.parent.state, -step))
+
+        node = node.parent
+
+    return tuple(reversed(path))
+
+
+def build_meeting_path(forward_parents, backward_parents, state):
+    """
+    Constructs the path of a bidirectional search from the start state to the goal state, through a meeting state.
+
+    Args:
+        forward_parents (dict): The parent of each state reached from the start state, `None` for the start state.
+        backward_parents (dict): The next state towards the goal of each state reached from the goal state,
+            `None` for the goal state.
+        state (signedinteger): The state reached by both searches.
+
+    Returns:
+        tuple: A tuple containing the states from the start state (excluded) to the goal state in order.
+
+    """
+    path = []
+    curr = state
+
+    while forward_parents[curr] is not None:
+        path.append(curr)
+
+        curr = forward_parents[curr]
+
+    path.reverse()
+
+    curr = backward_parents[state]
+
+    while curr is not None:
+        path.append(curr)
+
+        curr = backward_parents[curr]
+
+    return tuple(path)
+
+
 def print_title(title, frame = "#", size = 220):
     """
     Prints a formatted title centered within a line of separators.
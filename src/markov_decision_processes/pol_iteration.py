@@ -2,17 +2,16 @@ import numpy as np
 
 from timeit import default_timer as timer
 
-from inc.ai.reinforcement_learning import q_value
+from inc.ai.reinforcement_learning import q_values
 
 
 def pol_evaluation(env, U, policy, gamma = 0.9, max_error = 1e-3, limit = 1000):
+    states = np.arange(env.observation_space.n)
+
     for _ in range(limit):
         U_i   = U.copy()
-        delta = 0
-
-        for state in range(env.observation_space.n):
-            U[state] = q_value(env, U_i, state, policy[state], gamma)
-            delta    = max(delta, abs(U[state] - U_i[state]))
+        U     = q_values(env, U_i, gamma)[states, policy]
+        delta = np.max(np.abs(U - U_i))
 
         if delta < (max_error * (1 - gamma) / gamma):
             break
@@ -22,26 +21,23 @@ def pol_evaluation(env, U, policy, gamma = 0.9, max_error = 1e-3, limit = 1000):
 
 def pol_iteration(env, gamma = 0.9, max_error = 1e-3, limit = 1000):
     start_time = timer()
-    U          = [0.0 for _ in range(env.observation_space.n)]
-    policy     = [0   for _ in range(env.observation_space.n)]
+    states     = np.arange(env.observation_space.n)
+    U          = np.zeros(env.observation_space.n)
+    policy     = np.zeros(env.observation_space.n, dtype = int)
 
     for _ in range(limit):
-        U         = pol_evaluation(env, U, policy, gamma, max_error, limit)
-        unchanged = True
+        U = pol_evaluation(env, U, policy, gamma, max_error, limit)
 
-        for state in range(env.observation_space.n):
-            best_action = int(np.argmax(
-                [q_value(env, U, state, action, gamma) for action in range(env.action_space.n)]
-            ))
+        q_table     = q_values(env, U, gamma)
+        best_action = q_table.argmax(axis = 1)
 
-            best_utility = q_value(env, U, state, best_action, gamma)
-            curr_utility = q_value(env, U, state, policy[state], gamma)
+        # The vectorized utilities differ from the per state ones by rounding errors only, which must not switch
+        # the action of a state between equally good ones.
+        improved = q_table[states, best_action] > q_table[states, policy] + 1e-12
 
-            if best_utility > curr_utility:
-                policy[state] = best_action
-                unchanged     = False
+        policy[improved] = best_action[improved]
 
-        if unchanged:
+        if not improved.any():
             break
 
     final_time = timer() - start_time
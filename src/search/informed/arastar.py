@@ -0,0 +1,84 @@
+from timeit import default_timer as timer
+
+from inc.collections.priority_queue import NodePriorityQueue
+from inc.types.node                 import Node
+from inc.utils.heuristic            import Heuristic
+from inc.utils.utils                import build_table_path
+
+
+def arastar_gs(env, heuristic, weight = 3.0, step = 0.5, deadline = None, limit = None):
+    values = Heuristic.values(env, heuristic)
+    goal   = env.goal_state
+    end    = None if deadline is None else timer() + deadline
+
+    inf     = float("inf")
+    g       = [inf] * env.observation_space.n
+    parents = [-1] * env.observation_space.n
+
+    g[env.strt_state] = 0
+
+    queue        = NodePriorityQueue()
+    explored     = set()
+    inconsistent = set()
+    time_cost    = 1
+    space_cost   = 1
+    reported     = None
+
+    queue.add(Node(env.strt_state, None, 0, weight * values[env.strt_state]))
+
+    while True:
+        # Expand the states until the goal is not worse than the best weighted value in the queue.
+        while (not queue.is_empty()) and (g[goal] > queue.peek().value):
+            if ((end is not None) and (timer() >= end)) or ((limit is not None) and (time_cost >= limit)):
+                return
+
+            node = queue.remove()
+
+            explored.add(node.state)
+
+            for state in env.successors(node.state):
+                path_cost  = g[node.state] + 1
+                time_cost += 1
+
+                if g[state] <= path_cost:
+                    continue
+
+                g[state]       = path_cost
+                parents[state] = node.state
+
+                if state in explored:
+                    inconsistent.add(state)
+                else:
+                    queue.add(Node(state, None, path_cost, path_cost + weight * values[state]))
+
+            space_cost = max(space_cost, len(queue) + len(explored) + len(inconsistent))
+
+        if g[goal] == inf:
+            yield None, time_cost, space_cost, inf
+            return
+
+        # The cost of the path is at most `bound` times the optimal one, since no state left can do better.
+        lowest = min([g[node.state] + values[node.state] for *_, node, _ in queue.queue] +
+                     [g[state] + values[state] for state in inconsistent], default = g[goal])
+        bound  = max(min(weight, g[goal] / lowest) if lowest > 0 else 1.0, 1.0)
+
+        # A lower weight may leave both the path and its bound unchanged, which is not reported again.
+        if reported != (g[goal], bound):
+            reported = (g[goal], bound)
+
+            yield build_table_path(parents, goal), time_cost, space_cost, bound
+
+        if weight <= 1.0:
+            return
+
+        weight = max(1.0, weight - step)
+
+        # Requeue the inconsistent states with the explored ones cleared, using the new weight.
+        states = [node.state for *_, node, _ in queue.queue] + list(inconsistent)
+        queue  = NodePriorityQueue()
+
+        for state in states:
+            queue.add(Node(state, None, g[state], g[state] + weight * values[state]))
+
+        explored.clear()
+        inconsistent.clear()
@@ -1,20 +1,20 @@
 from inc.collections.priority_queue import NodePriorityQueue
 from inc.types.node                 import Node
+from inc.utils.heuristic            import Heuristic
 from inc.utils.utils                import build_path
 
 
-def astar_ts(env, heuristic, limit = 1000000):
-    strt_pos = env.state_to_position(env.strt_state)
-    goal_pos = env.state_to_position(env.goal_state)
+def astar_ts(env, heuristic, limit = 1000000, queue_type = NodePriorityQueue):
+    values = Heuristic.values(env, heuristic)
 
-    node       = Node(env.strt_state, None, 0, heuristic(strt_pos, goal_pos))
+    node       = Node(env.strt_state, None, 0, values[env.strt_state])
     time_cost  = 1
     space_cost = 1
 
     if node.state == env.goal_state:
         return build_path(node), time_cost, space_cost
 
-    queue = NodePriorityQueue()
+    queue = queue_type()
     queue.add(node)
 
     while not queue.is_empty():
@@ -27,11 +27,8 @@ def astar_ts(env, heuristic, limit = 1000000):
         if node.state == env.goal_state:
             return build_path(node), time_cost, space_cost
 
-        for action in range(env.action_space.n):
-            state    = env.sample(node.state, action)
-            position = env.state_to_position(state)
-
-            child      = Node(state, node, path_cost, path_cost + heuristic(position, goal_pos))
+        for state in env.successors(node.state):
+            child      = Node(state, node, path_cost, path_cost + values[state])
             time_cost += 1
 
             if child.state not in queue:
@@ -45,18 +42,20 @@ def astar_ts(env, heuristic, limit = 1000000):
     return None, time_cost, space_cost
 
 
-def astar_gs(env, heuristic):
-    strt_pos = env.state_to_position(env.strt_state)
-    goal_pos = env.state_to_position(env.goal_state)
+def astar_gs(env, heuristic, queue_type = NodePriorityQueue, start = None, goal = None):
+    start = env.strt_state if start is None else start
+    goal  = env.goal_state if goal is None else goal
+
+    values = Heuristic.values(env, heuristic, goal)
 
-    node       = Node(env.strt_state, None, 0, heuristic(strt_pos, goal_pos))
+    node       = Node(start, None, 0, values[start])
     time_cost  = 1
     space_cost = 1
 
-    if node.state == env.goal_state:
+    if node.state == goal:
         return build_path(node), time_cost, space_cost
 
-    queue    = NodePriorityQueue()
+    queue    = queue_type()
     explored = set()
 
     queue.add(node)
@@ -65,16 +64,13 @@ def astar_gs(env, heuristic):
         node      = queue.remove()
         path_cost = node.path_cost + 1
 
-        if node.state == env.goal_state:
+        if node.state == goal:
             return build_path(node), time_cost, space_cost
 
         explored.add(node.state)
 
-        for action in range(env.action_space.n):
-            state    = env.sample(node.state, action)
-            position = env.state_to_position(state)
-
-            child      = Node(state, node, path_cost, path_cost + heuristic(position, goal_pos))
+        for state in env.successors(node.state):
+            child      = Node(state, node, path_cost, path_cost + values[state])
             time_cost += 1
 
             if (child.state not in explored) and (child.state not in queue):
@@ -0,0 +1,81 @@
+from inc.collections.priority_queue      import NodePriorityQueue
+from inc.collections.transposition_table import TranspositionTable
+from inc.types.node                      import Node
+from inc.utils.heuristic                 import Heuristic
+from inc.utils.utils                     import build_path
+
+
+def beam_gs(env, heuristic, width = 64, memory = 1000, table = None):
+    values    = Heuristic.values(env, heuristic)
+    table     = TranspositionTable() if table is None else table
+    actions_n = env.action_space.n
+
+    node       = Node(env.strt_state, None, 0, values[env.strt_state])
+    time_cost  = 1
+    space_cost = 1
+
+    if node.state == env.goal_state:
+        return build_path(node), time_cost, space_cost
+
+    table.new_iteration()
+    table.probe(node.state, 0)
+
+    layer = [node]
+
+    # The nodes kept alive at each depth: the layer, then the ancestors its parent links keep in memory.
+    levels   = [[node]]
+    retained = 1
+
+    while layer:
+        queue     = NodePriorityQueue()
+        path_cost = layer[0].path_cost + 1
+
+        for node in layer:
+            for state in env.successors(node.state):
+                child      = Node(state, node, path_cost, path_cost + values[state])
+                time_cost += 1
+
+                if child.state == env.goal_state:
+                    return build_path(child), time_cost, space_cost
+
+                # The states kept in an earlier layer are reached again by a longer path.
+                if child.state in table:
+                    continue
+
+                if (child.state not in queue) or (queue[child.state].value > child.value):
+                    queue.add(child)
+
+        space_cost = max(space_cost, retained + len(queue))
+
+        # Only the best children are kept, the others are forgotten along with the ancestors left without them.
+        layer = [queue.remove() for _ in range(min(width, len(queue)))]
+
+        levels.append(layer)
+
+        retained += len(layer)
+
+        while True:
+            for depth in range(len(levels) - 2, -1, -1):
+                parents = {child.parent for child in levels[depth + 1]}
+
+                if len(parents) == len(levels[depth]):
+                    break
+
+                retained      -= len(levels[depth]) - len(parents)
+                levels[depth]  = parents
+
+            # Every node of the layer needs room for itself and its children next to the ancestors kept alive, so the
+            # layer narrows as the path gets longer, and the search fails once not even one node fits.
+            capacity = (memory - retained + len(layer)) // (actions_n + 1)
+
+            if len(layer) <= capacity:
+                break
+
+            retained   -= len(layer) - capacity
+            layer       = layer[:capacity]
+            levels[-1]  = layer
+
+        for node in layer:
+            table.probe(node.state, path_cost)
+
+    return None, time_cost, space_cost
@@ -0,0 +1,65 @@
+from inc.collections.priority_queue import NodePriorityQueue
+from inc.types.node                 import Node
+from inc.utils.heuristic            import Heuristic
+from inc.utils.utils                import build_meeting_path
+
+
+def biastar_gs(env, heuristic):
+    time_cost  = 1
+    space_cost = 1
+
+    if env.strt_state == env.goal_state:
+        return (), time_cost, space_cost
+
+    # Half the difference of the estimates towards the goal and towards the start: being consistent in both
+    # directions, both searches run on the same reduced costs and stop once they cannot improve the best meeting.
+    potential = ((Heuristic.table(env, heuristic) - Heuristic.table(env, heuristic, env.strt_state)) / 2).tolist()
+
+    # Index 0 is the forward search through the successors, index 1 the backward one through the predecessors.
+    queues   = [NodePriorityQueue(), NodePriorityQueue()]
+    explored = [set(), set()]
+    parents  = [{env.strt_state: None}, {env.goal_state: None}]
+    costs    = [{env.strt_state: 0}, {env.goal_state: 0}]
+    expand   = [env.successors, env.predecessors]
+    signs    = [1, -1]
+
+    queues[0].add(Node(env.strt_state, None, 0, potential[env.strt_state]))
+    queues[1].add(Node(env.goal_state, None, 0, -potential[env.goal_state]))
+
+    best_cost  = float("inf")
+    best_state = None
+    time_cost += 1
+
+    while not (queues[0].is_empty() or queues[1].is_empty()):
+        if queues[0].peek().value + queues[1].peek().value >= best_cost:
+            break
+
+        side  = 0 if len(queues[0]) <= len(queues[1]) else 1
+        other = 1 - side
+
+        node      = queues[side].remove()
+        path_cost = node.path_cost + 1
+
+        explored[side].add(node.state)
+
+        for state in expand[side](node.state):
+            time_cost += 1
+
+            if (state in explored[side]) or (costs[side].get(state, path_cost + 1) <= path_cost):
+                continue
+
+            parents[side][state] = node.state
+            costs[side][state]   = path_cost
+
+            queues[side].add(Node(state, node, path_cost, path_cost + signs[side] * potential[state]))
+
+            if (state in costs[other]) and (path_cost + costs[other][state] < best_cost):
+                best_cost  = path_cost + costs[other][state]
+                best_state = state
+
+        space_cost = max(space_cost, len(queues[0]) + len(queues[1]) + len(explored[0]) + len(explored[1]))
+
+    if best_state is None:
+        return None, time_cost, space_cost
+
+    return build_meeting_path(parents[0], parents[1], best_state), time_cost, space_cost
@@ -0,0 +1,213 @@
+from inc.collections.priority_queue import NodePriorityQueue
+from inc.types.node                 import Node
+from inc.utils.heuristic            import manhattan
+
+
+class DStarLite:
+    """
+    An incremental planner (D* Lite) keeping its search between calls, so a change of the grid only repairs the
+    part of the search it affects instead of replanning from scratch.
+
+    The search runs backward from the goal: `g` is the distance to the goal of each state found so far and `rhs`
+    its one-step lookahead from the successors. A state is consistent when both agree, and only the inconsistent
+    states are kept in the queue, ordered by the key `(min(g, rhs) + h + km, min(g, rhs))`.
+
+    Attributes:
+        env (GridEnv): The environment, with deterministic dynamics.
+        heuristic (function): The heuristic function, taking the positions of two points.
+        start (int): The index of the state the path starts from.
+        start_pos (tuple): The position (row, col) of the start state, the heuristic being computed towards it.
+        goal (int): The index of the goal state.
+        g (list of float): The distance to the goal of each state.
+        rhs (list of float): The one-step lookahead distance to the goal of each state.
+        km (int): The sum of the heuristic between the successive start states, keeping the old keys valid.
+        queue (NodePriorityQueue): The inconsistent states, keyed by state.
+        expansions (int): The amount of states expanded since the creation of the planner.
+
+    """
+
+    def __init__(self, env, heuristic = manhattan, start = None, goal = None):
+        """
+        Initialize the planner, queueing the goal state.
+
+        Args:
+            env (GridEnv): The environment, with deterministic dynamics.
+            heuristic (function, optional): The heuristic function. Defaults to `manhattan`.
+            start (int, optional): The index of the start state, `None` for `env.strt_state`. Defaults to `None`.
+            goal (int, optional): The index of the goal state, `None` for `env.goal_state`. Defaults to `None`.
+
+        Raises:
+            ValueError: If the dynamics of the environment are stochastic.
+
+        """
+        if env.successors_table is None:
+            raise ValueError("Incremental planning needs an environment with deterministic dynamics.")
+
+        self.env        = env
+        self.heuristic  = heuristic
+        self.start      = int(env.strt_state if start is None else start)
+        self.goal       = int(env.goal_state if goal is None else goal)
+        self.g          = [float("inf")] * env.observation_space.n
+        self.rhs        = [float("inf")] * env.observation_space.n
+        self.km         = 0
+        self.queue      = NodePriorityQueue()
+        self.expansions = 0
+
+        self.start_pos  = env.state_to_position(self.start)
+        self.successors = env.successors_table.tolist()
+
+        self.rhs[self.goal] = 0
+
+        self.queue.add(Node(self.goal, None, 0, self.key(self.goal)))
+
+
+    def key(self, state):
+        """
+        Compute the key of a state in the queue.
+
+        Args:
+            state (int): The index of the state.
+
+        Returns:
+            tuple: The key `(min(g, rhs) + h + km, min(g, rhs))` of the state.
+
+        """
+        distance = min(self.g[state], self.rhs[state])
+
+        return distance + self.heuristic(self.env.state_to_position(state), self.start_pos) + self.km, distance
+
+
+    def update_state(self, state):
+        """
+        Recompute the lookahead of a state from its successors, and queue it only if it is inconsistent.
+
+        Args:
+            state (int): The index of the state.
+
+        """
+        if state != self.goal:
+            # Walls have no successors (-1) and the bounces back on the same state never shorten a path.
+            distances = [self.g[successor] + 1 for successor in self.successors[state] if successor not in (-1, state)]
+
+            self.rhs[state] = min(distances, default = float("inf"))
+
+        self.queue.discard(state)
+
+        if self.g[state] != self.rhs[state]:
+            self.queue.add(Node(state, None, 0, self.key(state)))
+
+
+    def compute_path(self):
+        """
+        Expand the inconsistent states until the start state is consistent and no queued key is lower than its own.
+
+        Returns:
+            tuple: A tuple containing:
+                - int: The amount of states expanded;
+                - int: The maximum amount of states in the queue.
+
+        """
+        time_cost  = 0
+        space_cost = len(self.queue)
+
+        while not self.queue.is_empty():
+            node = self.queue.peek()
+
+            if not ((node.value < self.key(self.start)) or (self.rhs[self.start] != self.g[self.start])):
+                break
+
+            state      = node.state
+            key        = self.key(state)
+            time_cost += 1
+
+            if node.value < key:
+                self.queue.add(Node(state, None, 0, key))
+            elif self.g[state] > self.rhs[state]:
+                self.g[state] = self.rhs[state]
+                self.queue.remove()
+
+                for predecessor in self.env.predecessors(state):
+                    self.update_state(predecessor)
+            else:
+                self.g[state] = float("inf")
+
+                for predecessor in self.env.predecessors(state) + [state]:
+                    self.update_state(predecessor)
+
+            space_cost = max(space_cost, len(self.queue))
+
+        self.expansions += time_cost
+
+        return time_cost, space_cost
+
+
+    def plan(self):
+        """
+        Repair the search and extract a shortest path from the start state, following the lowest distances.
+
+        The path is `None` as well if following the lowest distances leads to a state without a finite distance or
+        back to a state already on the path, which a consistent search never does.
+
+        Returns:
+            tuple: A tuple containing:
+                - tuple: The states from the start state (excluded) to the goal state, `None` if not reachable;
+                - int: The amount of states expanded by this call;
+                - int: The maximum amount of states in the queue during this call.
+
+        """
+        time_cost, space_cost = self.compute_path()
+
+        path    = []
+        state   = self.start
+        visited = {state}
+
+        while state != self.goal:
+            if self.g[state] == float("inf"):
+                return None, time_cost, space_cost
+
+            # Walls have no successors (-1), and -1 would otherwise index the distance of the last state.
+            state = min(
+                (successor for successor in self.successors[state] if successor != -1),
+                key = self.g.__getitem__, default = state
+            )
+
+            if state in visited:
+                return None, time_cost, space_cost
+
+            visited.add(state)
+            path.append(state)
+
+        return tuple(path), time_cost, space_cost
+
+
+    def move_to(self, state):
+        """
+        Move the start of the path to a new state (e.g. the position reached by the agent).
+
+        Args:
+            state (int): The index of the new start state.
+
+        """
+        new_pos = self.env.state_to_position(state)
+
+        self.km        += self.heuristic(self.start_pos, new_pos)
+        self.start      = int(state)
+        self.start_pos  = new_pos
+
+
+    def update_cells(self, changes):
+        """
+        Change the type of some cells of the grid, then update the lookahead of the states whose moves changed.
+
+        Args:
+            changes (dict): A dictionary mapping the positions (row, col) of the cells to their new cell types.
+
+        """
+        # The moves of a changed cell and of its neighbours towards it are the only ones changing.
+        affected = self.env.update_cells(changes).tolist()
+
+        for state in affected:
+            self.successors[state] = self.env.successors_table[state].tolist()
+
+        for state in affected:
+            self.update_state(state)
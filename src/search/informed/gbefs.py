@@ -1,13 +1,13 @@
 from inc.collections.priority_queue import NodePriorityQueue
 from inc.types.node                 import Node
+from inc.utils.heuristic            import Heuristic
 from inc.utils.utils                import build_path
 
 
 def gbefs_ts(env, heuristic, limit = 1000000):
-    strt_pos = env.state_to_position(env.strt_state)
-    goal_pos = env.state_to_position(env.goal_state)
+    values = Heuristic.values(env, heuristic)
 
-    node       = Node(env.strt_state, None, 0, heuristic(strt_pos, goal_pos))
+    node       = Node(env.strt_state, None, 0, values[env.strt_state])
     time_cost  = 1
     space_cost = 1
 
@@ -26,11 +26,8 @@ def gbefs_ts(env, heuristic, limit = 1000000):
         if node.state == env.goal_state:
             return build_path(node), time_cost, space_cost
 
-        for action in range(env.action_space.n):
-            state    = env.sample(node.state, action)
-            position = env.state_to_position(state)
-
-            child      = Node(state, node, node.path_cost + 1, heuristic(position, goal_pos))
+        for state in env.successors(node.state):
+            child      = Node(state, node, node.path_cost + 1, values[state])
             time_cost += 1
 
             if child.state not in queue:
@@ -45,10 +42,9 @@ def gbefs_ts(env, heuristic, limit = 1000000):
 
 
 def gbefs_gs(env, heuristic):
-    strt_pos = env.state_to_position(env.strt_state)
-    goal_pos = env.state_to_position(env.goal_state)
+    values = Heuristic.values(env, heuristic)
 
-    node       = Node(env.strt_state, None, 0, heuristic(strt_pos, goal_pos))
+    node       = Node(env.strt_state, None, 0, values[env.strt_state])
     time_cost  = 1
     space_cost = 1
 
@@ -68,11 +64,8 @@ def gbefs_gs(env, heuristic):
 
         explored.add(node.state)
 
-        for action in range(env.action_space.n):
-            state    = env.sample(node.state, action)
-            position = env.state_to_position(state)
-
-            child      = Node(state, node, node.path_cost + 1, heuristic(position, goal_pos))
+        for state in env.successors(node.state):
+            child      = Node(state, node, node.path_cost + 1, values[state])
             time_cost += 1
 
             if (child.state not in explored) and (child.state not in queue):
@@ -0,0 +1,85 @@
+from inc.collections.search_stack import SearchStack
+from inc.utils.heuristic          import Heuristic
+
+
+def idastar_ts(env, heuristic, table = None):
+    values = Heuristic.values(env, heuristic)
+
+    time_cost  = 1
+    space_cost = 0
+
+    if env.strt_state == env.goal_state:
+        return (), time_cost, space_cost
+
+    # Only the current path is kept in memory: its states, their successors and the next one to visit.
+    stack    = SearchStack(env)
+    states   = stack.states
+    children = stack.children
+    actions  = stack.actions
+    expand   = stack.expand
+    bound    = values[env.strt_state]
+
+    stack.reserve(0)
+
+    while True:
+        next_bound = float("inf")
+        on_path    = {env.strt_state}
+        depth      = 0
+
+        if table is not None:
+            table.new_iteration()
+            table.probe(env.strt_state, 0)
+
+        states[0]   = env.strt_state
+        children[0] = expand(env.strt_state)
+        actions[0]  = 0
+
+        while depth >= 0:
+            successors = children[depth]
+
+            if actions[depth] == len(successors):
+                on_path.discard(states[depth])
+
+                depth -= 1
+
+                continue
+
+            state           = successors[actions[depth]]
+            actions[depth] += 1
+
+            if state in on_path:
+                continue
+
+            # With a transposition table, the states already reached with a lower cost are not visited again.
+            if (table is not None) and table.probe(state, depth + 1):
+                continue
+
+            time_cost += 1
+
+            # Nodes beyond the bound are cut off, the cheapest of them sets the bound of the next iteration.
+            value = depth + 1 + values[state]
+
+            if value > bound:
+                next_bound = min(next_bound, value)
+
+                continue
+
+            if state == env.goal_state:
+                return tuple(states[1:depth + 1]) + (state,), time_cost, max(space_cost, depth + 1)
+
+            depth += 1
+
+            # The buffers grow in place, so the local names keep pointing to them.
+            stack.reserve(depth)
+
+            states[depth]   = state
+            children[depth] = expand(state)
+            actions[depth]  = 0
+            space_cost      = max(space_cost, depth)
+
+            on_path.add(state)
+
+        if next_bound == float("inf"):
+            return None, time_cost, space_cost
+
+        bound = next_bound
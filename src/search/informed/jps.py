@@ -0,0 +1,123 @@
+from inc.collections.priority_queue import NodePriorityQueue
+from inc.types.node                 import Node
+from inc.utils.heuristic            import Heuristic
+from inc.utils.utils                import build_jump_path
+
+from src.search.informed.astar import astar_gs
+
+
+def jump_horizontal(free, cols, goal, state, step):
+    col = state % cols
+
+    while True:
+        col   += step
+        state += step
+
+        if (col < 0) or (col >= cols) or not free[state]:
+            return -1
+
+        if state == goal:
+            return state
+
+        # A free cell above or below whose neighbour behind is blocked can only be reached through this cell.
+        above = state - cols
+        below = state + cols
+
+        if (above >= 0) and free[above] and not free[above - step]:
+            return state
+
+        if (below < len(free)) and free[below] and not free[below - step]:
+            return state
+
+
+def jump_vertical(free, cols, goal, state, step):
+    while True:
+        state += step
+
+        if (state < 0) or (state >= len(free)) or not free[state]:
+            return -1
+
+        if state == goal:
+            return state
+
+        if (jump_horizontal(free, cols, goal, state, -1) != -1) or (jump_horizontal(free, cols, goal, state, 1) != -1):
+            return state
+
+
+def jump_successors(free, cols, goal, node):
+    state = node.state
+
+    if node.parent is None:
+        jumps = [(jump_horizontal, -1), (jump_horizontal, 1), (jump_vertical, -cols), (jump_vertical, cols)]
+    else:
+        delta = state - node.parent.state
+
+        if abs(delta) < cols:
+            step  = 1 if delta > 0 else -1
+            jumps = [(jump_horizontal, step)]
+
+            for side in (-cols, cols):
+                if (0 <= state + side < len(free)) and free[state + side] and not free[state + side - step]:
+                    jumps.append((jump_vertical, side))
+        else:
+            step  = cols if delta > 0 else -cols
+            jumps = [(jump_vertical, step), (jump_horizontal, -1), (jump_horizontal, 1)]
+
+    successors = []
+
+    for jump, step in jumps:
+        successor = jump(free, cols, goal, state, step)
+
+        if successor != -1:
+            successors.append((successor, abs(successor - state) // abs(step)))
+
+    return successors
+
+
+def jps_gs(env, heuristic, queue_type = NodePriorityQueue):
+    if env.successors_table is None:
+        return astar_gs(env, heuristic, queue_type)
+
+    values = Heuristic.values(env, heuristic)
+
+    # Terminal states other than the goal are dead ends, so they block the jumps like walls.
+    free = (~env.wall_mask & ~env.terminal_mask).tolist()
+    cols = env.cols
+    goal = int(env.goal_state)
+
+    free[goal] = True
+
+    node       = Node(int(env.strt_state), None, 0, values[env.strt_state])
+    time_cost  = 1
+    space_cost = 1
+
+    if node.state == env.goal_state:
+        return build_jump_path(node, cols), time_cost, space_cost
+
+    queue    = queue_type()
+    explored = set()
+
+    queue.add(node)
+
+    while not queue.is_empty():
+        node = queue.remove()
+
+        if node.state == env.goal_state:
+            return build_jump_path(node, cols), time_cost, space_cost
+
+        explored.add(node.state)
+
+        for state, distance in jump_successors(free, cols, goal, node):
+            path_cost  = node.path_cost + distance
+            child      = Node(state, node, path_cost, path_cost + values[state])
+            time_cost += 1
+
+            if (child.state not in explored) and (child.state not in queue):
+                queue.add(child)
+
+            if (child.state in queue) and (queue[child.state].value > child.value):
+                queue.replace(child)
+
+        space_cost = max(space_cost, len(queue) + len(explored))
+
+    return None, time_cost, space_cost
@@ -0,0 +1,159 @@
+from inc.collections.priority_queue import TreePriorityQueue
+from inc.types.node                 import Node
+from inc.utils.heuristic            import Heuristic
+from inc.utils.utils                import build_path
+
+
+def smastar_ts(env, heuristic, memory = 1000, limit = 1000000):
+    values = Heuristic.values(env, heuristic)
+    inf    = float("inf")
+
+    root       = Node(env.strt_state, None, 0, values[env.strt_state])
+    time_cost  = 1
+    space_cost = 1
+
+    # Successors still to be generated (`None`) or forgotten (their backed up value) and children kept in memory.
+    pending  = {}
+    children = {}
+
+    # The node with the lowest path cost of each state in memory.
+    reached = {}
+
+    # Both heaps hold the nodes with successors not in memory: the best ones first, and the worst ones first.
+    # They are keyed by node, so they only ever reference nodes in memory.
+    best_heap  = TreePriorityQueue()
+    worst_heap = TreePriorityQueue(worst_first = True)
+    count      = 1
+
+    def expand(node):
+        states   = env.successors(node.state)
+        ancestor = node
+
+        # The states already on the path to the node would only close a cycle.
+        while ancestor is not None:
+            states   = [state for state in states if state != ancestor.state]
+            ancestor = ancestor.parent
+
+        pending[node]  = dict.fromkeys(states)
+        children[node] = []
+
+        # Dead ends can never reach the goal.
+        if (not states) and (node.state != env.goal_state):
+            node.value = inf
+
+    def push(node):
+        best_heap.add(node)
+        worst_heap.add(node)
+
+    def backup(node):
+        while node is not None:
+            if None in pending[node].values():
+                break
+
+            value = min([child.value for child in children[node]] + list(pending[node].values()), default = inf)
+
+            if value == node.value:
+                break
+
+            node.value = value
+
+            if node in best_heap:
+                push(node)
+
+            node = node.parent
+
+    def forget():
+        nonlocal count
+
+        while worst_heap:
+            node = worst_heap.remove()
+
+            if children[node] or (node.parent is None):
+                continue
+
+            parent = node.parent
+
+            best_heap.discard(node)
+
+            del pending[node]
+            del children[node]
+
+            if reached.get(node.state) is node:
+                del reached[node.state]
+
+            node.removed  = True
+            count        -= 1
+
+            children[parent].remove(node)
+
+            remembered = pending[parent].get(node.state)
+
+            pending[parent][node.state] = node.value if remembered is None else min(remembered, node.value)
+
+            # The parent has a successor to generate again, and may have become a leaf itself.
+            if (parent not in best_heap) or not children[parent]:
+                push(parent)
+
+            return True
+
+        return False
+
+    expand(root)
+    push(root)
+
+    while best_heap:
+        if time_cost >= limit:
+            return [], time_cost, space_cost
+
+        node = best_heap.remove()
+
+        worst_heap.discard(node)
+
+        if node.value == inf:
+            break
+
+        if node.state == env.goal_state:
+            return build_path(node), time_cost, space_cost
+
+        # Generate the next successor never generated, or else the forgotten one with the lowest value.
+        states = pending[node]
+        fresh  = [state for state, value in states.items() if value is None]
+        state  = fresh[0] if fresh else min(states, key = states.get)
+        value  = states.pop(state)
+
+        path_cost  = node.path_cost + 1
+        time_cost += 1
+
+        # A state already in memory with a path not longer is left to that node.
+        if (state in reached) and (reached[state].path_cost <= path_cost):
+            if states or not children[node]:
+                push(node)
+
+            backup(node)
+            continue
+
+        child = Node(state, node, path_cost, max(node.value, path_cost + values[state], value or 0))
+
+        # A child filling the memory with its path can never be expanded, unless it is the goal.
+        if (state != env.goal_state) and (child.depth_cost >= memory - 1):
+            child.value = inf
+
+        if (count >= memory) and not forget():
+            break
+
+        expand(child)
+        children[node].append(child)
+
+        reached[state] = child
+
+        count      += 1
+        space_cost  = max(space_cost, count)
+
+        push(child)
+
+        if states:
+            push(node)
+
+        backup(node)
+
+    return None, time_cost, space_cost
@@ -0,0 +1,46 @@
+from inc.collections.priority_queue import NodePriorityQueue
+from inc.types.node                 import Node
+from inc.utils.heuristic            import Heuristic
+from inc.utils.utils                import build_path
+
+
+def wastar_gs(env, heuristic, weight = 2.0, limit = 1000000, queue_type = NodePriorityQueue):
+    values = [weight * value for value in Heuristic.values(env, heuristic)]
+
+    node       = Node(env.strt_state, None, 0, values[env.strt_state])
+    time_cost  = 1
+    space_cost = 1
+
+    if node.state == env.goal_state:
+        return build_path(node), time_cost, space_cost
+
+    queue    = queue_type()
+    explored = set()
+
+    queue.add(node)
+
+    while not queue.is_empty():
+        if time_cost >= limit:
+            return [], time_cost, space_cost
+
+        node      = queue.remove()
+        path_cost = node.path_cost + 1
+
+        if node.state == env.goal_state:
+            return build_path(node), time_cost, space_cost
+
+        explored.add(node.state)
+
+        for state in env.successors(node.state):
+            child      = Node(state, node, path_cost, path_cost + values[state])
+            time_cost += 1
+
+            if (child.state not in explored) and (child.state not in queue):
+                queue.add(child)
+
+            if (child.state in queue) and (queue[child.state].value > child.value):
+                queue.replace(child)
+
+        space_cost = max(space_cost, len(queue) + len(explored))
+
+    return None, time_cost, space_cost
@@ -0,0 +1,225 @@
+import numpy as np
+
+from collections import Counter, OrderedDict
+
+from scipy.sparse         import csr_matrix
+from scipy.sparse.csgraph import shortest_path
+
+from inc.utils.heuristic       import manhattan
+from src.search.informed.astar import astar_gs
+
+
+class PathService:
+    """
+    A service answering many shortest path queries between arbitrary states of the same environment.
+
+    A goal queried once is reached with an A* graph search, whose heuristic table is cached per goal. A goal
+    queried again gets a distance field, pointing every state to its next state on a shortest path to the goal, and
+    every later query to it only follows the field from the start. Fields and paths are kept in least recently used
+    caches.
+
+    Attributes:
+        env (GridEnv): The environment, with deterministic dynamics.
+        heuristic (function): The heuristic of the A* graph searches.
+        capacity (int): The maximum amount of paths in the cache.
+        fields_capacity (int): The maximum amount of distance fields in the cache.
+        results (OrderedDict): The cached paths by pair `(start, goal)`, from the least to the most recently used.
+        fields (OrderedDict): The cached distance fields by goal, from the least to the most recently used.
+        requests (Counter): The amount of queries missing the cache for each goal.
+        reverse (scipy.sparse.csr_matrix): The `(S, S)` predecessors graph, built on first access.
+        hits (int): The amount of queries answered from the cache.
+        misses (int): The amount of queries missing the cache.
+        searches (int): The amount of A* graph searches run.
+        fields_built (int): The amount of distance fields built.
+
+    """
+
+    def __init__(self, env, heuristic = manhattan, capacity = 1024, fields = 16):
+        """
+        Initialize the service.
+
+        Args:
+            env (GridEnv): The environment, with deterministic dynamics.
+            heuristic (function, optional): The heuristic of the A* graph searches. Defaults to `manhattan`.
+            capacity (int, optional): The maximum amount of paths in the cache. Defaults to 1024.
+            fields (int, optional): The maximum amount of distance fields in the cache. Defaults to 16.
+
+        Raises:
+            ValueError: If the dynamics of the environment are stochastic.
+
+        """
+        if env.successors_table is None:
+            raise ValueError("Path queries need an environment with deterministic dynamics.")
+
+        self.env             = env
+        self.heuristic       = heuristic
+        self.capacity        = capacity
+        self.fields_capacity = fields
+        self.results         = OrderedDict()
+        self.fields          = OrderedDict()
+        self.requests        = Counter()
+        self._reverse        = None
+        self.hits            = 0
+        self.misses          = 0
+        self.searches        = 0
+        self.fields_built    = 0
+
+
+    @property
+    def reverse(self):
+        """
+        scipy.sparse.csr_matrix: The `(S, S)` predecessors graph, built on first access.
+
+        """
+        if self._reverse is None:
+            states_n      = self.env.observation_space.n
+            self._reverse = csr_matrix(
+                (np.ones(len(self.env.P_indices)), self.env.P_indices, self.env.P_indptr), shape = (states_n, states_n)
+            )
+
+        return self._reverse
+
+
+    def distance_field(self, goal):
+        """
+        Retrieve the next state towards a goal of every state, building it when not cached.
+
+        The exact distances to the goal are computed with a breadth-first search over the predecessors, then every
+        state keeps the first successor getting closer to the goal.
+
+        Args:
+            goal (int): The index of the goal state.
+
+        Returns:
+            numpy.ndarray: The `(S,)` next states towards the goal, -1 for the goal and the states not reaching it.
+
+        """
+        if goal in self.fields:
+            self.fields.move_to_end(goal)
+
+            return self.fields[goal]
+
+        distances = shortest_path(self.reverse, unweighted = True, indices = goal)
+        distances = np.where(np.isfinite(distances), distances, -1).astype(np.int32)
+        table     = self.env.successors_table
+
+        closer = distances[table] == (distances - 1)[:, None]
+        field  = table[np.arange(len(table)), np.argmax(closer, axis = 1)].astype(np.int32)
+
+        field[distances <= 0] = -1
+
+        self.fields[goal]  = field
+        self.fields_built += 1
+
+        if len(self.fields) > self.fields_capacity:
+            self.fields.popitem(last = False)
+
+        return field
+
+
+    def descend(self, field, start, goal):
+        """
+        Build a shortest path by following the next states towards the goal from the start.
+
+        Args:
+            field (numpy.ndarray): The next states towards the goal.
+            start (int): The index of the start state.
+            goal (int): The index of the goal state.
+
+        Returns:
+            tuple: The states from the start state (excluded) to the goal state, `None` if the goal is not reachable.
+
+        """
+        if (start != goal) and (field[start] < 0):
+            return None
+
+        path  = []
+        state = start
+
+        while state != goal:
+            state = field.item(state)
+
+            path.append(state)
+
+        return tuple(path)
+
+
+    def query(self, start, goal):
+        """
+        Find a shortest path between two states.
+
+        Args:
+            start (int): The index of the start state.
+            goal (int): The index of the goal state.
+
+        Returns:
+            tuple: The states from the start state (excluded) to the goal state, `None` if the goal is not reachable
+                or if either state is a wall.
+
+        Raises:
+            ValueError: If either state is not a state of the environment.
+
+        """
+        key = (int(start), int(goal))
+
+        if not all(0 <= state < self.env.observation_space.n for state in key):
+            raise ValueError("The states {} and {} are not both states of the environment.".format(*key))
+
+        # Walls have no successors (-1), which the searches and the fields would otherwise follow as a state.
+        if self.env.wall_mask[key[0]] or self.env.wall_mask[key[1]]:
+            return None
+
+        if key in self.results:
+            self.results.move_to_end(key)
+            self.hits += 1
+
+            return self.results[key]
+
+        self.misses           += 1
+        self.requests[key[1]] += 1
+
+        if (key[1] in self.fields) or (self.requests[key[1]] > 1):
+            path = self.descend(self.distance_field(key[1]), *key)
+        else:
+            path           = astar_gs(self.env, self.heuristic, start = key[0], goal = key[1])[0]
+            self.searches += 1
+
+        self.results[key] = path
+
+        if len(self.results) > self.capacity:
+            self.results.popitem(last = False)
+
+        return path
+
+
+    def query_all(self, pairs):
+        """
+        Find a shortest path for each pair of states, building upfront the distance fields of the goals shared by
+        several pairs.
+
+        Args:
+            pairs (list of tuple): The pairs `(start, goal)`.
+
+        Returns:
+            list of tuple: The path of each pair, `None` for the goals not reachable and the pairs with a wall.
+
+        Raises:
+            ValueError: If a state of some pair is not a state of the environment.
+
+        """
+        goals = Counter(int(goal) for _, goal in pairs)
+
+        self.requests.update(goal for goal, count in goals.items() if count > 1)
+
+        return [self.query(start, goal) for start, goal in pairs]
+
+
+    def __len__(self):
+        """
+        Return the amount paths in the cache.
+
+        Returns:
+            int: The amount paths in the cache.
+
+        """
+        return len(self.results)
@@ -1,30 +1,33 @@
-from inc.collections.queue import NodeQueue
-from inc.types.node        import Node
-from inc.utils.utils       import build_path
+import numpy as np
+
+from collections import deque
+
+from inc.types.node_pool import NodePool
+from inc.utils.utils     import build_path, build_table_path
 
 
 def bfs_ts(env):
-    node       = Node(env.strt_state, None)
+    pool       = NodePool()
+    node       = pool.add(env.strt_state)
     time_cost  = 1
     space_cost = 1
 
-    if node.state == env.goal_state:
-        return build_path(node), time_cost, space_cost
+    if env.strt_state == env.goal_state:
+        return build_path(node, pool), time_cost, space_cost
 
-    queue = NodeQueue()
-    queue.add(node)
+    queue = deque([node])
 
-    while not queue.is_empty():
-        node = queue.remove()
+    while queue:
+        node = queue.popleft()
 
-        for action in range(env.action_space.n):
-            child      = Node(env.sample(node.state, action), node)
+        for state in env.successors(pool.states[node]):
+            child      = pool.add(state, node)
             time_cost += 1
 
-            if child.state == env.goal_state:
-                return build_path(child), time_cost, space_cost
+            if state == env.goal_state:
+                return build_path(child, pool), time_cost, space_cost
 
-            queue.add(child)
+            queue.append(child)
 
         space_cost = max(space_cost, len(queue))
 
@@ -32,33 +35,117 @@ def bfs_ts(env):
 
 
 def bfs_gs(env):
-    node       = Node(env.strt_state, None)
+    pool       = NodePool()
+    node       = pool.add(env.strt_state)
     time_cost  = 1
     space_cost = 1
 
-    if node.state == env.goal_state:
-        return build_path(node), time_cost, space_cost
+    if env.strt_state == env.goal_state:
+        return build_path(node, pool), time_cost, space_cost
 
-    queue    = NodeQueue()
+    queue    = deque([node])
+    reached  = {env.strt_state}
     explored = set()
 
-    queue.add(node)
+    while queue:
+        node = queue.popleft()
 
-    while not queue.is_empty():
-        node = queue.remove()
+        explored.add(pool.states[node])
 
-        explored.add(node.state)
-
-        for action in range(env.action_space.n):
-            child      = Node(env.sample(node.state, action), node)
+        for state in env.successors(pool.states[node]):
             time_cost += 1
 
-            if (child.state not in explored) and (child.state not in queue):
-                if child.state == env.goal_state:
-                    return build_path(child), time_cost, space_cost
+            if (state not in explored) and (state not in reached):
+                child = pool.add(state, node)
+
+                if state == env.goal_state:
+                    return build_path(child, pool), time_cost, space_cost
 
-                queue.add(child)
+                queue.append(child)
+                reached.add(state)
 
         space_cost = max(space_cost, len(queue) + len(explored))
 
     return None, time_cost, space_cost
+
+
+def bfs_vgs(env, threshold = 64):
+    # Level-synchronous graph search over the successor table, with the same costs as `bfs_gs`. Levels smaller
+    # than `threshold` are expanded one state at a time, where the array operations would cost more than they save.
+    if env.successors_table is None:
+        return bfs_gs(env)
+
+    table      = env.successors_table
+    actions_n  = table.shape[1]
+    time_cost  = 1
+    space_cost = 1
+
+    if env.strt_state == env.goal_state:
+        return (), time_cost, space_cost
+
+    parents  = np.full(len(table), -1, dtype = np.int64)
+    reached  = bytearray(len(table))
+    visited  = np.frombuffer(reached, dtype = bool)
+    frontier = [env.strt_state]
+    explored = 0
+
+    reached[env.strt_state] = True
+
+    while len(frontier) > 0:
+        if len(frontier) < threshold:
+            frontier = frontier.tolist() if isinstance(frontier, np.ndarray) else frontier
+            children = []
+
+            for state in frontier:
+                for child in table[state].tolist():
+                    time_cost += 1
+
+                    if not reached[child]:
+                        parents[child] = state
+
+                        if child == env.goal_state:
+                            return build_table_path(parents, child), time_cost, space_cost
+
+                        reached[child] = True
+                        children.append(child)
+
+                space_cost = max(space_cost, len(frontier) + explored + len(children))
+
+            explored += len(frontier)
+            frontier  = children
+
+            continue
+
+        frontier   = np.asarray(frontier, dtype = np.int64)
+        successors = table[frontier].reshape(-1)
+
+        # Positions of the new states in the order `bfs_gs` generates them, keeping the first of the duplicates.
+        positions = np.flatnonzero(~visited[successors])
+
+        if len(positions) > 1:
+            positions = positions[np.sort(np.unique(successors[positions], return_index = True)[1])]
+
+        children = successors[positions]
+
+        if env.goal_state in children:
+            position = positions[np.flatnonzero(children == env.goal_state)[0]]
+            expanded = position // actions_n
+
+            # The memory of `bfs_gs` is last measured after expanding the parent before the one of the goal.
+            if expanded > 0:
+                children_n = np.count_nonzero(positions < expanded * actions_n)
+                space_cost = max(space_cost, len(frontier) + explored + int(children_n))
+
+            parents[env.goal_state] = frontier[expanded]
+
+            return build_table_path(parents, env.goal_state), time_cost + int(position) + 1, space_cost
+
+        parents[children] = frontier[positions // actions_n]
+        visited[children] = True
+
+        time_cost  += len(successors)
+        space_cost  = max(space_cost, len(frontier) + explored + len(children))
+        explored   += len(frontier)
+        frontier    = children
+
+    return None, time_cost, space_cost
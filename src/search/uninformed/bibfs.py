@@ -0,0 +1,45 @@
+from collections import deque
+
+from inc.utils.utils import build_meeting_path
+
+
+def bibfs_gs(env):
+    time_cost  = 1
+    space_cost = 1
+
+    if env.strt_state == env.goal_state:
+        return (), time_cost, space_cost
+
+    # Index 0 is the forward search through the successors, index 1 the backward one through the predecessors.
+    queues   = [deque([env.strt_state]), deque([env.goal_state])]
+    parents  = [{env.strt_state: None}, {env.goal_state: None}]
+    expand   = [env.successors, env.predecessors]
+    explored = 0
+
+    time_cost += 1
+
+    while queues[0] and queues[1]:
+        # Expand a whole level of the smaller frontier, so the first meeting gives a shortest path.
+        side  = 0 if len(queues[0]) <= len(queues[1]) else 1
+        other = 1 - side
+
+        for _ in range(len(queues[side])):
+            node      = queues[side].popleft()
+            explored += 1
+
+            for state in expand[side](node):
+                time_cost += 1
+
+                if state in parents[side]:
+                    continue
+
+                parents[side][state] = node
+
+                if state in parents[other]:
+                    return build_meeting_path(parents[0], parents[1], state), time_cost, space_cost
+
+                queues[side].append(state)
+
+            space_cost = max(space_cost, len(queues[0]) + len(queues[1]) + explored)
+
+    return None, time_cost, space_cost
@@ -1,66 +1,96 @@
-from inc.types.node  import Node
-from inc.utils.utils import build_path
+from inc.collections.search_stack import SearchStack
+from inc.utils.utils              import build_path
 
 
-def dls_ts(env, node, limit = 1000000):
-    total_time_cost  = 1
-    total_space_cost = node.depth_cost
-    finished         = False
+def dls_ts(env, node, limit = 1000000, stack = None, table = None):
+    return dls(env, None, node, limit, stack, table)
+
+
+def dls_gs(env, explored, node, limit = 1000000, stack = None, table = None):
+    return dls(env, explored, node, limit, stack, table)
+
+
+def dls(env, explored, node, limit, stack, table):
+    # Explicit-stack version of the recursive depth-limited search: every node is visited in the same order
+    # and counted the same way, without any Python recursion. With a transposition table, the states already
+    # reached at a shallower depth are not visited again.
+    if stack is None:
+        stack = SearchStack(env)
+
+    if table is not None:
+        table.new_iteration()
+        table.probe(node.state, node.depth_cost)
+
+    states   = stack.states
+    children = stack.children
+    actions  = stack.actions
+    finished = stack.finished
+    expand   = stack.expand
+
+    time_cost  = 1
+    space_cost = node.depth_cost
 
     if node.state == env.goal_state:
-        return build_path(node), total_time_cost, total_space_cost
+        return build_path(node), time_cost, space_cost
 
     if limit == 0:
-        return [], total_time_cost, total_space_cost
+        return [], time_cost, space_cost
 
-    for action in range(env.action_space.n):
-        child                           = Node(env.sample(node.state, action), node)
-        solution, time_cost, space_cost = dls_ts(env, child, limit - 1)
+    if explored is not None:
+        explored.add(node.state)
 
-        total_time_cost  += time_cost
-        total_space_cost  = max(total_space_cost, space_cost)
+    stack.reserve(1)
 
-        if solution is not None:
-            finished = True if len(solution) == 0 else False
+    states[0]   = node.state
+    children[0] = expand(node.state)
+    actions[0]  = 0
+    finished[0] = False
+    depth       = 0
 
-            if len(solution) > 0:
-                return solution, total_time_cost, total_space_cost
+    while True:
+        successors = children[depth]
 
-    if finished:
-        return [], total_time_cost, total_space_cost
+        if actions[depth] == len(successors):
+            # All the successors are visited: a cut off below the node makes it a cut off for its parent.
+            if depth == 0:
+                return ([] if finished[0] else None), time_cost, space_cost
 
-    return None, total_time_cost, total_space_cost
+            if finished[depth]:
+                finished[depth - 1] = True
 
+            depth -= 1
 
-def dls_gs(env, explored, node, limit = 1000000):
-    total_time_cost  = 1
-    total_space_cost = node.depth_cost
-    finished         = False
+            continue
 
-    if node.state == env.goal_state:
-        return build_path(node), total_time_cost, total_space_cost
+        state           = successors[actions[depth]]
+        actions[depth] += 1
 
-    if limit == 0:
-        return [], total_time_cost, total_space_cost
+        if (explored is not None) and (state in explored):
+            continue
+
+        if (table is not None) and table.probe(state, node.depth_cost + depth + 1):
+            continue
 
-    explored.add(node.state)
+        time_cost  += 1
+        space_cost  = max(space_cost, node.depth_cost + depth + 1)
 
-    for action in range(env.action_space.n):
-        child = Node(env.sample(node.state, action), node)
+        if state == env.goal_state:
+            return build_path(node) + tuple(states[1:depth + 1]) + (state,), time_cost, space_cost
 
-        if child.state not in explored:
-            solution, time_cost, space_cost = dls_gs(env, explored, child, limit - 1)
+        if depth + 1 == limit:
+            finished[depth] = True
 
-            total_time_cost  += time_cost
-            total_space_cost  = max(total_space_cost, space_cost)
+            continue
 
-            if solution is not None:
-                finished = True if len(solution) == 0 else False
+        if explored is not None:
+            explored.add(state)
 
-                if len(solution) > 0:
-                    return solution, total_time_cost, total_space_cost
+        depth += 1
 
-    if finished:
-        return [], total_time_cost, total_space_cost
+        # The buffers grow in place, so the local names keep pointing to them.
+        stack.reserve(depth)
 
-    return None, total_time_cost, total_space_cost
+        states[depth]   = state
+        children[depth] = expand(state)
+        actions[depth]  = 0
+        finished[depth] = False
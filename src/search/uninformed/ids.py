@@ -1,15 +1,20 @@
-from inc.types.node  import Node
+from inc.collections.search_stack import SearchStack
+from inc.types.node               import Node
 
 from src.search.uninformed.dls import dls_ts, dls_gs
 
 
-def ids_ts(env):
+def ids_ts(env, table = None):
     iterations       = 0
     total_time_cost  = 0
     total_space_cost = 1
 
+    # The root, the stack buffers and the transposition table are shared by all the iterations.
+    node  = Node(env.strt_state, None)
+    stack = SearchStack(env)
+
     for iterations in range(0, len(env.grid)):
-        solution, time_cost, space_cost = dls_ts(env, Node(env.strt_state, None), iterations)
+        solution, time_cost, space_cost = dls_ts(env, node, iterations, stack, table)
 
         total_time_cost  += time_cost
         total_space_cost  = space_cost
@@ -20,13 +25,17 @@ def ids_ts(env):
     return [], total_time_cost, total_space_cost, iterations
 
 
-def ids_gs(env):
+def ids_gs(env, table = None):
     iterations       = 0
     total_time_cost  = 0
     total_space_cost = 1
 
+    # The root, the stack buffers and the transposition table are shared by all the iterations.
+    node  = Node(env.strt_state, None)
+    stack = SearchStack(env)
+
     for iterations in range(0, len(env.grid)):
-        solution, time_cost, space_cost = dls_gs(env, set(), Node(env.strt_state, None), iterations)
+        solution, time_cost, space_cost = dls_gs(env, set(), node, iterations, stack, table)
 
         total_time_cost  += time_cost
         total_space_cost  = space_cost
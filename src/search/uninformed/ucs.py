@@ -3,7 +3,7 @@ from inc.types.node                 import Node
 from inc.utils.utils                import build_path
 
 
-def ucs_ts(env):
+def ucs_ts(env, queue_type = NodePriorityQueue):
     node       = Node(env.strt_state, None)
     time_cost  = 1
     space_cost = 1
@@ -11,7 +11,7 @@ def ucs_ts(env):
     if node.state == env.goal_state:
         return build_path(node), time_cost, space_cost
 
-    queue = NodePriorityQueue()
+    queue = queue_type()
     queue.add(node)
 
     while not queue.is_empty():
@@ -21,8 +21,8 @@ def ucs_ts(env):
         if node.state == env.goal_state:
             return build_path(node), time_cost, space_cost
 
-        for action in range(env.action_space.n):
-            child      = Node(env.sample(node.state, action), node, path_cost, path_cost)
+        for state in env.successors(node.state):
+            child      = Node(state, node, path_cost, path_cost)
             time_cost += 1
 
             if child.state not in queue:
@@ -36,7 +36,7 @@ def ucs_ts(env):
     return None, time_cost, space_cost
 
 
-def ucs_gs(env):
+def ucs_gs(env, queue_type = NodePriorityQueue):
     node       = Node(env.strt_state, None)
     time_cost  = 1
     space_cost = 1
@@ -44,7 +44,7 @@ def ucs_gs(env):
     if node.state == env.goal_state:
         return build_path(node), time_cost, space_cost
 
-    queue    = NodePriorityQueue()
+    queue    = queue_type()
     explored = set()
 
     queue.add(node)
@@ -58,8 +58,8 @@ def ucs_gs(env):
 
         explored.add(node.state)
 
-        for action in range(env.action_space.n):
-            child      = Node(env.sample(node.state, action), node, path_cost, path_cost)
+        for state in env.successors(node.state):
+            child      = Node(state, node, path_cost, path_cost)
             time_cost += 1
 
             if (child.state not in explored) and (child.state not in queue):
@@ -0,0 +1,81 @@
+import os
+import gym
+import tempfile
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.utils      import *
+
+
+def random_lava_floor(rows, cols, seed = 0):
+    rng  = np.random.default_rng(seed)
+    grid = rng.choice(["L", "W", "P"], size = (rows, cols), p = [0.85, 0.10, 0.05])
+
+    grid[0, 0]   = "S"
+    grid[-1, -1] = "G"
+
+    env = gym.make(LAVA_FLOOR)
+
+    return grid, env.rewards, env.actions, env.dynamics, env.terminals
+
+
+def timed(function, *args):
+    start_time = timer()
+    result     = function(*args)
+
+    return result, timer() - start_time
+
+
+class CheckResult_Cache:
+
+    def __init__(self, sizes):
+        self.sizes = sizes
+
+
+    def check_cache(self):
+        print_title("Compiled environments cache")
+
+        for rows, cols in self.sizes:
+            definition = random_lava_floor(rows, cols)
+
+            with tempfile.TemporaryDirectory() as directory:
+                os.environ["GRID_ENV_CACHE"] = directory
+
+                env_store, time_store = timed(GridEnv, *definition)
+                env_load,  time_load  = timed(GridEnv, *definition)
+
+                del os.environ["GRID_ENV_CACHE"]
+
+                env_build, time_build = timed(GridEnv, *definition)
+
+                arrays = ["T_indptr", "T_indices", "T_data", "RS"]
+                equal  = all(np.array_equal(getattr(env_load, name), getattr(env_build, name)) for name in arrays)
+                mapped = all(isinstance(getattr(env_load, name), np.memmap) for name in arrays)
+
+                print("Grid {}x{} ({} cells): build {:.3f}s, build and store {:.3f}s, load {:.3f}s".format(
+                    rows, cols, rows * cols, time_build, time_store, time_load
+                ))
+
+                if equal and mapped:
+                    print(GeneralMessages.CORRECT)
+                else:
+                    print(ERROR.substitute(msg = "The cached model differs from the built one."))
+
+                del env_store, env_load
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        sizes = [
+            (100,  100),
+            (316,  316),
+            (1000, 1000)
+        ]
+
+        results = CheckResult_Cache(sizes)
+        results.check_cache()
@@ -0,0 +1,131 @@
+import gym
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.utils      import *
+
+
+def loop_transitions(env, dynamics):
+    indptr  = [0]
+    indices = []
+    data    = []
+
+    cases = {
+        0:
+            lambda x, y: (x, max(0, y - 1)),
+        1:
+            lambda x, y: (x, min(env.cols - 1, y + 1)),
+        2:
+            lambda x, y: (max(0, x - 1), y),
+        3:
+            lambda x, y: (min(env.rows - 1, x + 1), y)
+    }
+
+    for state in range(env.observation_space.n):
+        curr_x, curr_y = env.state_to_position(state)
+
+        for action in range(env.action_space.n):
+            successors = {}
+
+            if env.is_terminal(state):
+                successors[state] = 1.0
+
+            elif not env.wall_mask[state]:
+                for prob in dynamics[action]:
+                    next_x, next_y = cases[prob](curr_x, curr_y)
+                    next_state     = env.position_to_state(next_x, next_y)
+
+                    if env.wall_mask[next_state]:
+                        next_state = state
+
+                    successors[next_state] = successors.get(next_state, 0.0) + dynamics[action][prob]
+
+            total = sum(successors.values())
+
+            for next_state in sorted(successors):
+                indices.append(next_state)
+                data.append(successors[next_state] / total)
+
+            indptr.append(len(indices))
+
+    return np.asarray(indptr), np.asarray(indices), np.asarray(data)
+
+
+def random_lava_floor(rows, cols, seed = 0):
+    rng  = np.random.default_rng(seed)
+    grid = rng.choice(["L", "W", "P"], size = (rows, cols), p = [0.85, 0.10, 0.05])
+
+    grid[0, 0]   = "S"
+    grid[-1, -1] = "G"
+
+    env = gym.make(LAVA_FLOOR)
+
+    return GridEnv(grid, env.rewards, env.actions, env.dynamics, env.terminals)
+
+
+class CheckResult_Construction:
+
+    def __init__(self, env_names, sizes):
+        self.env_names = env_names
+        self.sizes     = sizes
+
+
+    def check_equivalence(self):
+        print_title("Vectorized construction (equivalence)")
+
+        for name in self.env_names:
+            env      = gym.make(name)
+            expected = loop_transitions(env, env.dynamics)
+            computed = env.T_indptr, env.T_indices, env.T_data
+
+            if all(np.array_equal(value, value_corr) for value, value_corr in zip(computed, expected)):
+                print("{}: {}".format(name, GeneralMessages.CORRECT))
+            else:
+                print("{}: {}".format(name, ERROR.substitute(msg = "The transitions differ from the reference.")))
+        print("")
+
+
+    def check_speedup(self):
+        print_title("Vectorized construction (speedup)")
+
+        for rows, cols in self.sizes:
+            env = random_lava_floor(rows, cols)
+
+            start_time = timer()
+            env.build_transitions(env.dynamics)
+            vectorized = timer() - start_time
+
+            start_time = timer()
+            loop_transitions(env, env.dynamics)
+            loop = timer() - start_time
+
+            print("Grid {}x{} ({} cells): loop {:.3f}s, vectorized {:.3f}s, speedup {:.1f}x".format(
+                rows, cols, rows * cols, loop, vectorized, loop / vectorized
+            ))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env_names = [
+            SMALL_MAZE,
+            GRID_MAZE,
+            BLOCKED_MAZE,
+            LAVA_FLOOR,
+            BIGGER_LAVA_FLOOR,
+            HUGE_LAVA_FLOOR,
+            CLIFF
+        ]
+        sizes = [
+            (100,  100),
+            (316,  316),
+            (1000, 1000)
+        ]
+
+        results = CheckResult_Construction(env_names, sizes)
+        results.check_equivalence()
+        results.check_speedup()
@@ -0,0 +1,117 @@
+import os
+import gym
+import tempfile
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs                      import *
+from envs.collections.generator import save_grid
+
+from inc.constants.output import *
+from inc.utils.utils      import *
+
+from src.search.uninformed.bfs import bfs_gs
+
+
+def print_solution_stats(name, env, build_time):
+    print("{}: {}x{} grid, {} states, built in {:.3f}s".format(
+        name, env.rows, env.cols, env.observation_space.n, build_time
+    ))
+
+
+class CheckResult_Generator:
+
+    def __init__(self, env_specs):
+        self.env_specs = env_specs
+
+
+    def check_reachability(self):
+        print_title("Generated environments (reachability)")
+
+        for name, kwargs in self.env_specs:
+            env      = gym.make(name, **kwargs)
+            solution = bfs_gs(env)[0]
+
+            print("{} {}: path of {} steps".format(name, kwargs, None if solution is None else len(solution)))
+
+            if solution is not None and len(solution) > 0:
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The goal of the generated environment is not reachable."))
+        print("")
+
+
+    def check_determinism(self):
+        print_title("Generated environments (determinism)")
+
+        for name, kwargs in self.env_specs:
+            if "seed" not in kwargs:
+                continue
+
+            grid = gym.make(name, **kwargs).grid
+
+            same_seed  = np.array_equal(grid, gym.make(name, **kwargs).grid)
+            other_seed = np.array_equal(grid, gym.make(name, **dict(kwargs, seed = kwargs["seed"] + 1)).grid)
+
+            print("{} {}: same grid with the same seed {}, with another seed {}".format(name, kwargs, same_seed, other_seed))
+
+            if same_seed and not other_seed:
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The generated grids do not depend on the seed alone."))
+        print("")
+
+
+    def check_loader(self):
+        print_title("Map files (loader)")
+
+        env     = gym.make(RANDOM_LAVA_FLOOR, rows = 50, cols = 40, seed = 0)
+        symbols = env.symbols[env.grid].reshape(env.shape)
+
+        with tempfile.TemporaryDirectory() as directory:
+            for file in ("map.txt", "map.npy"):
+                path = os.path.join(directory, file)
+
+                save_grid(path, symbols)
+
+                loaded = gym.make(LAVA_FLOOR_MAP, map_file = path)
+
+                print("{}: {}x{} grid".format(file, loaded.rows, loaded.cols))
+
+                if np.array_equal(loaded.T, env.T) and np.array_equal(loaded.RS, env.RS):
+                    print(GeneralMessages.CORRECT)
+                else:
+                    print(ERROR.substitute(msg = "The loaded map does not match the saved environment."))
+        print("")
+
+
+    def check_scale(self):
+        print_title("Generated environments (scale)")
+
+        for name, kwargs in [
+            (RANDOM_MAZE,       {"rows": 1001, "cols": 1001, "seed": 0}),
+            (RANDOM_LAVA_FLOOR, {"rows": 1000, "cols": 1000, "seed": 0}),
+            (SCALED_CLIFF,      {"rows": 1000, "cols": 1000})
+        ]:
+            start_time = timer()
+            env        = gym.make(name, **kwargs)
+
+            print_solution_stats(name, env, timer() - start_time)
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env_specs = [
+            (RANDOM_MAZE,       {"rows": 41, "cols": 61, "seed": 0}),
+            (RANDOM_MAZE,       {"rows": 40, "cols": 40, "density": 0.3, "seed": 1}),
+            (RANDOM_LAVA_FLOOR, {"rows": 30, "cols": 30, "pit_density": 0.1, "seed": 2}),
+            (SCALED_CLIFF,      {"rows": 8, "cols": 30})
+        ]
+
+        results = CheckResult_Generator(env_specs)
+        results.check_reachability()
+        results.check_determinism()
+        results.check_loader()
+        results.check_scale()
@@ -0,0 +1,72 @@
+import gym
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.utils      import *
+
+
+def step_time(env, steps):
+    actions = np.random.randint(env.action_space.n, size = steps)
+
+    env.reset()
+
+    start_time = timer()
+
+    for action in actions:
+        if env.step(action)[2]:
+            env.reset()
+
+    return (timer() - start_time) / steps
+
+
+class CheckResult_MakeFast:
+
+    def __init__(self, env_names):
+        self.env_names = env_names
+
+
+    def check_unwrapped(self):
+        print_title("Direct environment handle (unwrapped)")
+
+        for name in self.env_names:
+            env = make_fast(name)
+
+            print("{}: {}".format(name, type(env).__name__))
+
+            if env is env.unwrapped and isinstance(env, GridEnv):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The environment is still wrapped."))
+        print("")
+
+
+    def check_overhead(self, steps = 20000, repeats = 10):
+        print_title("Direct environment handle (per-step overhead)")
+
+        for name in self.env_names:
+            envs = [gym.make(name), gym.Wrapper(gym.Wrapper(make_fast(name))), make_fast(name)]
+
+            # Best of interleaved repeats, to leave out the noise of the machine.
+            made, wrapped, fast = np.min([[step_time(env, steps) for env in envs] for _ in range(repeats)], axis = 0)
+
+            print("{}: {:.2f}us per step with gym.make, {:.2f}us with two wrappers, {:.2f}us with make_fast".format(
+                name, made * 1e6, wrapped * 1e6, fast * 1e6
+            ))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env_names = [
+            SMALL_MAZE,
+            LAVA_FLOOR,
+            CLIFF
+        ]
+
+        results = CheckResult_MakeFast(env_names)
+        results.check_unwrapped()
+        results.check_overhead()
@@ -0,0 +1,121 @@
+import gym
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.ai.reinforcement_learning import *
+from inc.constants.output          import *
+from inc.utils.utils               import *
+
+from src.reinforcement_learning.q_lrn import q_lrn
+
+
+def dense_sample(env, state, action):
+    next_states, probs = env.transitions(state, action)
+
+    row              = np.zeros(env.observation_space.n)
+    row[next_states] = probs
+
+    return env.np_random.choice(env.states_range, p = row)
+
+
+def dense_sample_transition(env, state, action):
+    next_state = dense_sample(env, state, action)
+    row        = state * env.action_space.n + action
+
+    return env.T_indptr[row] + np.flatnonzero(env.transitions(state, action)[0] == next_state)[0]
+
+
+def frequencies(env, sample, samples):
+    counts = np.zeros((env.observation_space.n, env.action_space.n, env.observation_space.n))
+
+    for state in range(env.observation_space.n):
+        if env.wall_mask[state]:
+            continue
+
+        for action in range(env.action_space.n):
+            for _ in range(samples):
+                counts[state, action, sample(state, action)] += 1
+
+    return counts / samples
+
+
+def throughput(env, sample, steps):
+    states  = np.flatnonzero(~env.wall_mask)
+    actions = np.random.randint(env.action_space.n, size = steps)
+    states  = np.random.choice(states, size = steps)
+
+    start_time = timer()
+
+    for state, action in zip(states, actions):
+        sample(state, action)
+
+    return steps / (timer() - start_time)
+
+
+class CheckResult_Sampler:
+
+    def __init__(self, env_names):
+        self.env_names = env_names
+
+
+    def check_distribution(self, samples = 2000):
+        print_title("Cumulative sampler (distribution)")
+
+        for name in self.env_names:
+            env   = gym.make(name)
+            error = np.abs(frequencies(env, env.sample, samples) - env.T).max()
+
+            print("{}: max frequency error {:.4f}".format(name, error))
+
+            if error < 0.05:
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The sampled frequencies do not match the transition probabilities."))
+        print("")
+
+
+    def check_throughput(self, steps = 20000, episodes = 200):
+        print_title("Cumulative sampler (throughput)")
+
+        for name in self.env_names:
+            env = gym.make(name)
+
+            dense  = throughput(env, lambda state, action: dense_sample(env, state, action), steps)
+            sparse = throughput(env, env.sample, steps)
+
+            print("{}: {:.0f} samples/s with dense rows, {:.0f} samples/s with cumulative rows ({:.1f}x)".format(
+                name, dense, sparse, sparse / dense
+            ))
+
+        env = gym.make(CLIFF)
+
+        start_time = timer()
+        q_lrn(env, epsilon_greedy, 0.1, episodes = episodes)
+        sparse = timer() - start_time
+
+        env.sample_transition = lambda state, action: dense_sample_transition(env, state, action)
+
+        start_time = timer()
+        q_lrn(env, epsilon_greedy, 0.1, episodes = episodes)
+        dense = timer() - start_time
+
+        print("Q-Learning on {} ({} episodes): {:.3f}s with dense rows, {:.3f}s with cumulative rows".format(
+            CLIFF, episodes, dense, sparse
+        ))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env_names = [
+            LAVA_FLOOR,
+            HUGE_LAVA_FLOOR,
+            CLIFF
+        ]
+
+        results = CheckResult_Sampler(env_names)
+        results.check_distribution()
+        results.check_throughput()
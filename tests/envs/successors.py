@@ -0,0 +1,85 @@
+import gym
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.utils      import *
+
+from src.search.uninformed.bfs import bfs_gs
+
+
+def sampled_successors(env, state):
+    return [env.sample(state, action) for action in range(env.action_space.n)]
+
+
+class CheckResult_Successors:
+
+    def __init__(self, env_names):
+        self.env_names = env_names
+
+
+    def check_table(self):
+        print_title("Deterministic successors (table)")
+
+        for name in self.env_names:
+            env    = gym.make(name)
+            states = np.flatnonzero(~env.wall_mask)
+
+            print("{}: deterministic {}".format(name, env.successors_table is not None))
+
+            if env.successors_table is None:
+                continue
+
+            if all(env.successors(state) == sampled_successors(env, state) for state in states):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The successor table does not match the sampled successors."))
+        print("")
+
+
+    def check_throughput(self, repeats = 200):
+        print_title("Deterministic successors (throughput)")
+
+        for name in self.env_names:
+            env = gym.make(name)
+
+            if env.successors_table is None:
+                continue
+
+            start_time = timer()
+
+            for _ in range(repeats):
+                bfs_gs(env)
+
+            table_time = timer() - start_time
+
+            env.successors = lambda state: sampled_successors(env, state)
+
+            start_time = timer()
+
+            for _ in range(repeats):
+                bfs_gs(env)
+
+            sample_time = timer() - start_time
+
+            print("{}: {} searches in {:.3f}s with sampling, {:.3f}s with the table ({:.1f}x)".format(
+                name, repeats, sample_time, table_time, sample_time / table_time
+            ))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env_names = [
+            SMALL_MAZE,
+            GRID_MAZE,
+            BLOCKED_MAZE,
+            LAVA_FLOOR
+        ]
+
+        results = CheckResult_Successors(env_names)
+        results.check_table()
+        results.check_throughput()
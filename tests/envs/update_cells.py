@@ -0,0 +1,193 @@
+import os
+import gym
+import tempfile
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.utils      import *
+
+from src.search.informed.astar import astar_gs
+from inc.utils.heuristic       import manhattan
+
+
+MODEL_ARRAYS = [
+    "T_indptr", "T_indices", "T_data", "T_cdf", "R_data", "RSA", "RS",
+    "wall_mask", "terminal_mask", "goal_mask", "pit_mask", "successors_table", "P_indptr", "P_indices", "landing"
+]
+
+
+def random_changes(env, symbols, count, rng):
+    states  = np.flatnonzero(~np.isin(np.arange(env.observation_space.n), [env.strt_state, env.goal_state]))
+    changed = rng.choice(states, size = count, replace = False)
+
+    return {env.state_to_position(state): str(rng.choice(symbols)) for state in changed}
+
+
+class CheckResult_UpdateCells:
+
+    def __init__(self, envs):
+        self.envs = envs
+
+
+    def check_model(self, rounds = 20, count = 5):
+        print_title("Cell updates (spliced model)")
+
+        for name, env, symbols in self.envs:
+            rng        = np.random.default_rng(0)
+            mismatches = set()
+
+            # Build the predecessors first, so that they are updated along with the model.
+            env.P_indptr
+
+            for _ in range(rounds):
+                env.update_cells(random_changes(env, symbols, count, rng))
+
+                updated       = {array: getattr(env, array) for array in MODEL_ARRAYS}
+                rewards_range = env.rewards_range
+
+                env.compile_model()
+                env.landing = env.build_landing()
+
+                for array, values in updated.items():
+                    if (values is None) != (getattr(env, array) is None) or \
+                            (values is not None and not np.array_equal(values, getattr(env, array))):
+                        mismatches.add(array)
+
+                if rewards_range != env.rewards_range:
+                    mismatches.add("rewards_range")
+
+            print("{}: {} rounds of {} cells changed".format(name, rounds, count))
+
+            if not mismatches:
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The updated model differs from the compiled one: {}.".format(
+                    sorted(mismatches)
+                )))
+        print("")
+
+
+    @staticmethod
+    def check_landing():
+        print_title("Cell updates (landing)")
+
+        env  = gym.make(CLIFF)
+        cell = (3, 5)
+
+        env.update_cells({cell: "E"})
+        floor = env.landing[env.position_to_state(*cell)] == env.position_to_state(*cell)
+
+        env.update_cells({cell: "C"})
+        cliff = env.landing[env.position_to_state(*cell)] == env.strt_state
+
+        print("Cliff-v0: lands on the cell once a floor {}, back to the start once a cliff {}".format(floor, cliff))
+
+        if floor and cliff:
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The landing states do not follow the changed cells."))
+        print("")
+
+
+    @staticmethod
+    def check_rewards_range():
+        print_title("Cell updates (rewards range)")
+
+        env         = gym.make(RANDOM_MAZE, rows = 61, cols = 61, density = 0.2, seed = 0)
+        low, high   = env.rewards_range
+        rng         = np.random.default_rng(2)
+        fast, exact = True, True
+
+        # A range wider than every reward is held by no row, so the range must be kept without a full scan. Once
+        # reset, the bounds are held by some rows, and the range must follow the compiled one.
+        for _ in range(10):
+            env.rewards_range = (low - 1.0, high + 1.0)
+            env.update_cells(random_changes(env, ["W", "C"], 3, rng))
+
+            fast = fast and (env.rewards_range == (low - 1.0, high + 1.0))
+
+            env.rewards_range = (float(env.R_data.min(initial = 0.0)), float(env.R_data.max(initial = 0.0)))
+            env.update_cells(random_changes(env, ["W", "C"], 3, rng))
+
+            updated = env.rewards_range
+            env.compile_model()
+
+            exact = exact and (updated == env.rewards_range)
+            low, high = env.rewards_range
+
+        print("Random walls 61x61: range kept without a scan {}, range equal to the compiled one {}".format(fast, exact))
+
+        if fast and exact:
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The rewards range is not updated from the changed rows only."))
+        print("")
+
+
+    @staticmethod
+    def check_cache():
+        print_title("Cell updates (compiled environments cache)")
+
+        with tempfile.TemporaryDirectory() as directory:
+            os.environ["GRID_ENV_CACHE"] = directory
+
+            env    = gym.make(RANDOM_MAZE, rows = 61, cols = 61, density = 0.2, seed = 0)
+            stored = len(os.listdir(directory))
+
+            env.update_cells({(1, 1): "W", (2, 2): "W"})
+
+            print("{} model stored before the change, {} after".format(stored, len(os.listdir(directory))))
+
+            if len(os.listdir(directory)) == stored:
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The edited model was stored in the cache."))
+
+            del os.environ["GRID_ENV_CACHE"]
+        print("")
+
+
+    @staticmethod
+    def check_throughput(name, env):
+        print_title("Cell updates (throughput)")
+
+        rng = np.random.default_rng(1)
+
+        env.P_indptr
+
+        start_time = timer()
+        astar_gs(env, manhattan)
+        search_time = timer() - start_time
+
+        start_time = timer()
+
+        for _ in range(10):
+            env.update_cells(random_changes(env, ["W", "C"], 1, rng))
+
+        update_time = (timer() - start_time) / 10
+
+        print("{}: {:.4f}s per changed cell, {:.3f}s for a search with A*".format(name, update_time, search_time))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        envs = [
+            ("Random walls 61x61", gym.make(RANDOM_MAZE, rows = 61, cols = 61, density = 0.2, seed = 0), ["W", "C"]),
+            ("Perfect maze 31x31", gym.make(RANDOM_MAZE, rows = 31, cols = 31, seed = 1), ["W", "C", "G"]),
+            ("LavaFloor-v0", gym.make(LAVA_FLOOR), ["W", "L", "P"]),
+            ("Cliff-v0", gym.make(CLIFF), ["E", "C", "W"])
+        ]
+
+        results = CheckResult_UpdateCells(envs)
+        results.check_model()
+        results.check_landing()
+        results.check_rewards_range()
+        results.check_cache()
+        results.check_throughput(
+            "Random walls 1001x1001", gym.make(RANDOM_MAZE, rows = 1001, cols = 1001, density = 0.2, seed = 0)
+        )
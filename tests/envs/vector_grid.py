@@ -0,0 +1,86 @@
+import gym
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.ai.reinforcement_learning import *
+from inc.constants.output          import *
+from inc.utils.utils               import *
+
+from src.markov_decision_processes.val_iteration import val_iteration
+
+
+def print_solution_stats(name, loop_time, loop_rewards, batch_time, batch_rewards):
+    print("{}:".format(name))
+    print("\tLoop:  {:.3f}s, mean reward {:.4f} (+/- {:.4f})".format(
+        loop_time, loop_rewards.mean(), loop_rewards.std() / np.sqrt(len(loop_rewards))
+    ))
+    print("\tBatch: {:.3f}s, mean reward {:.4f} (+/- {:.4f}) ({:.1f}x)".format(
+        batch_time, batch_rewards.mean(), batch_rewards.std() / np.sqrt(len(batch_rewards)), loop_time / batch_time
+    ))
+
+
+class CheckResult_VectorGrid:
+
+    def __init__(self, env_names):
+        self.env_names = env_names
+
+
+    def check_episodes(self, episodes = 2000, num_envs = 1000, limit = 100):
+        print_title("Vectorized grid environment (episodes)")
+
+        for name in self.env_names:
+            env    = gym.make(name)
+            policy = val_iteration(env)[0]
+
+            start_time   = timer()
+            loop_rewards = np.asarray([run_episode(env, policy, limit)[1] for _ in range(episodes)])
+            loop_time    = timer() - start_time
+
+            vector_env = VectorGridEnv(env, num_envs)
+
+            start_time    = timer()
+            batch_rewards = run_episodes(vector_env, policy, episodes, limit)[1]
+            batch_time    = timer() - start_time
+
+            print_solution_stats(name, loop_time, loop_rewards, batch_time, batch_rewards)
+
+            # The two means should agree within a few standard errors.
+            error = np.sqrt(loop_rewards.var() / episodes + batch_rewards.var() / episodes)
+
+            if abs(loop_rewards.mean() - batch_rewards.mean()) <= 5 * error + 1e-9:
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The batched episodes do not match the single episodes."))
+        print("")
+
+
+    def check_throughput(self, steps = 200, num_envs = 10000):
+        print_title("Vectorized grid environment (throughput)")
+
+        for name in self.env_names:
+            vector_env = VectorGridEnv(gym.make(name), num_envs)
+            actions    = np.random.randint(vector_env.env.action_space.n, size = (steps, num_envs))
+
+            start_time = timer()
+
+            for step in range(steps):
+                vector_env.step(actions[step])
+
+            print("{}: {:.0f} steps/s with {} agents".format(name, steps * num_envs / (timer() - start_time), num_envs))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env_names = [
+            LAVA_FLOOR,
+            HUGE_LAVA_FLOOR,
+            CLIFF
+        ]
+
+        results = CheckResult_VectorGrid(env_names)
+        results.check_episodes()
+        results.check_throughput()
@@ -64,9 +64,9 @@ class CheckResult_pol_iteration:
                 ["R", "R", "R", "L"]
             ],
             [
-                ["D", "L", "L", "U"],
-                ["D", "L", "L", "L"],
-                ["R", "R", "L", "L"]
+                ["L", "L", "L", "U"],
+                ["L", "L", "L", "L"],
+                ["L", "L", "L", "L"]
             ],
             [
                 ["D", "D", "L", "L", "L", "U", "R", "D", "L", "L"],
@@ -77,7 +77,7 @@ class CheckResult_pol_iteration:
                 ["D", "L", "U", "L", "L", "L", "L", "D", "D", "U"],
                 ["D", "L", "L", "R", "D", "R", "R", "D", "L", "L"],
                 ["R", "D", "D", "D", "L", "L", "R", "D", "D", "D"],
-                ["U", "R", "R", "R", "D", "D", "R", "R", "D", "D"],
+                ["U", "R", "R", "R", "D", "D", "R", "R", "R", "D"],
                 ["L", "R", "R", "R", "R", "R", "R", "R", "R", "L"]
             ]
         ]
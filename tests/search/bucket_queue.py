@@ -0,0 +1,69 @@
+import gym
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.collections.bucket_queue   import NodeBucketQueue
+from inc.collections.priority_queue import NodePriorityQueue
+from inc.constants.output           import *
+from inc.utils.heuristic            import *
+from inc.utils.utils                import *
+
+from src.search.informed.astar import astar_gs
+from src.search.uninformed.ucs import ucs_gs
+
+
+class CheckResult_BucketQueue:
+
+    def __init__(self, env):
+        self.env      = env
+        self.searches = [
+            ("Uniform Cost Search (graph search)", lambda queue_type: ucs_gs(self.env, queue_type)),
+            ("A* Search (graph search, manhattan)", lambda queue_type: astar_gs(self.env, manhattan, queue_type))
+        ]
+
+
+    def check_searches(self):
+        print_title("Bucket priority queue (searches)")
+
+        for title, search in self.searches:
+            start_time = timer()
+            heap_path, heap_time_cost, _ = search(NodePriorityQueue)
+            heap_time = timer() - start_time
+
+            start_time = timer()
+            bucket_path, bucket_time_cost, _ = search(NodeBucketQueue)
+            bucket_time = timer() - start_time
+
+            print("{}: {} nodes in {:.3f}s with the heap, {} nodes in {:.3f}s with the buckets ({:.1f}x)".format(
+                title, heap_time_cost, heap_time, bucket_time_cost, bucket_time, heap_time / bucket_time
+            ))
+
+            # Ties may be broken differently, but both queues find a shortest path.
+            if len(heap_path) == len(bucket_path):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The bucket queue does not find a shortest path."))
+        print("")
+
+
+    def check_values(self):
+        print_title("Bucket priority queue (values)")
+
+        try:
+            astar_gs(self.env, euclidean, NodeBucketQueue)
+        except ValueError:
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The bucket queue accepted non-integer values."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env = gym.make(RANDOM_MAZE, rows = 301, cols = 301, seed = 0)
+
+        results = CheckResult_BucketQueue(env)
+        results.check_searches()
+        results.check_values()
@@ -0,0 +1,57 @@
+import gym
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.types.node       import Node
+from inc.utils.utils      import *
+
+from src.search.uninformed.dls import dls_gs
+from src.search.uninformed.ids import ids_ts
+
+
+class CheckResult_DepthLimited:
+
+    def __init__(self, deep_env, small_env):
+        self.deep_env  = deep_env
+        self.small_env = small_env
+
+
+    def check_deep_limit(self):
+        print_title("Depth limited search (deep limit)")
+
+        try:
+            path, time_cost, space_cost = dls_gs(self.deep_env, set(), Node(self.deep_env.strt_state, None))
+        except RecursionError:
+            print(ERROR.substitute(msg = "The depth limited search exceeded the recursion limit."))
+        else:
+            print("Solution length: {}, n° of nodes explored: {}, max depth: {}".format(
+                len(path), time_cost, space_cost
+            ))
+            print(GeneralMessages.CORRECT)
+        print("")
+
+
+    def check_throughput(self):
+        print_title("Iterative deepening search (throughput)")
+
+        start_time = timer()
+        _, time_cost, _, iterations = ids_ts(self.small_env)
+        total_time = timer() - start_time
+
+        print("{} nodes in {} iterations: {:.3f}s ({:.2f}M nodes/s)".format(
+            time_cost, iterations, total_time, time_cost / total_time / 1e6
+        ))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        deep_env  = gym.make(RANDOM_MAZE, rows = 201, cols = 201, seed = 0)
+        small_env = gym.make(GRID_MAZE)
+
+        results = CheckResult_DepthLimited(deep_env, small_env)
+        results.check_deep_limit()
+        results.check_throughput()
@@ -0,0 +1,100 @@
+import gym
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.heuristic  import *
+from inc.utils.utils      import *
+
+
+class CheckResult_HeuristicTables:
+
+    def __init__(self, env):
+        self.env = env
+
+
+    def check_values(self):
+        print_title("Heuristic tables (values)")
+
+        goal_pos = self.env.state_to_position(self.env.goal_state)
+        states   = range(self.env.observation_space.n)
+
+        for name, heuristic in Heuristic.functions_map.items():
+            table  = Heuristic.table(self.env, heuristic)
+            values = [heuristic(self.env.state_to_position(state), goal_pos) for state in states]
+
+            print("{}: {} values, dtype {}".format(name, len(table), table.dtype))
+
+            if np.array_equal(table, values) and (Heuristic.table(self.env, heuristic) is table):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The heuristic table does not match the heuristic function."))
+        print("")
+
+
+    def check_throughput(self):
+        print_title("Heuristic tables (throughput)")
+
+        goal_pos = self.env.state_to_position(self.env.goal_state)
+        states   = range(self.env.observation_space.n)
+
+        for name, heuristic in Heuristic.functions_map.items():
+            start_time = timer()
+
+            for state in states:
+                heuristic(self.env.state_to_position(state), goal_pos)
+
+            calls_time = timer() - start_time
+
+            table_cache.clear()
+
+            start_time = timer()
+            values = Heuristic.values(self.env, heuristic)
+            table_time = timer() - start_time
+
+            start_time = timer()
+
+            for state in states:
+                values[state]
+
+            lookups_time = timer() - start_time
+
+            print("{}: {} states in {:.3f}s with calls, {:.3f}s to build the table, {:.3f}s with lookups".format(
+                name, len(states), calls_time, table_time, lookups_time
+            ))
+        print("")
+
+
+    def check_capacity(self, goals):
+        print_title("Heuristic tables (cache capacity)")
+
+        table_cache.clear()
+
+        for goal in range(goals):
+            Heuristic.values(self.env, manhattan, goal)
+
+        table  = Heuristic.table(self.env, manhattan, goals - 1)
+        cached = len(table_cache)
+
+        print("{} goals: {} tables cached in {} bytes, capacity {} bytes".format(
+            goals, cached, table_cache.nbytes, table_cache.capacity
+        ))
+
+        if (table_cache.nbytes <= table_cache.capacity) and (cached == table_cache.capacity // table.nbytes):
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The cached tables do not fit the capacity of the cache."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env = gym.make(RANDOM_MAZE, rows = 1001, cols = 1001, density = 0.2, seed = 0)
+
+        results = CheckResult_HeuristicTables(env)
+        results.check_values()
+        results.check_throughput()
+        results.check_capacity(40)
@@ -59,14 +59,19 @@ class CheckResult_AStar:
 
     def check_solution_ts(self):
         title      = "A* Search (tree search)"
-        path_corr  = [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
-        time_corr  = [337, 285, 197, 285]
+        path_corr  = [
+            [(0, 1), (0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
+            [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
+            [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
+            [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
+        ]
+        time_corr  = [357, 329, 217, 293]
         space_corr = 16
 
         index = list(Heuristic.functions_map.keys()).index(self.heuristic)
 
         CheckResult_AStar.check_solution(
-            self.env, title, self.solution_ts, (path_corr, time_corr[index], space_corr)
+            self.env, title, self.solution_ts, (path_corr[index], time_corr[index], space_corr)
         )
 
 
@@ -78,13 +83,13 @@ class CheckResult_AStar:
             [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
             [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
         ]
-        time_corr  = 61
+        time_corr  = [61, 53, 61, 61]
         space_corr = 16
 
         index = list(Heuristic.functions_map.keys()).index(self.heuristic)
 
         CheckResult_AStar.check_solution(
-            self.env, title, self.solution_gs, (path_corr[index], time_corr, space_corr)
+            self.env, title, self.solution_gs, (path_corr[index], time_corr[index], space_corr)
         )
 
 
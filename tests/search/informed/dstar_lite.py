@@ -0,0 +1,126 @@
+import gym
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.heuristic  import *
+from inc.utils.utils      import *
+
+from src.search.informed.astar      import astar_gs
+from src.search.informed.dstar_lite import DStarLite
+from src.search.uninformed.bfs      import bfs_gs
+
+
+class CheckResult_DStarLite:
+
+    def __init__(self, envs):
+        self.envs = envs
+
+
+    @staticmethod
+    def check_replan(name, env, planner, changes):
+        path, time_cost, _ = planner.plan()
+
+        fresh_path, fresh_time_cost, _ = DStarLite(env, start = planner.start).plan()
+        _, astar_time_cost, _          = astar_gs(env, manhattan, start = planner.start)
+
+        print("{}: {} cells changed, {} nodes re-expanded, {} for a full replan ({} nodes explored by A*)".format(
+            name, len(changes), time_cost, fresh_time_cost, astar_time_cost
+        ))
+
+        if (path is None) == (fresh_path is None) and (len(path or []) == len(fresh_path or [])):
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The repaired search does not find a shortest path."))
+
+
+    def check_walls(self):
+        print_title("D* Lite (new walls on the path)")
+
+        for name, env in self.envs:
+            planner        = DStarLite(env)
+            path, _, _     = planner.plan()
+            initial_length = len(path)
+
+            # Block the current path in a few places, one after the other.
+            for index in (len(path) // 4, len(path) // 2, 3 * len(path) // 4):
+                changes = {env.state_to_position(path[index]): "W"}
+
+                planner.update_cells(changes)
+                CheckResult_DStarLite.check_replan(name, env, planner, changes)
+
+                path, _, _ = planner.plan()
+
+            print("{}: path length from {} to {}".format(name, initial_length, len(path)))
+
+            if len(path) == len(bfs_gs(env)[0]):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The repaired path is not a shortest path."))
+        print("")
+
+
+    def check_moves(self):
+        print_title("D* Lite (moving start)")
+
+        name, env  = self.envs[0]
+        planner    = DStarLite(env)
+        path, _, _ = planner.plan()
+
+        # The agent walks a few steps, then finds the next cell of its path blocked and then opened again.
+        planner.move_to(path[9])
+
+        path, _, _ = planner.plan()
+        cell       = env.state_to_position(path[0])
+
+        planner.update_cells({cell: "W"})
+        CheckResult_DStarLite.check_replan(name, env, planner, {cell: "W"})
+
+        planner.update_cells({cell: "C"})
+        CheckResult_DStarLite.check_replan(name, env, planner, {cell: "C"})
+        print("")
+
+
+    @staticmethod
+    def check_unreachable(env):
+        print_title("D* Lite (unreachable goal and stale distances)")
+
+        planner    = DStarLite(env)
+        path, _, _ = planner.plan()
+        row, col   = env.state_to_position(planner.goal)
+
+        # Following the lowest distances from a stale table would bounce between the two states next to the goal.
+        planner.g[planner.goal] = float("inf")
+        stale, _, _             = planner.plan()
+
+        walls = {
+            (row + drow, col + dcol): "W" for drow, dcol in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+            if (0 <= row + drow < env.rows) and (0 <= col + dcol < env.cols)
+        }
+
+        planner = DStarLite(env)
+        planner.update_cells(walls)
+        walled, _, _ = planner.plan()
+
+        print("Path of {} states, {} from stale distances, {} once the goal is walled in".format(
+            len(path), stale, walled
+        ))
+
+        if (stale is None) and (walled is None):
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The planner returns a path to an unreachable goal."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        envs = [
+            ("Random walls 101x101", gym.make(RANDOM_MAZE, rows = 101, cols = 101, density = 0.2, seed = 2)),
+            ("Random walls 201x201", gym.make(RANDOM_MAZE, rows = 201, cols = 201, density = 0.3, seed = 1))
+        ]
+
+        results = CheckResult_DStarLite(envs)
+        results.check_walls()
+        results.check_moves()
+        results.check_unreachable(gym.make(RANDOM_MAZE, rows = 31, cols = 31, density = 0.2, seed = 0))
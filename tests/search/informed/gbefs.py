@@ -61,7 +61,7 @@ class CheckResult_GBeFS:
         title      = "Greedy Best First Search (tree search)"
         path_corr  = []
         time_corr  = 1000001
-        space_corr = [11, 6, 6, 11]
+        space_corr = [6, 6, 6, 11]
 
         index = list(Heuristic.functions_map.keys()).index(self.heuristic)
 
@@ -78,7 +78,7 @@ class CheckResult_GBeFS:
             [(0, 3), (1, 3), (2, 3), (2, 2), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
             [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
         ]
-        time_corr  = [61, 45, 45, 53]
+        time_corr  = [53, 45, 45, 49]
         space_corr = [16, 15, 15, 16]
 
         index = list(Heuristic.functions_map.keys()).index(self.heuristic)
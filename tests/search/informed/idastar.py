@@ -0,0 +1,108 @@
+import gym
+
+from envs import *
+
+from inc.collections.transposition_table import TranspositionTable
+from inc.constants.output                import *
+from inc.utils.heuristic                 import *
+from inc.utils.utils                     import *
+
+from src.search.informed.astar   import astar_gs
+from src.search.informed.idastar import idastar_ts
+
+
+def print_solution_stats(env, sol):
+    path, time_cost, space_cost, heuristic = sol
+
+    statistics = [
+        "Solution: {}".format(solution_to_string(env, path)),
+        "N° of nodes explored: {}".format(time_cost),
+        "Max n° of nodes in memory: {}".format(space_cost),
+        "Heuristic: {}".format(heuristic)
+    ]
+
+    for statistic in statistics:
+        print(statistic)
+    print("")
+
+
+class CheckResult_IDAStar:
+
+    def __init__(self, env, solution_ts, heuristic):
+        self.env         = env
+        self.solution_ts = solution_ts
+        self.heuristic   = heuristic
+
+
+    @staticmethod
+    def check_solution(env, title, solution, correct_values):
+        print_title(title)
+        print_solution_stats(env, solution)
+
+        path,      time_cost, space_cost, heuristic = solution
+        path_corr, time_corr, space_corr            = correct_values
+        path                                        = solution_to_string(env, path)
+
+        checks = [
+            (path,       path_corr,  SearchMessages.NOT_CORRECT_SOLUTION),
+            (time_cost,  time_corr,  SearchMessages.NOT_CORRECT_TIME_COST),
+            (space_cost, space_corr, SearchMessages.NOT_CORRECT_SPACE_COST)
+        ]
+
+        for value, value_corr, message in checks:
+            if value != value_corr:
+                print(message.format(value_corr))
+                break
+        else:
+            print(GeneralMessages.CORRECT)
+        print("\n")
+
+
+    def check_solution_ts(self):
+        title      = "Iterative Deepening A* Search (tree search)"
+        path_corr  = [(0, 1), (0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
+        time_corr  = [307, 40, 236, 126]
+        space_corr = 9
+
+        index = list(Heuristic.functions_map.keys()).index(self.heuristic)
+
+        CheckResult_IDAStar.check_solution(
+            self.env, title, self.solution_ts, (path_corr, time_corr[index], space_corr)
+        )
+
+
+    @staticmethod
+    def check_memory(envs, heuristic):
+        print_title("Iterative Deepening A* Search (memory)")
+
+        for name, env in envs:
+            path,     time_cost,     space_cost     = astar_gs(env, Heuristic.functions_map[heuristic])
+            ida_path, ida_time_cost, ida_space_cost = idastar_ts(
+                env, Heuristic.functions_map[heuristic], TranspositionTable(env.observation_space.n)
+            )
+
+            print("{} ({}): {} nodes explored and {} in memory with A*, {} and {} with IDA*".format(
+                name, heuristic, time_cost, space_cost, ida_time_cost, ida_space_cost
+            ))
+
+            if len(path) == len(ida_path):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "IDA* does not find a shortest path."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env = gym.make(SMALL_MAZE)
+
+        for heuristic in Heuristic.functions_map.keys():
+            solution_ts = idastar_ts(env, Heuristic.functions_map[heuristic]) + (heuristic,)
+
+            results = CheckResult_IDAStar(env, solution_ts, heuristic)
+            results.check_solution_ts()
+
+        CheckResult_IDAStar.check_memory([
+            ("Perfect maze 61x61",   gym.make(RANDOM_MAZE, rows = 61, cols = 61, seed = 3)),
+            ("Random walls 101x101", gym.make(RANDOM_MAZE, rows = 101, cols = 101, density = 0.2, seed = 2))
+        ], "manhattan")
@@ -0,0 +1,109 @@
+import gym
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.heuristic  import *
+from inc.utils.utils      import *
+
+from src.search.informed.astar import astar_gs
+from src.search.informed.jps   import jps_gs
+
+
+def print_solution_stats(env, sol):
+    path, time_cost, space_cost, heuristic = sol
+
+    statistics = [
+        "Solution: {}".format(solution_to_string(env, path)),
+        "N° of nodes explored: {}".format(time_cost),
+        "Max n° of nodes in memory: {}".format(space_cost),
+        "Heuristic: {}".format(heuristic)
+    ]
+
+    for statistic in statistics:
+        print(statistic)
+    print("")
+
+
+class CheckResult_JPS:
+
+    def __init__(self, env, solution_gs, heuristic):
+        self.env         = env
+        self.solution_gs = solution_gs
+        self.heuristic   = heuristic
+
+
+    @staticmethod
+    def check_solution(env, title, solution, correct_values):
+        print_title(title)
+        print_solution_stats(env, solution)
+
+        path,      time_cost, space_cost, heuristic = solution
+        path_corr, time_corr, space_corr            = correct_values
+        path                                        = solution_to_string(env, path)
+
+        checks = [
+            (path,       path_corr,  SearchMessages.NOT_CORRECT_SOLUTION),
+            (time_cost,  time_corr,  SearchMessages.NOT_CORRECT_TIME_COST),
+            (space_cost, space_corr, SearchMessages.NOT_CORRECT_SPACE_COST)
+        ]
+
+        for value, value_corr, message in checks:
+            if value != value_corr:
+                print(message.format(value_corr))
+                break
+        else:
+            print(GeneralMessages.CORRECT)
+        print("\n")
+
+
+    def check_solution_gs(self):
+        title      = "Jump Point Search (graph search)"
+        path_corr  = [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
+        time_corr  = 10
+        space_corr = 8
+
+        CheckResult_JPS.check_solution(self.env, title, self.solution_gs, (path_corr, time_corr, space_corr))
+
+
+    @staticmethod
+    def check_benchmark(envs, heuristic):
+        print_title("Jump Point Search (benchmark against A*)")
+
+        for name, env in envs:
+            start_time = timer()
+            path, time_cost, space_cost = astar_gs(env, Heuristic.functions_map[heuristic])
+            astar_time = timer() - start_time
+
+            start_time = timer()
+            jps_path, jps_time_cost, jps_space_cost = jps_gs(env, Heuristic.functions_map[heuristic])
+            jps_time = timer() - start_time
+
+            print("{} ({}): {} nodes explored and {} in memory in {:.3f}s with A*, {} and {} in {:.3f}s with JPS".format(
+                name, heuristic, time_cost, space_cost, astar_time, jps_time_cost, jps_space_cost, jps_time
+            ))
+
+            if len(path) == len(jps_path):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The jump point search does not find a shortest path."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env = gym.make(SMALL_MAZE)
+
+        for heuristic in Heuristic.functions_map.keys():
+            solution_gs = jps_gs(env, Heuristic.functions_map[heuristic]) + (heuristic,)
+
+            results = CheckResult_JPS(env, solution_gs, heuristic)
+            results.check_solution_gs()
+
+        CheckResult_JPS.check_benchmark([
+            ("Open 301x301",         gym.make(RANDOM_MAZE, rows = 301, cols = 301, density = 0.0, seed = 0)),
+            ("Random walls 301x301", gym.make(RANDOM_MAZE, rows = 301, cols = 301, density = 0.2, seed = 0)),
+            ("Perfect maze 301x301", gym.make(RANDOM_MAZE, rows = 301, cols = 301, seed = 0))
+        ], "manhattan")
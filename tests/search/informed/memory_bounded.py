@@ -0,0 +1,152 @@
+import gym
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.heuristic  import *
+from inc.utils.utils      import *
+
+from src.search.informed.astar   import astar_gs
+from src.search.informed.beam    import beam_gs
+from src.search.informed.smastar import smastar_ts
+
+
+def print_solution_stats(env, sol):
+    path, time_cost, space_cost, heuristic = sol
+
+    statistics = [
+        "Solution: {}".format(solution_to_string(env, path)),
+        "N° of nodes explored: {}".format(time_cost),
+        "Max n° of nodes in memory: {}".format(space_cost),
+        "Heuristic: {}".format(heuristic)
+    ]
+
+    for statistic in statistics:
+        print(statistic)
+    print("")
+
+
+class CheckResult_MemoryBounded:
+
+    def __init__(self, env, solution_beam, solution_sma, heuristic):
+        self.env           = env
+        self.solution_beam = solution_beam
+        self.solution_sma  = solution_sma
+        self.heuristic     = heuristic
+
+
+    @staticmethod
+    def check_solution(env, title, solution, correct_values):
+        print_title(title)
+        print_solution_stats(env, solution)
+
+        path,      time_cost, space_cost, heuristic = solution
+        path_corr, time_corr, space_corr            = correct_values
+        path                                        = solution_to_string(env, path)
+
+        checks = [
+            (path,       path_corr,  SearchMessages.NOT_CORRECT_SOLUTION),
+            (time_cost,  time_corr,  SearchMessages.NOT_CORRECT_TIME_COST),
+            (space_cost, space_corr, SearchMessages.NOT_CORRECT_SPACE_COST)
+        ]
+
+        for value, value_corr, message in checks:
+            if value != value_corr:
+                print(message.format(value_corr))
+                break
+        else:
+            print(GeneralMessages.CORRECT)
+        print("\n")
+
+
+    def check_solution_beam(self):
+        title      = "Beam Search (width 2)"
+        path_corr  = [
+            [(0, 1), (0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
+            [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
+            [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
+            [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
+        ]
+        time_corr  = 59
+        space_corr = [13, 11, 11, 10]
+
+        index = list(Heuristic.functions_map.keys()).index(self.heuristic)
+
+        CheckResult_MemoryBounded.check_solution(
+            self.env, title, self.solution_beam, (path_corr[index], time_corr, space_corr[index])
+        )
+
+
+    def check_solution_sma(self):
+        title      = "Simplified Memory-bounded A* Search (12 nodes)"
+        path_corr  = [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
+        time_corr  = [22, 21, 22, 22]
+        space_corr = 12
+
+        index = list(Heuristic.functions_map.keys()).index(self.heuristic)
+
+        CheckResult_MemoryBounded.check_solution(
+            self.env, title, self.solution_sma, (path_corr, time_corr[index], space_corr)
+        )
+
+
+    @staticmethod
+    def check_budgets(envs, heuristic, widths, memories):
+        print_title("Memory-bounded searches (node budgets)")
+
+        for name, env in envs:
+            path, time_cost, space_cost = astar_gs(env, Heuristic.functions_map[heuristic])
+
+            print("{} ({}): path length {} in {} nodes, {} in memory with A*".format(
+                name, heuristic, len(path), time_cost, space_cost
+            ))
+
+            for width in widths:
+                for memory in [width * (env.action_space.n + 1)] + memories:
+                    beam_path, beam_time_cost, beam_space_cost = beam_gs(
+                        env, Heuristic.functions_map[heuristic], width, memory
+                    )
+
+                    message = "{} ({}, width {}, memory {}): path length {} in {} nodes, {} in memory with beam search"
+
+                    print(message.format(
+                        name, heuristic, width, memory, len(beam_path or []), beam_time_cost, beam_space_cost
+                    ))
+
+                    # The layer, its children and the ancestors it keeps alive all count against the budget.
+                    if (beam_space_cost <= memory) and (beam_path is None or len(beam_path) >= len(path)):
+                        print(GeneralMessages.CORRECT)
+                    else:
+                        print(ERROR.substitute(msg = "The beam search exceeds its budget."))
+
+            for memory in memories:
+                sma_path, sma_time_cost, sma_space_cost = smastar_ts(env, Heuristic.functions_map[heuristic], memory)
+
+                print("{} ({}, memory {}): path length {} in {} nodes, {} in memory with SMA*".format(
+                    name, heuristic, memory, len(sma_path or []), sma_time_cost, sma_space_cost
+                ))
+
+                # A shortest path is found as soon as it fits in memory.
+                if (sma_space_cost <= memory) and (len(sma_path) == len(path)):
+                    print(GeneralMessages.CORRECT)
+                else:
+                    print(ERROR.substitute(msg = "The memory-bounded search exceeds its budget or misses the path."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env = gym.make(SMALL_MAZE)
+
+        for heuristic in Heuristic.functions_map.keys():
+            solution_beam = beam_gs(env, Heuristic.functions_map[heuristic], 2) + (heuristic,)
+            solution_sma  = smastar_ts(env, Heuristic.functions_map[heuristic], 12) + (heuristic,)
+
+            results = CheckResult_MemoryBounded(env, solution_beam, solution_sma, heuristic)
+            results.check_solution_beam()
+            results.check_solution_sma()
+
+        CheckResult_MemoryBounded.check_budgets([
+            ("Random walls 41x41",   gym.make(RANDOM_MAZE, rows = 41, cols = 41, density = 0.25, seed = 2)),
+            ("Random walls 101x101", gym.make(RANDOM_MAZE, rows = 101, cols = 101, density = 0.35, seed = 1))
+        ], "manhattan", [4, 32], [250, 1000])
@@ -0,0 +1,163 @@
+import gym
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.heuristic  import *
+from inc.utils.utils      import *
+
+from src.search.informed.arastar import arastar_gs
+from src.search.informed.astar   import astar_gs
+from src.search.informed.wastar  import wastar_gs
+
+
+def print_solution_stats(env, sol):
+    path, time_cost, space_cost, heuristic = sol
+
+    statistics = [
+        "Solution: {}".format(solution_to_string(env, path)),
+        "N° of nodes explored: {}".format(time_cost),
+        "Max n° of nodes in memory: {}".format(space_cost),
+        "Heuristic: {}".format(heuristic)
+    ]
+
+    for statistic in statistics:
+        print(statistic)
+    print("")
+
+
+class CheckResult_WAStar:
+
+    def __init__(self, env, solution_gs, heuristic):
+        self.env         = env
+        self.solution_gs = solution_gs
+        self.heuristic   = heuristic
+
+
+    @staticmethod
+    def check_solution(env, title, solution, correct_values):
+        print_title(title)
+        print_solution_stats(env, solution)
+
+        path,      time_cost, space_cost, heuristic = solution
+        path_corr, time_corr, space_corr            = correct_values
+        path                                        = solution_to_string(env, path)
+
+        checks = [
+            (path,       path_corr,  SearchMessages.NOT_CORRECT_SOLUTION),
+            (time_cost,  time_corr,  SearchMessages.NOT_CORRECT_TIME_COST),
+            (space_cost, space_corr, SearchMessages.NOT_CORRECT_SPACE_COST)
+        ]
+
+        for value, value_corr, message in checks:
+            if value != value_corr:
+                print(message.format(value_corr))
+                break
+        else:
+            print(GeneralMessages.CORRECT)
+        print("\n")
+
+
+    def check_solution_gs(self):
+        title      = "Weighted A* Search (graph search, weight 2)"
+        path_corr  = [
+            [(0, 1), (0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
+            [(0, 1), (1, 1), (1, 0), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
+            [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)],
+            [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
+        ]
+        time_corr  = [61, 57, 57, 61]
+        space_corr = 16
+
+        index = list(Heuristic.functions_map.keys()).index(self.heuristic)
+
+        CheckResult_WAStar.check_solution(
+            self.env, title, self.solution_gs, (path_corr[index], time_corr[index], space_corr)
+        )
+
+
+    @staticmethod
+    def check_weights(envs, heuristic, weights):
+        print_title("Weighted A* Search (bounded suboptimality)")
+
+        for name, env in envs:
+            path, time_cost, _ = astar_gs(env, Heuristic.functions_map[heuristic])
+
+            for weight in weights:
+                weighted_path, weighted_time_cost, _ = wastar_gs(env, Heuristic.functions_map[heuristic], weight)
+
+                print("{} ({}, weight {}): path length {} in {} nodes, {} in {} nodes with A*".format(
+                    name, heuristic, weight, len(weighted_path), weighted_time_cost, len(path), time_cost
+                ))
+
+                if len(path) <= len(weighted_path) <= weight * len(path):
+                    print(GeneralMessages.CORRECT)
+                else:
+                    print(ERROR.substitute(msg = "The weighted search breaks its suboptimality bound."))
+        print("")
+
+
+    @staticmethod
+    def check_anytime(envs, heuristic):
+        print_title("Anytime Repairing A* Search (improving solutions)")
+
+        for name, env in envs:
+            path, _, _ = astar_gs(env, Heuristic.functions_map[heuristic])
+            start_time = timer()
+            bounds     = []
+            correct    = True
+
+            for solution, time_cost, space_cost, bound in arastar_gs(env, Heuristic.functions_map[heuristic]):
+                print("{} ({}): path length {} after {} nodes ({:.3f}s), bound {:.3f}".format(
+                    name, heuristic, len(solution), time_cost, timer() - start_time, bound
+                ))
+
+                correct &= len(solution) <= bound * len(path) + 1e-9
+                bounds.append(bound)
+
+            if correct and (bounds == sorted(bounds, reverse = True)) and (bounds[-1] == 1.0) and \
+                (len(solution) == len(path)):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The anytime search does not improve down to a shortest path."))
+        print("")
+
+
+    @staticmethod
+    def check_deadline(envs, heuristic, limit):
+        print_title("Anytime Repairing A* Search (expansions budget)")
+
+        for name, env in envs:
+            solutions = list(arastar_gs(env, Heuristic.functions_map[heuristic], limit = limit))
+
+            print("{} ({}): {} solutions within {} nodes, the last one of length {} with bound {:.3f}".format(
+                name, heuristic, len(solutions), limit, len(solutions[-1][0]), solutions[-1][3]
+            ))
+
+            if all(time_cost <= limit for _, time_cost, _, _ in solutions):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The anytime search exceeds its budget."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env = gym.make(SMALL_MAZE)
+
+        for heuristic in Heuristic.functions_map.keys():
+            solution_gs = wastar_gs(env, Heuristic.functions_map[heuristic]) + (heuristic,)
+
+            results = CheckResult_WAStar(env, solution_gs, heuristic)
+            results.check_solution_gs()
+
+        envs = [
+            ("Random walls 301x301", gym.make(RANDOM_MAZE, rows = 301, cols = 301, density = 0.2, seed = 0)),
+            ("Random walls 301x301", gym.make(RANDOM_MAZE, rows = 301, cols = 301, density = 0.35, seed = 1))
+        ]
+
+        CheckResult_WAStar.check_weights(envs, "manhattan", [1.5, 2, 5])
+        CheckResult_WAStar.check_anytime(envs, "manhattan")
+        CheckResult_WAStar.check_deadline(envs, "manhattan", 20000)
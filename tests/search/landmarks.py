@@ -0,0 +1,113 @@
+import gym
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.heuristic  import *
+from inc.utils.landmarks  import LandmarkHeuristic
+from inc.utils.utils      import *
+
+from src.search.informed.astar import astar_gs
+from src.search.uninformed.bfs import bfs_gs
+
+
+class CheckResult_Landmarks:
+
+    def __init__(self, envs):
+        self.envs = envs
+
+
+    def check_admissible(self):
+        print_title("Landmark heuristic (admissibility)")
+
+        for name, env in self.envs:
+            landmarks = LandmarkHeuristic.build(env)
+            table     = Heuristic.table(env, landmarks)
+            goal_pos  = env.state_to_position(env.goal_state)
+
+            # Exact distances to the goal, from a breadth-first search over the predecessors.
+            distances = np.full(env.observation_space.n, np.inf)
+            frontier  = [env.goal_state]
+            depth     = 0
+
+            while frontier:
+                for state in frontier:
+                    distances[state] = depth
+
+                frontier = list({p for s in frontier for p in env.predecessors(s) if distances[p] == np.inf})
+                depth   += 1
+
+            reachable = np.isfinite(distances)
+            start_pos = env.state_to_position(env.strt_state)
+
+            print("{}: {} landmarks, {} bytes of {} distances".format(
+                name, len(landmarks.landmarks), landmarks.from_distances.nbytes + landmarks.to_distances.nbytes,
+                landmarks.from_distances.dtype
+            ))
+
+            if np.all(table[reachable] <= distances[reachable]) and \
+                (landmarks(start_pos, goal_pos) == table[env.strt_state]):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The landmark heuristic overestimates the distance to the goal."))
+        print("")
+
+
+    def check_expansions(self):
+        print_title("Landmark heuristic (A* graph search)")
+
+        for name, env in self.envs:
+            start_time = timer()
+            landmarks = LandmarkHeuristic.build(env)
+            build_time = timer() - start_time
+
+            shortest, _, _ = bfs_gs(env)
+            geometric      = astar_gs(env, manhattan)
+            landmark       = astar_gs(env, landmarks)
+
+            print("{}: {} nodes with the manhattan heuristic, {} with landmarks (built in {:.3f}s)".format(
+                name, geometric[1], landmark[1], build_time
+            ))
+
+            if (len(landmark[0] or []) == len(shortest or [])) and (landmark[1] <= geometric[1]):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The landmark heuristic does not improve the search."))
+        print("")
+
+
+    def check_register(self):
+        print_title("Landmark heuristic (registration)")
+
+        name, env = self.envs[-1]
+        landmarks = LandmarkHeuristic.build(env, count = 4)
+
+        Heuristic.register("landmarks", landmarks)
+
+        solution = astar_gs(env, Heuristic.functions_map["landmarks"])
+        del Heuristic.functions_map["landmarks"]
+
+        print("{}: {} nodes with 4 registered landmarks".format(name, solution[1]))
+
+        if len(solution[0]) == len(bfs_gs(env)[0]):
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The registered landmark heuristic does not find a shortest path."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        envs = [
+            (SMALL_MAZE,             gym.make(SMALL_MAZE)),
+            ("Random walls 101x101", gym.make(RANDOM_MAZE, rows = 101, cols = 101, density = 0.35, seed = 1)),
+            ("Perfect maze 201x201", gym.make(RANDOM_MAZE, rows = 201, cols = 201, seed = 0))
+        ]
+
+        results = CheckResult_Landmarks(envs)
+        results.check_admissible()
+        results.check_expansions()
+        results.check_register()
@@ -0,0 +1,111 @@
+import gym
+import tracemalloc
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.types.node       import Node
+from inc.types.node_pool  import NodePool
+from inc.utils.utils      import *
+
+from src.search.uninformed.bfs import bfs_ts
+
+
+def allocated_bytes(build):
+    tracemalloc.start()
+
+    nodes = build()
+    size  = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    del nodes
+
+    return size
+
+
+def build_nodes(count):
+    nodes = [Node(0)]
+
+    for state in range(1, count):
+        nodes.append(Node(state, nodes[state // 4], 1, 1))
+
+    return nodes
+
+
+def build_pool(count):
+    pool = NodePool()
+    pool.add(0)
+
+    for state in range(1, count):
+        pool.add(state, state // 4, 1, 1)
+
+    return pool
+
+
+class CheckResult_NodePool:
+
+    def __init__(self, env):
+        self.env = env
+
+
+    def check_paths(self):
+        print_title("Node pool (paths)")
+
+        nodes = build_nodes(1000)
+        pool  = build_pool(1000)
+
+        if all(build_path(nodes[handle]) == build_path(handle, pool) for handle in range(len(pool))):
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The paths of the pool do not match the paths of the nodes."))
+        print("")
+
+
+    def check_memory(self, count = 1000000):
+        print_title("Node pool (memory)")
+
+        nodes_bytes = allocated_bytes(lambda: build_nodes(count))
+        pool_bytes  = allocated_bytes(lambda: build_pool(count))
+
+        print("{} nodes: {:.1f}MB as objects, {:.1f}MB in the pool ({:.1f}x)".format(
+            count, nodes_bytes / 2 ** 20, pool_bytes / 2 ** 20, nodes_bytes / pool_bytes
+        ))
+        print("")
+
+
+    def check_throughput(self, count = 1000000):
+        print_title("Node pool (throughput)")
+
+        start_time = timer()
+        build_nodes(count)
+        nodes_time = timer() - start_time
+
+        start_time = timer()
+        build_pool(count)
+        pool_time = timer() - start_time
+
+        print("{} nodes: {:.2f}M nodes/s as objects, {:.2f}M nodes/s in the pool".format(
+            count, count / nodes_time / 1e6, count / pool_time / 1e6
+        ))
+
+        start_time = timer()
+        _, time_cost, _ = bfs_ts(self.env)
+        search_time = timer() - start_time
+
+        print("Breadth First Search (tree search): {} nodes in {:.3f}s ({:.2f}M nodes/s)".format(
+            time_cost, search_time, time_cost / search_time / 1e6
+        ))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env = gym.make(SMALL_MAZE)
+
+        results = CheckResult_NodePool(env)
+        results.check_paths()
+        results.check_memory()
+        results.check_throughput()
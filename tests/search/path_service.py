@@ -0,0 +1,118 @@
+import gym
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.heuristic  import *
+from inc.utils.utils      import *
+
+from src.search.informed.astar import astar_gs
+from src.search.path_service   import PathService
+
+
+class CheckResult_PathService:
+
+    def __init__(self, envs):
+        self.envs = envs
+
+
+    @staticmethod
+    def random_pairs(env, goals_n, queries_n, seed):
+        rng    = np.random.default_rng(seed)
+        states = np.flatnonzero(~env.wall_mask & ~env.terminal_mask)
+        goals  = rng.choice(states, goals_n, replace = False)
+
+        return [(int(rng.choice(states)), int(rng.choice(goals))) for _ in range(queries_n)]
+
+
+    def check_queries(self):
+        print_title("Path service (queries)")
+
+        for name, env in self.envs:
+            pairs   = CheckResult_PathService.random_pairs(env, 8, 200, 0)
+            service = PathService(env)
+
+            start_time = timer()
+            paths = [service.query(start, goal) for start, goal in pairs]
+            service_time = timer() - start_time
+
+            start_time = timer()
+            solutions = [astar_gs(env, manhattan, start = start, goal = goal)[0] for start, goal in pairs[:20]]
+            astar_time = (timer() - start_time) * len(pairs) / 20
+
+            print("{}: {} queries in {:.3f}s ({} searches, {} distance fields), about {:.3f}s with A* alone".format(
+                name, len(pairs), service_time, service.searches, service.fields_built, astar_time
+            ))
+
+            if all(len(path or []) == len(solution or []) for path, solution in zip(paths, solutions)) and \
+                all(path is None or path[-1] == goal for path, (_, goal) in zip(paths, pairs)):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The path service does not find the shortest paths."))
+        print("")
+
+
+    def check_cache(self):
+        print_title("Path service (cache)")
+
+        name, env = self.envs[0]
+        pairs     = CheckResult_PathService.random_pairs(env, 4, 50, 1)
+        service   = PathService(env, capacity = 32, fields = 2)
+
+        first  = service.query_all(pairs)
+        misses = service.misses
+        second = service.query_all(pairs[-10:])
+
+        print("{}: {} hits and {} misses, {} paths and {} distance fields cached".format(
+            name, service.hits, service.misses, len(service), len(service.fields)
+        ))
+
+        hits = len(pairs) - misses + 10
+
+        if (second == first[-10:]) and (service.misses == misses) and (service.hits == hits) and \
+            (len(service) <= 32) and (len(service.fields) <= 2):
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The path service does not count its cache hits and misses."))
+        print("")
+
+
+    @staticmethod
+    def check_walls(env):
+        print_title("Path service (walls and invalid states)")
+
+        service = PathService(env)
+        wall    = int(np.flatnonzero(env.wall_mask)[0])
+        floor   = int(np.flatnonzero(~env.wall_mask & ~env.terminal_mask)[0])
+        paths   = service.query_all([(wall, env.goal_state), (floor, wall), (wall, wall)])
+        paths  += [service.query(wall, env.goal_state)]
+
+        try:
+            service.query(env.observation_space.n, env.goal_state)
+            rejected = False
+        except ValueError:
+            rejected = True
+
+        print("Wall state {}: paths {}, out of range state rejected {}".format(wall, paths, rejected))
+
+        if (paths == [None] * 4) and rejected and (service.searches == 0):
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The path service answers queries from or to a wall."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        envs = [
+            ("Random walls 201x201", gym.make(RANDOM_MAZE, rows = 201, cols = 201, density = 0.2, seed = 2)),
+            ("Perfect maze 201x201", gym.make(RANDOM_MAZE, rows = 201, cols = 201, seed = 0))
+        ]
+
+        results = CheckResult_PathService(envs)
+        results.check_queries()
+        results.check_cache()
+        results.check_walls(gym.make(RANDOM_MAZE, rows = 21, cols = 21, density = 0.3, seed = 1))
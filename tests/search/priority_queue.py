@@ -0,0 +1,279 @@
+import gym
+import heapq
+import random
+import numpy as np
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.collections.priority_queue import NodePriorityQueue, TreePriorityQueue
+from inc.constants.output           import *
+from inc.types.node                 import Node
+from inc.utils.heuristic            import manhattan
+from inc.utils.utils                import *
+
+from src.search.informed.astar  import astar_gs
+from src.search.uninformed.ucs import ucs_gs
+
+
+class LazyPriorityQueue:
+    """
+    The previous priority queue, which marks replaced nodes as removed and skips them when popped.
+
+    """
+
+    def __init__(self):
+        self.queue     = []
+        self.node_dict = {}
+        self.length    = 0
+
+
+    def is_empty(self):
+        return self.length == 0
+
+
+    def add(self, node):
+        heapq.heappush(self.queue, node)
+
+        self.node_dict[node.state]  = node
+        self.length                += 1
+
+
+    def remove(self):
+        while True:
+            node = heapq.heappop(self.queue)
+
+            if not node.removed:
+                del self.node_dict[node.state]
+
+                self.length -= 1
+
+                return node
+
+
+    def replace(self, node):
+        self.node_dict[node.state].removed = True
+        self.node_dict[node.state]         = node
+
+        self.length -= 1
+
+        self.add(node)
+
+
+    @property
+    def heap_size(self):
+        return len(self.queue)
+
+
+    def __len__(self):
+        return self.length
+
+
+    def __contains__(self, state):
+        return state in self.node_dict
+
+
+    def __getitem__(self, state):
+        return self.node_dict[state]
+
+
+def run_operations(queue, operations):
+    popped    = []
+    peak_heap = 0
+    peak_live = 0
+
+    for state, value in operations:
+        if state < 0:
+            if not queue.is_empty():
+                popped.append(queue.remove().value)
+        elif state not in queue:
+            queue.add(Node(state, None, value, value))
+        elif queue[state].value > value:
+            queue.replace(Node(state, None, value, value))
+
+        peak_heap = max(peak_heap, queue.heap_size)
+        peak_live = max(peak_live, len(queue))
+
+    return popped, peak_heap, peak_live
+
+
+def random_operations(count, states, seed = 0):
+    rng = np.random.default_rng(seed)
+
+    # Mostly relaxations of a few states, as on a dense graph, with a pop every few steps. The values are distinct,
+    # so both queues pop the same nodes.
+    targets = rng.integers(0, states, size = count)
+    values  = rng.random(count)
+    targets[rng.random(count) < 0.2] = -1
+
+    return list(zip(targets.tolist(), values.tolist()))
+
+
+class CheckResult_PriorityQueue:
+
+    def __init__(self, operations):
+        self.operations = operations
+
+
+    def check_order(self):
+        print_title("Indexed priority queue (order)")
+
+        indexed_popped, _, _ = run_operations(NodePriorityQueue(), self.operations)
+        lazy_popped,    _, _ = run_operations(LazyPriorityQueue(), self.operations)
+
+        if indexed_popped == lazy_popped:
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "The indexed queue does not pop the same values as the lazy queue."))
+        print("")
+
+
+    @staticmethod
+    def check_discard(runs = 2000, seed = 0):
+        print_title("Indexed priority queue (random discards)")
+
+        rng     = np.random.default_rng(seed)
+        invalid = 0
+
+        # Random adds, replacements, pops and discards, checking after each run that every parent is not greater than
+        # its children and that every entry records its own position.
+        for _ in range(runs):
+            queue = NodePriorityQueue()
+
+            for state, value, operation in zip(
+                rng.integers(0, 50, size = 100).tolist(), rng.random(100).tolist(), rng.random(100).tolist()
+            ):
+                if operation < 0.4:
+                    queue.discard(state)
+                elif operation < 0.5:
+                    if not queue.is_empty():
+                        queue.remove()
+                else:
+                    queue.add(Node(state, None, value, value))
+
+            heap  = queue.queue
+            valid = all(entry[4] == position for position, entry in enumerate(heap)) and \
+                all(not heap[position] < heap[(position - 1) >> 1] for position in range(1, len(heap))) and \
+                len(queue.entries) == len(heap)
+
+            invalid += not valid
+
+        print("{} runs, {} invalid heaps".format(runs, invalid))
+
+        if invalid == 0:
+            print(GeneralMessages.CORRECT)
+        else:
+            print(ERROR.substitute(msg = "Discarding nodes breaks the heap invariant."))
+        print("")
+
+
+    @staticmethod
+    def check_tree(operations = 100000, seed = 0):
+        print_title("Tree priority queue (random adds, value changes and removals)")
+
+        rng   = random.Random(seed)
+        nodes = [Node(index % 50, None, rng.randrange(20)) for index in range(500)]
+
+        for worst_first in [False, True]:
+            queue  = TreePriorityQueue(worst_first)
+            sign   = -1 if worst_first else 1
+            keys   = {}
+            popped = []
+            wanted = []
+
+            # Nodes, several of them sharing a state, are added with new values, discarded and popped at random, and
+            # checked against a plain dictionary of their keys.
+            for counter in range(operations):
+                node      = rng.choice(nodes)
+                operation = rng.random()
+
+                if operation < 0.6:
+                    node.value = rng.randrange(100)
+
+                    queue.add(node)
+
+                    keys[node] = (sign * node.value, -sign * node.path_cost, counter)
+                elif operation < 0.8:
+                    queue.discard(node)
+
+                    keys.pop(node, None)
+                elif keys:
+                    wanted.append(min(keys, key = keys.get))
+                    popped.append(queue.remove())
+
+                    del keys[popped[-1]]
+
+            consistent = all(entry[4] == position for position, entry in enumerate(queue.queue)) and \
+                not any(node.removed for node in nodes)
+
+            print("{} first: {} operations, {} pops, {} nodes left".format(
+                "Worst" if worst_first else "Best", operations, len(popped), len(queue)
+            ))
+
+            if (popped == wanted) and consistent and (len(queue) == len(keys)):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The tree priority queue does not pop the nodes in order."))
+        print("")
+
+
+    def check_sizes(self):
+        print_title("Indexed priority queue (heap size vs live size)")
+
+        for name, queue in [("Lazy", LazyPriorityQueue()), ("Indexed", NodePriorityQueue())]:
+            start_time = timer()
+            _, peak_heap, peak_live = run_operations(queue, self.operations)
+            total_time = timer() - start_time
+
+            print("{}: peak heap size {}, peak live size {}, {:.3f}s".format(name, peak_heap, peak_live, total_time))
+        print("")
+
+
+    @staticmethod
+    def check_searches(envs, repeats = 5):
+        print_title("Indexed priority queue (searches)")
+
+        searches = [("A*", lambda env, queue_type: astar_gs(env, manhattan, queue_type)), ("UCS", ucs_gs)]
+
+        # Nodes of equal value pop deepest first from the indexed queue, so A* follows a single path through the many
+        # ties of a grid instead of widening the frontier. Both queues must still find paths of the same length.
+        for name, env in envs:
+            for search_name, search in searches:
+                lengths = []
+
+                for queue_name, queue_type in [("lazy", LazyPriorityQueue), ("indexed", NodePriorityQueue)]:
+                    times = []
+
+                    for _ in range(repeats):
+                        start_time = timer()
+                        path, time_cost, space_cost = search(env, queue_type)
+                        times.append(timer() - start_time)
+
+                    lengths.append(len(path))
+
+                    print("{}, {} with the {} queue: {} nodes explored, {} in memory, {:.3f}s".format(
+                        name, search_name, queue_name, time_cost, space_cost, min(times)
+                    ))
+
+                if lengths[0] == lengths[1]:
+                    print(GeneralMessages.CORRECT)
+                else:
+                    print(ERROR.substitute(msg = "The indexed queue does not find a path as short as the lazy queue."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        operations = random_operations(200000, 2000)
+
+        results = CheckResult_PriorityQueue(operations)
+        results.check_order()
+        results.check_discard()
+        results.check_tree()
+        results.check_sizes()
+        results.check_searches([
+            ("Random walls 301x301", gym.make(RANDOM_MAZE, rows = 301, cols = 301, density = 0.2, seed = 0)),
+            ("Random walls 301x301", gym.make(RANDOM_MAZE, rows = 301, cols = 301, density = 0.3, seed = 1)),
+            ("Random walls 501x501", gym.make(RANDOM_MAZE, rows = 501, cols = 501, density = 0.1, seed = 2))
+        ])
@@ -0,0 +1,73 @@
+import gym
+
+from envs import *
+
+from inc.collections.transposition_table import TranspositionTable
+from inc.constants.output                import *
+from inc.utils.utils                     import *
+
+from src.search.uninformed.bfs import bfs_gs
+from src.search.uninformed.ids import ids_ts, ids_gs
+
+
+class CheckResult_TranspositionTable:
+
+    def __init__(self, envs):
+        self.envs = envs
+
+
+    @staticmethod
+    def check_search(name, env, search, capacities):
+        shortest, _, _ = bfs_gs(env)
+        plain          = search(env)
+
+        print("{} ({}): {} nodes explored without a table, solution length {}".format(
+            name, search.__name__, plain[1], len(plain[0])
+        ))
+
+        for capacity in capacities:
+            table    = TranspositionTable(capacity)
+            solution = search(env, table)
+
+            print("{} ({}): {} nodes explored with {} slots ({} used), solution length {}".format(
+                name, search.__name__, solution[1], capacity, len(table), len(solution[0])
+            ))
+
+            # A smaller table than the state space evicts entries, so it only prunes part of the re-expansions.
+            if capacity < env.observation_space.n:
+                continue
+
+            if (solution[1] <= plain[1]) and (len(solution[0]) == len(shortest)):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The transposition table does not reduce the search to a shortest path."))
+
+
+    def check_tree_search(self):
+        print_title("Transposition table (iterative deepening tree search)")
+
+        name, env = self.envs[0]
+
+        CheckResult_TranspositionTable.check_search(name, env, ids_ts, [65536])
+        print("")
+
+
+    def check_graph_search(self):
+        print_title("Transposition table (iterative deepening graph search)")
+
+        for name, env in self.envs:
+            CheckResult_TranspositionTable.check_search(name, env, ids_gs, [65536, 256])
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        envs = [
+            (SMALL_MAZE,           gym.make(SMALL_MAZE)),
+            ("Random walls 21x21", gym.make(RANDOM_MAZE, rows = 21, cols = 21, density = 0.2, seed = 2)),
+            ("Random walls 41x41", gym.make(RANDOM_MAZE, rows = 41, cols = 41, density = 0.25, seed = 3))
+        ]
+
+        results = CheckResult_TranspositionTable(envs)
+        results.check_tree_search()
+        results.check_graph_search()
@@ -5,7 +5,7 @@ from envs import *
 from inc.constants.output import *
 from inc.utils.utils      import *
 
-from src.search.uninformed.bfs import bfs_ts, bfs_gs
+from src.search.uninformed.bfs import bfs_ts, bfs_gs, bfs_vgs
 
 
 def print_solution_stats(env, sol):
@@ -24,10 +24,11 @@ def print_solution_stats(env, sol):
 
 class CheckResult_BFS:
 
-    def __init__(self, env, solution_ts, solution_gs):
-        self.env         = env
-        self.solution_ts = solution_ts
-        self.solution_gs = solution_gs
+    def __init__(self, env, solution_ts, solution_gs, solution_vgs):
+        self.env          = env
+        self.solution_ts  = solution_ts
+        self.solution_gs  = solution_gs
+        self.solution_vgs = solution_vgs
 
 
     @staticmethod
@@ -76,13 +77,26 @@ class CheckResult_BFS:
         )
 
 
+    def check_solution_vgs(self):
+        title      = "Breadth First Search (vectorized graph search)"
+        path_corr  = [(0, 1), (0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
+        time_corr  = 59
+        space_corr = 15
+
+        CheckResult_BFS.check_solution(
+            self.env, title, self.solution_vgs, (path_corr, time_corr, space_corr)
+        )
+
+
 class Main:
     if __name__ == "__main__":
         env = gym.make(SMALL_MAZE)
 
-        solution_ts = bfs_ts(env)
-        solution_gs = bfs_gs(env)
+        solution_ts  = bfs_ts(env)
+        solution_gs  = bfs_gs(env)
+        solution_vgs = bfs_vgs(env)
 
-        results = CheckResult_BFS(env, solution_ts, solution_gs)
+        results = CheckResult_BFS(env, solution_ts, solution_gs, solution_vgs)
         results.check_solution_ts()
         results.check_solution_gs()
+        results.check_solution_vgs()
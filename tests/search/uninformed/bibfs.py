@@ -0,0 +1,99 @@
+import gym
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.utils      import *
+
+from src.search.uninformed.bfs   import bfs_gs
+from src.search.uninformed.bibfs import bibfs_gs
+
+
+def print_solution_stats(env, sol):
+    path, time_cost, space_cost = sol
+
+    statistics = [
+        "Solution: {}".format(solution_to_string(env, path)),
+        "N° of nodes explored: {}".format(time_cost),
+        "Max n° of nodes in memory: {}".format(space_cost)
+    ]
+
+    for statistic in statistics:
+        print(statistic)
+    print("")
+
+
+class CheckResult_BiBFS:
+
+    def __init__(self, env, solution_gs):
+        self.env         = env
+        self.solution_gs = solution_gs
+
+
+    @staticmethod
+    def check_solution(env, title, solution, correct_values):
+        print_title(title)
+        print_solution_stats(env, solution)
+
+        path,      time_cost, space_cost = solution
+        path_corr, time_corr, space_corr = correct_values
+        path                             = solution_to_string(env, path)
+
+        checks = [
+            (path,       path_corr,  SearchMessages.NOT_CORRECT_SOLUTION),
+            (time_cost,  time_corr,  SearchMessages.NOT_CORRECT_TIME_COST),
+            (space_cost, space_corr, SearchMessages.NOT_CORRECT_SPACE_COST)
+        ]
+
+        for value, value_corr, message in checks:
+            if value != value_corr:
+                print(message.format(value_corr))
+                break
+        else:
+            print(GeneralMessages.CORRECT)
+        print("\n")
+
+
+    def check_solution_gs(self):
+        title      = "Bidirectional Breadth First Search (graph search)"
+        path_corr  = [(0, 1), (0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
+        time_corr  = 26
+        space_corr = 14
+
+        CheckResult_BiBFS.check_solution(
+            self.env, title, self.solution_gs, (path_corr, time_corr, space_corr)
+        )
+
+
+    @staticmethod
+    def check_savings(envs):
+        print_title("Bidirectional Breadth First Search (savings)")
+
+        for name, env in envs:
+            path,    time_cost,    space_cost    = bfs_gs(env)
+            bi_path, bi_time_cost, bi_space_cost = bibfs_gs(env)
+
+            print("{}: {} nodes explored and {} in memory forward, {} and {} bidirectional".format(
+                name, time_cost, space_cost, bi_time_cost, bi_space_cost
+            ))
+
+            if len(path) == len(bi_path):
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The bidirectional search does not find a shortest path."))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        env = gym.make(SMALL_MAZE)
+
+        solution_gs = bibfs_gs(env)
+
+        results = CheckResult_BiBFS(env, solution_gs)
+        results.check_solution_gs()
+
+        CheckResult_BiBFS.check_savings([
+            ("Cliff 40x120",         gym.make(SCALED_CLIFF, rows = 40, cols = 120)),
+            ("Random walls 201x201", gym.make(RANDOM_MAZE, rows = 201, cols = 201, density = 0.2, seed = 2))
+        ])
@@ -56,8 +56,8 @@ class CheckResult_UCS:
 
     def check_solution_ts(self):
         title      = "Uniform Cost Search (tree search)"
-        path_corr  = [(0, 1), (1, 1), (2, 1), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
-        time_corr  = 337
+        path_corr  = [(0, 1), (0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3)]
+        time_corr  = 357
         space_corr = 16
 
         CheckResult_UCS.check_solution(
@@ -0,0 +1,80 @@
+import gym
+
+from timeit import default_timer as timer
+
+from envs import *
+
+from inc.constants.output import *
+from inc.utils.utils      import *
+
+from src.search.uninformed.bfs import bfs_gs, bfs_vgs
+
+
+class CheckResult_VectorizedBFS:
+
+    def __init__(self, envs):
+        self.envs = envs
+
+
+    def check_searches(self):
+        print_title("Breadth First Search (vectorized graph search)")
+
+        for name, env in self.envs:
+            start_time = timer()
+            solution_gs = bfs_gs(env)
+            gs_time = timer() - start_time
+
+            start_time = timer()
+            solution_vgs = bfs_vgs(env)
+            vgs_time = timer() - start_time
+
+            print("{}: {} nodes in {:.3f}s with the queue, {:.3f}s with the frontier arrays ({:.1f}x)".format(
+                name, solution_gs[1], gs_time, vgs_time, gs_time / vgs_time
+            ))
+
+            if solution_gs == solution_vgs:
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The vectorized search does not match the graph search."))
+        print("")
+
+
+    @staticmethod
+    def check_thresholds(envs, thresholds):
+        print_title("Breadth First Search (scalar and array levels)")
+
+        for name, env in envs:
+            solution_gs = bfs_gs(env)
+            mismatches  = [
+                threshold for threshold in thresholds if bfs_vgs(env, threshold = threshold) != solution_gs
+            ]
+
+            print("{}: {} nodes, thresholds {}".format(name, solution_gs[1], thresholds))
+
+            if not mismatches:
+                print(GeneralMessages.CORRECT)
+            else:
+                print(ERROR.substitute(msg = "The search does not match the graph search with the thresholds {}.".format(
+                    mismatches
+                )))
+        print("")
+
+
+class Main:
+    if __name__ == "__main__":
+        envs = [
+            ("Random walls 1001x1001", gym.make(RANDOM_MAZE, rows = 1001, cols = 1001, density = 0.2, seed = 0)),
+            ("Perfect maze 1001x1001", gym.make(RANDOM_MAZE, rows = 1001, cols = 1001, seed = 0))
+        ]
+
+        results = CheckResult_VectorizedBFS(envs)
+        results.check_searches()
+
+        CheckResult_VectorizedBFS.check_thresholds([
+            ("Random walls 201x201 (density {})".format(density), gym.make(
+                RANDOM_MAZE, rows = 201, cols = 201, density = density, seed = seed
+            ))
+            for seed, density in enumerate([0.1, 0.2, 0.3, 0.4])
+        ] + [
+            ("Perfect maze 201x201", gym.make(RANDOM_MAZE, rows = 201, cols = 201, seed = 0))
+        ], [0, 8, 64, 1000000])